@@ -0,0 +1,313 @@
+"""Database snapshots as compressed JSON Lines.
+
+A snapshot is a directory holding one ``<collection>.jsonl.zst`` (or
+``.jsonl.gz`` when zstandard is not installed) file per collection and a
+``manifest.json`` with record counts and SHA-256 checksums. Collections are
+read from Firebase in key-ordered pages and written line by line, so memory
+use stays flat however large the roster grows.
+
+Incremental snapshots hold only the records whose ``updated_at`` is newer than
+the previous snapshot and name it as their ``base``; restoring one replays the
+whole chain. Deletions are not visible through ``updated_at``, so take a full
+snapshot now and then (for example weekly) to capture them.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+
+COLLECTIONS = ("users", "cadets", "events", "fundraisers", "jobs", "contacts", "uniforms", "cs_hours_ledger",
+               "cs_hours_totals", "fundraiser_transactions", "fundraiser_sales")
+
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+PAGE_SIZE = 1000
+RESTORE_CHUNK_SIZE = 500
+RESTORE_WORKERS = 4
+
+# Keys Firebase treats as integers when ordering by key
+INTEGER_KEY = re.compile(r"0|-?[1-9][0-9]*")
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def default_compression():
+    return "zstd" if _zstandard() else "gzip"
+
+
+EXTENSIONS = {"zstd": ".jsonl.zst", "gzip": ".jsonl.gz"}
+
+
+def _open_write(path, compression):
+    if compression == "zstd":
+        zstandard = _zstandard()
+        if zstandard is None:
+            raise RuntimeError("zstd compression requires zstandard (pip install zstandard)")
+        raw = zstandard.ZstdCompressor(level=10).stream_writer(open(path, "wb"))
+        return io.TextIOWrapper(raw, encoding="utf-8")
+    return gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+
+
+def _open_read(path, compression):
+    if compression == "zstd":
+        zstandard = _zstandard()
+        if zstandard is None:
+            raise RuntimeError("Reading zstd snapshots requires zstandard (pip install zstandard)")
+        raw = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"))
+        return io.TextIOWrapper(raw, encoding="utf-8")
+    return gzip.open(path, "rt", encoding="utf-8")
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _as_dict(value):
+    if isinstance(value, list):
+        return {str(i): item for i, item in enumerate(value) if item is not None}
+    return dict(value) if isinstance(value, dict) else {}
+
+
+def firebase_key_order(key):
+    """Sort key matching Firebase's ``orderByKey``: 32-bit integer keys by value, then strings."""
+    key = str(key)
+    if INTEGER_KEY.fullmatch(key):
+        value = int(key)
+        if -2 ** 31 <= value < 2 ** 31:
+            return 0, value, ""
+    return 1, 0, key
+
+
+def iter_records(firebase, collection, since=None, page_size=PAGE_SIZE):
+    """Yield ``(record_id, record)`` for ``collection``, page by page in key order.
+
+    With ``since`` only records whose ``updated_at`` is later are yielded. The
+    server-side ``updated_at`` query needs an ``.indexOn`` rule; without one
+    the pages are filtered here instead.
+    """
+    def changed(record):
+        return since is None or (isinstance(record, dict) and str(record.get("updated_at", "")) > since)
+
+    if since is not None:
+        try:
+            records = _as_dict(firebase.query(collection, order_by="updated_at", start_at=since))
+        except Exception as e:
+            print(f"Scanning {collection} for changes since {since}: {e}")
+        else:
+            for record_id, record in records.items():
+                if changed(record):
+                    yield record_id, record
+            return
+
+    last_key = None
+    while True:
+        # start_at is inclusive, so every page after the first re-reads the previous last key
+        limit = page_size if last_key is None else page_size + 1
+        page = _as_dict(firebase.query(collection, start_at=last_key, limit=limit))
+        page.pop(last_key, None)
+        if not page:
+            return
+
+        for record_id, record in page.items():
+            if changed(record):
+                yield record_id, record
+        last_key = max(page, key=firebase_key_order)
+        if len(page) < page_size:
+            return
+
+
+def list_snapshots(root):
+    """Snapshot directories under ``root``, oldest first."""
+    if not os.path.isdir(root):
+        return []
+    names = sorted(
+        name for name in os.listdir(root)
+        if os.path.isfile(os.path.join(root, name, MANIFEST))
+    )
+    return [os.path.join(root, name) for name in names]
+
+
+def read_manifest(path):
+    with open(os.path.join(path, MANIFEST), encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != FORMAT_VERSION:
+        raise SnapshotError(f"{path}: unsupported snapshot format {manifest.get('format')}")
+    return manifest
+
+
+def create_snapshot(firebase, root, collections=COLLECTIONS, incremental=False, compression=None, progress=None):
+    """Write a snapshot under ``root`` and return its directory.
+
+    An incremental snapshot falls back to a full one when ``root`` holds no
+    earlier snapshot. ``progress(collection, records_written)`` is called as
+    records stream out.
+    """
+    compression = compression or default_compression()
+    started_at = datetime.now().isoformat()
+    base = None
+    since = None
+    if incremental:
+        previous = list_snapshots(root)
+        if previous:
+            base = previous[-1]
+            since = read_manifest(base)["started_at"]
+
+    name = datetime.now().strftime("%Y%m%d-%H%M%S") + ("-incr" if base else "")
+    path = os.path.join(root, name)
+    partial = path + ".partial"
+    os.makedirs(partial)
+
+    manifest = {
+        "format": FORMAT_VERSION,
+        "kind": "incremental" if base else "full",
+        "started_at": started_at,
+        "since": since,
+        "base": os.path.basename(base) if base else None,
+        "compression": compression,
+        "collections": {}
+    }
+
+    try:
+        for collection in collections:
+            filename = collection + EXTENSIONS[compression]
+            count = 0
+            with _open_write(os.path.join(partial, filename), compression) as out:
+                for record_id, record in iter_records(firebase, collection, since):
+                    out.write(json.dumps({"id": record_id, "data": record}, separators=(",", ":"), default=str))
+                    out.write("\n")
+                    count += 1
+                    if progress and count % PAGE_SIZE == 0:
+                        progress(collection, count)
+            if progress:
+                progress(collection, count)
+
+            manifest["collections"][collection] = {
+                "file": filename,
+                "records": count,
+                "bytes": os.path.getsize(os.path.join(partial, filename)),
+                "sha256": file_sha256(os.path.join(partial, filename))
+            }
+
+        manifest["finished_at"] = datetime.now().isoformat()
+        with open(os.path.join(partial, MANIFEST), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        # Only complete snapshots get their final name, so a crashed run is never used as a base
+        os.replace(partial, path)
+    except BaseException:
+        for filename in os.listdir(partial):
+            os.remove(os.path.join(partial, filename))
+        os.rmdir(partial)
+        raise
+
+    return path
+
+
+def snapshot_chain(path):
+    """The full snapshot ``path`` builds on followed by each incremental up to ``path``."""
+    chain = []
+    seen = set()
+    while path:
+        if path in seen:
+            raise SnapshotError(f"{path}: snapshot chain loops")
+        seen.add(path)
+        manifest = read_manifest(path)
+        chain.append((path, manifest))
+        path = os.path.join(os.path.dirname(path), manifest["base"]) if manifest.get("base") else None
+    return list(reversed(chain))
+
+
+def verify_snapshot(path):
+    """Check every file in the chain against its manifest checksum."""
+    for snapshot, manifest in snapshot_chain(path):
+        for collection, entry in manifest["collections"].items():
+            file_path = os.path.join(snapshot, entry["file"])
+            if not os.path.isfile(file_path):
+                raise SnapshotError(f"{file_path} is missing")
+            if file_sha256(file_path) != entry["sha256"]:
+                raise SnapshotError(f"{file_path} does not match its checksum")
+
+
+def read_records(path, manifest, collection):
+    entry = manifest["collections"][collection]
+    with _open_read(os.path.join(path, entry["file"]), manifest["compression"]) as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                yield item["id"], item["data"]
+
+
+def restore_snapshot(firebase, path, collections=None, replace=False, workers=RESTORE_WORKERS,
+                     chunk_size=RESTORE_CHUNK_SIZE, progress=None):
+    """Restore the snapshot at ``path`` (replaying its chain) and return records written per collection.
+
+    Records are written as multi-path updates of ``chunk_size`` records spread
+    over ``workers`` threads. With ``replace`` each collection is deleted first,
+    so records created after the snapshot are removed as well.
+    """
+    verify_snapshot(path)
+    chain = snapshot_chain(path)
+    collections = list(collections or chain[-1][1]["collections"])
+
+    local = threading.local()
+    written = {collection: 0 for collection in collections}
+    lock = threading.Lock()
+
+    def write(collection, chunk):
+        if not hasattr(local, "db"):
+            local.db = firebase.new_database()
+        firebase.update_data(collection, chunk, db=local.db)
+        with lock:
+            written[collection] += len(chunk)
+            done = written[collection]
+        if progress:
+            progress(collection, done)
+
+    if replace:
+        for collection in collections:
+            firebase.delete_data(collection)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for snapshot, manifest in chain:
+            pending = set()
+            for collection in collections:
+                if collection not in manifest["collections"]:
+                    continue
+                chunk = {}
+                for record_id, record in read_records(snapshot, manifest, collection):
+                    chunk[record_id] = record
+                    if len(chunk) >= chunk_size:
+                        pending.add(executor.submit(write, collection, chunk))
+                        chunk = {}
+                        # Bound the chunks held in memory while workers catch up
+                        while len(pending) >= workers * 2:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                future.result()
+                if chunk:
+                    pending.add(executor.submit(write, collection, chunk))
+
+            # Later snapshots in the chain must land after earlier ones
+            for future in pending:
+                future.result()
+
+    return written
@@ -0,0 +1,169 @@
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from functools import total_ordering
+
+from reports import cs_hours, hours_status
+
+SORT_FIELDS = ("name", "grade", "flight", "cs_hours")
+
+
+@total_ordering
+class _Descending:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+def _field(cadet, *names, default=""):
+    for name in names:
+        value = cadet.get(name)
+        if value not in (None, ""):
+            return value
+    return default
+
+
+def sort_keys(cadet):
+    """Compute the per-field sort keys for one cadet record."""
+    last_name = str(_field(cadet, "last_name", "Last Name")).lower()
+    first_name = str(_field(cadet, "first_name", "First Name")).lower()
+
+    grade = str(_field(cadet, "grade", "Grade")).strip()
+    try:
+        grade_key = (0, int(grade), "")
+    except ValueError:
+        grade_key = (1, 0, grade.lower())
+
+    hours = cs_hours(cadet)
+
+    return {
+        "name": (last_name, first_name),
+        "grade": grade_key,
+        "flight": str(_field(cadet, "flight", "Flight")).lower(),
+        "cs_hours": hours,
+        # Not sort columns; kept here so search and the hours colors are computed once per change.
+        "search": f"{first_name} {last_name}",
+        "status": hours_status(hours)
+    }
+
+
+class CadetIndex:
+    """Keeps cadet ids in sorted order for each active sort spec.
+
+    Sort keys are computed once when a record arrives; changes are applied with
+    bisect removals and inserts, so re-renders and switching back to a recent
+    sort never re-sort the roster. Total hours and the number of cadets in each
+    hours status are kept up to date the same way.
+    """
+
+    def __init__(self, max_orders=4):
+        self.max_orders = max_orders
+        self._source = None
+        self._keys = {}
+        self._orders = OrderedDict()
+        self.total_hours = 0.0
+        self.status_counts = {"red": 0, "yellow": 0, "green": 0}
+
+    def sync(self, cadets):
+        """Rebuild if ``cadets`` is a different collection object than the one indexed."""
+        if isinstance(cadets, list):
+            cadets = {str(i): item for i, item in enumerate(cadets) if item is not None}
+        if cadets is not self._source:
+            self.rebuild(cadets)
+        return self._source
+
+    def rebuild(self, cadets):
+        self._source = cadets if isinstance(cadets, dict) else {}
+        self._keys = {
+            cadet_id: sort_keys(cadet)
+            for cadet_id, cadet in self._source.items()
+            if isinstance(cadet, dict)
+        }
+        self._orders.clear()
+        self.total_hours = sum(keys["cs_hours"] for keys in self._keys.values())
+        self.status_counts = {"red": 0, "yellow": 0, "green": 0}
+        for keys in self._keys.values():
+            self.status_counts[keys["status"]] += 1
+
+    def refresh(self, cadets, cadet_ids=None):
+        """Re-index the given ids after an in-place change, or everything if ``cadet_ids`` is None."""
+        if cadet_ids is None or cadets is not self._source:
+            self.rebuild(cadets)
+            return
+
+        for cadet_id in cadet_ids:
+            cadet = self._source.get(cadet_id)
+            if isinstance(cadet, dict):
+                self.upsert(cadet_id, cadet)
+            else:
+                self.remove(cadet_id)
+
+    def upsert(self, cadet_id, cadet):
+        keys = sort_keys(cadet)
+        old = self._keys.get(cadet_id)
+        if old == keys:
+            return
+
+        for spec, entries in self._orders.items():
+            if old is not None:
+                self._discard(entries, self._composite(spec, old, cadet_id))
+            insort(entries, self._composite(spec, keys, cadet_id))
+        self._keys[cadet_id] = keys
+        self._count(old, -1)
+        self._count(keys, 1)
+
+    def remove(self, cadet_id):
+        old = self._keys.pop(cadet_id, None)
+        if old is None:
+            return
+        for spec, entries in self._orders.items():
+            self._discard(entries, self._composite(spec, old, cadet_id))
+        self._count(old, -1)
+
+    def ordered(self, spec=(("name", False),)):
+        """Return ``[(cadet_id, cadet), ...]`` ordered by ``spec``, a sequence of (field, descending)."""
+        spec = tuple((field, bool(descending)) for field, descending in spec)
+        entries = self._orders.get(spec)
+        if entries is None:
+            entries = sorted(self._composite(spec, keys, cadet_id) for cadet_id, keys in self._keys.items())
+            self._orders[spec] = entries
+            while len(self._orders) > self.max_orders:
+                self._orders.popitem(last=False)
+        else:
+            self._orders.move_to_end(spec)
+
+        return [(entry[-1], self._source[entry[-1]]) for entry in entries]
+
+    def search_text(self, cadet_id):
+        keys = self._keys.get(cadet_id)
+        return keys["search"] if keys else ""
+
+    def hours(self, cadet_id):
+        """``(hours, status)`` for a cadet, as materialized when its record last changed."""
+        keys = self._keys.get(cadet_id)
+        return (keys["cs_hours"], keys["status"]) if keys else (0.0, hours_status(0.0))
+
+    def _count(self, keys, sign):
+        if keys is not None:
+            self.total_hours += sign * keys["cs_hours"]
+            self.status_counts[keys["status"]] += sign
+
+    @staticmethod
+    def _composite(spec, keys, cadet_id):
+        parts = [_Descending(keys[field]) if descending else keys[field] for field, descending in spec]
+        if not any(field == "name" for field, _ in spec):
+            parts.append(keys["name"])
+        parts.append(cadet_id)
+        return tuple(parts)
+
+    @staticmethod
+    def _discard(entries, entry):
+        index = bisect_left(entries, entry)
+        if index < len(entries) and entries[index] == entry:
+            del entries[index]
@@ -0,0 +1,250 @@
+"""Headless command-line entry point for scheduled jobs.
+
+Reuses FirebaseManager and the report builders without importing Tk:
+
+    python cli.py import-roster cadets.csv
+    python cli.py export cadets -f csv -o cadets.csv
+    python cli.py report "Cadet Roster" -o roster.pdf
+    python cli.py hours --status red
+    python cli.py backup --incremental
+
+Sign-in uses AMS_EMAIL / AMS_PASSWORD when set, otherwise the session saved
+by the desktop app.
+"""
+
+import argparse
+import contextlib
+import csv
+import getpass
+import json
+import os
+import sys
+
+from backup import COLLECTIONS, RESTORE_WORKERS, create_snapshot, list_snapshots, read_manifest, restore_snapshot
+from reports import REPORTS, REQUIRED_CS_HOURS, community_service_rows
+from report_export import export_report
+from roster_import import FIELDS, IMPORT_BATCH_SIZE, apply_import, plan_import, read_headers, suggest_mapping
+
+
+def connect(args):
+    # FirebaseManager logs to stdout; keep stdout clean for command output.
+    with contextlib.redirect_stdout(sys.stderr):
+        from firebase_config import FirebaseManager
+
+        firebase = FirebaseManager()
+        email = args.email or os.getenv("AMS_EMAIL")
+        if email:
+            password = os.getenv("AMS_PASSWORD") or getpass.getpass(f"Password for {email}: ")
+            firebase.sign_in_with_email_password(email, password)
+        elif not firebase.restore_session():
+            raise SystemExit("Not signed in: set AMS_EMAIL/AMS_PASSWORD or sign in once in the desktop app")
+    return firebase
+
+
+def load_collections(firebase, collections):
+    return {collection: firebase.get_data(collection) or {} for collection in collections}
+
+
+def _parse_mapping(args):
+    mapping = {}
+    for item in args.map or ():
+        header, sep, field = item.partition("=")
+        if not sep or (field and field not in FIELDS):
+            raise ValueError(f"Invalid mapping '{item}': expected HEADER=FIELD with FIELD one of {', '.join(FIELDS)}")
+        mapping[header] = field or None
+    return mapping
+
+
+def cmd_import_roster(args):
+    mapping = suggest_mapping(read_headers(args.file))
+    mapping.update(_parse_mapping(args))
+    for header, field in mapping.items():
+        print(f"  {header} -> {field or '(ignored)'}", file=sys.stderr)
+
+    firebase = connect(args)
+    existing = firebase.get_data("cadets") or {}
+    plan = plan_import(args.file, existing, mapping, update_existing=args.update_existing)
+
+    for row_number, issue in plan.issues():
+        print(f"row {row_number}: {issue}")
+    print(plan.summary(), file=sys.stderr)
+
+    if args.dry_run:
+        print("Dry run: nothing written", file=sys.stderr)
+        return 0
+
+    written = apply_import(firebase, plan, chunk_size=args.batch_size)
+    print(f"Imported {written} cadets", file=sys.stderr)
+    return 0
+
+
+def cmd_export(args):
+    firebase = connect(args)
+    records = firebase.get_data(args.collection) or {}
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+
+    try:
+        if args.format == "json":
+            json.dump(records, out, indent=2, default=str)
+            out.write("\n")
+        elif args.format == "jsonl":
+            for record_id, record in records.items():
+                out.write(json.dumps({"id": record_id, **record} if isinstance(record, dict) else {"id": record_id, "value": record}, default=str))
+                out.write("\n")
+        else:
+            columns = ["id"] + sorted({key for record in records.values() if isinstance(record, dict) for key in record})
+            writer = csv.DictWriter(out, fieldnames=columns, extrasaction="ignore")
+            writer.writeheader()
+            for record_id, record in records.items():
+                if isinstance(record, dict):
+                    writer.writerow({"id": record_id, **{k: v if not isinstance(v, (dict, list)) else json.dumps(v) for k, v in record.items()}})
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def cmd_report(args):
+    if args.name not in REPORTS:
+        print(f"Unknown report '{args.name}'. Available: {', '.join(REPORTS)}", file=sys.stderr)
+        return 2
+
+    firebase = connect(args)
+    builder, collections = REPORTS[args.name]
+    data = load_collections(firebase, collections)
+
+    if args.output:
+        export_report(args.name, data, args.output)
+        print(f"Wrote {args.output}", file=sys.stderr)
+    else:
+        for line in builder(data):
+            sys.stdout.write(line)
+    return 0
+
+
+def cmd_hours(args):
+    firebase = connect(args)
+    data = load_collections(firebase, ("cadets",))
+
+    rows = [row for row in community_service_rows(data) if not args.status or row[5] in args.status]
+    if args.flight:
+        rows = [row for row in rows if str(row[2]) == args.flight]
+
+    if args.format == "csv":
+        writer = csv.writer(sys.stdout)
+        writer.writerow(("last_name", "first_name", "flight", "hours", "needed", "status"))
+        writer.writerows(rows)
+    else:
+        for last_name, first_name, flight, hours, needed, status in rows:
+            print(f"{f'{last_name}, {first_name}':<32}{str(flight):<10}{hours:>8}{needed:>8}  {status.upper()}")
+        print(f"{len(rows)} cadets (requirement {REQUIRED_CS_HOURS} hours)", file=sys.stderr)
+    return 0
+
+
+def cmd_backup(args):
+    firebase = connect(args)
+
+    def progress(collection, count):
+        print(f"  {collection}: {count}", file=sys.stderr)
+
+    path = create_snapshot(
+        firebase,
+        args.dir,
+        collections=args.collection or COLLECTIONS,
+        incremental=args.incremental,
+        compression="gzip" if args.gzip else None,
+        progress=progress
+    )
+    manifest = read_manifest(path)
+    records = sum(entry["records"] for entry in manifest["collections"].values())
+    print(path)
+    print(f"{manifest['kind'].capitalize()} snapshot: {records} records", file=sys.stderr)
+    return 0
+
+
+def cmd_restore(args):
+    path = args.snapshot
+    if not os.path.isfile(os.path.join(path, "manifest.json")):
+        snapshots = list_snapshots(path)
+        if not snapshots:
+            print(f"No snapshot found at {path}", file=sys.stderr)
+            return 2
+        path = snapshots[-1]
+
+    if not args.yes:
+        action = "replace" if args.replace else "overwrite matching records in"
+        answer = input(f"Restore {path} and {action} the live database? [y/N] ")
+        if answer.strip().lower() != "y":
+            return 1
+
+    firebase = connect(args)
+    written = restore_snapshot(firebase, path, collections=args.collection, replace=args.replace, workers=args.workers)
+    for collection, count in written.items():
+        print(f"  {collection}: {count}", file=sys.stderr)
+    print(f"Restored {sum(written.values())} records from {path}", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="ams", description="AFJROTC Management System command line")
+    parser.add_argument("--email", help="sign in as this user (password from AMS_PASSWORD or prompt)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_roster = commands.add_parser("import-roster", help="bulk import cadets from a CSV or XLSX file")
+    import_roster.add_argument("file")
+    import_roster.add_argument("--map", action="append", metavar="HEADER=FIELD",
+                               help="map a column to a cadet field (empty FIELD ignores it); repeatable")
+    import_roster.add_argument("--dry-run", action="store_true", help="validate and preview without writing")
+    import_roster.add_argument("--update-existing", action="store_true",
+                               help="merge rows that match an existing cadet instead of skipping them")
+    import_roster.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    import_roster.set_defaults(func=cmd_import_roster)
+
+    export = commands.add_parser("export", help="export a collection")
+    export.add_argument("collection")
+    export.add_argument("-f", "--format", choices=("json", "jsonl", "csv"), default="json")
+    export.add_argument("-o", "--output", help="output file (default: stdout)")
+    export.set_defaults(func=cmd_export)
+
+    report = commands.add_parser("report", help="generate a report")
+    report.add_argument("name", help=f"one of: {', '.join(REPORTS)}")
+    report.add_argument("-o", "--output", help="write .csv, .xlsx, .pdf or .txt instead of printing")
+    report.set_defaults(func=cmd_report)
+
+    hours = commands.add_parser("hours", help="community service hours summary")
+    hours.add_argument("--flight")
+    hours.add_argument("--status", action="append", choices=("red", "yellow", "green"))
+    hours.add_argument("-f", "--format", choices=("text", "csv"), default="text")
+    hours.set_defaults(func=cmd_hours)
+
+    backup = commands.add_parser("backup", help="write a compressed snapshot of the database")
+    backup.add_argument("--dir", default="backups", help="snapshot directory (default: backups)")
+    backup.add_argument("--incremental", action="store_true", help="only records updated since the last snapshot")
+    backup.add_argument("--collection", action="append", help="limit to this collection; repeatable")
+    backup.add_argument("--gzip", action="store_true", help="use gzip even when zstandard is installed")
+    backup.set_defaults(func=cmd_backup)
+
+    restore = commands.add_parser("restore", help="restore a snapshot (or the latest one in a directory)")
+    restore.add_argument("snapshot")
+    restore.add_argument("--collection", action="append", help="limit to this collection; repeatable")
+    restore.add_argument("--replace", action="store_true", help="delete each collection before restoring it")
+    restore.add_argument("--workers", type=int, default=RESTORE_WORKERS)
+    restore.add_argument("-y", "--yes", action="store_true", help="do not ask for confirmation")
+    restore.set_defaults(func=cmd_restore)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
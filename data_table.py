@@ -0,0 +1,175 @@
+import tkinter as tk
+from tkinter import ttk
+
+import customtkinter as ctk
+
+
+class DataTable(ctk.CTkFrame):
+    """A styled single-widget table on ``ttk.Treeview``.
+
+    ``columns`` is a list of ``(key, heading, width)`` or ``(key, heading, width, anchor)``.
+    Rows are ``(row_id, values, tags)`` and keep ``row_id`` as the item id, so
+    re-rendering updates existing items instead of rebuilding widgets. Row
+    actions are offered through a context menu, ``on_activate`` runs on
+    double-click or Enter and ``on_select`` receives the selected ids.
+    """
+
+    STYLE = "DataTable.Treeview"
+
+    def __init__(self, master, columns, actions=None, on_activate=None, on_select=None,
+                 empty_text="No records found.", header_color="#2563eb", stripe_color="#f8fafc",
+                 font=("Arial", 12), row_height=28, selectmode="extended", tag_colors=None, **kwargs):
+        kwargs.setdefault("fg_color", "transparent")
+        super().__init__(master, **kwargs)
+
+        self.columns = [self._column(spec) for spec in columns]
+        self.actions = list(actions or [])
+        self.on_activate = on_activate
+        self.on_select = on_select
+        self._configure_style(header_color, font, row_height)
+
+        self.tree = ttk.Treeview(
+            self,
+            columns=[key for key, _, _, _ in self.columns],
+            show="headings",
+            selectmode=selectmode,
+            style=self.STYLE
+        )
+        for key, heading, width, anchor in self.columns:
+            self.tree.heading(key, text=heading, anchor=anchor)
+            self.tree.column(key, width=width, minwidth=40, anchor=anchor, stretch=True)
+
+        self.tree.tag_configure("stripe", background=stripe_color)
+        for tag, color in (tag_colors or {}).items():
+            self.tree.tag_configure(tag, foreground=color)
+
+        scrollbar = ctk.CTkScrollbar(self, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        self.empty_text = empty_text
+        self.empty_label = ctk.CTkLabel(self, text=empty_text, text_color="#666666", font=("Arial", 14))
+
+        self.menu = tk.Menu(self.tree, tearoff=0)
+        for label, callback in self.actions:
+            if label is None:
+                self.menu.add_separator()
+            else:
+                self.menu.add_command(label=label, command=lambda cb=callback: self._run_action(cb))
+
+        self.tree.bind("<Double-1>", self._on_double_click)
+        self.tree.bind("<Return>", lambda e: self._activate(self.tree.focus()))
+        if on_select:
+            self.tree.bind("<<TreeviewSelect>>", lambda e: self.on_select(self.selected_ids()))
+        menu_buttons = ("<Button-2>", "<Control-Button-1>") if self.tk.call("tk", "windowingsystem") == "aqua" else ("<Button-3>",)
+        for sequence in menu_buttons:
+            self.tree.bind(sequence, self._show_menu)
+
+    def set_rows(self, rows, empty_text=None):
+        """Show ``rows`` in order, reusing items that are already present by id.
+
+        ``empty_text`` replaces the usual empty message for this render, e.g. while loading.
+        """
+        tree = self.tree
+        existing = set(tree.get_children(""))
+        wanted = []
+        inserts = []
+
+        for position, (row_id, values, tags) in enumerate(rows):
+            row_id = str(row_id)
+            values = tuple("" if value is None else value for value in values)
+            tags = tuple(tags or ()) + (("stripe",) if position % 2 else ())
+            wanted.append(row_id)
+
+            if row_id in existing:
+                item = tree.item(row_id)
+                if tuple(str(v) for v in item["values"]) != tuple(str(v) for v in values) or tuple(item["tags"] or ()) != tags:
+                    tree.item(row_id, values=values, tags=tags)
+            else:
+                inserts.append((row_id, values, tags))
+
+        stale = existing.difference(wanted)
+        if stale:
+            tree.delete(*stale)
+
+        # Tk defers redraws to idle time, so a tight insert loop repaints once.
+        for row_id, values, tags in inserts:
+            tree.insert("", "end", iid=row_id, values=values, tags=tags)
+
+        if list(tree.get_children("")) != wanted:
+            for index, row_id in enumerate(wanted):
+                tree.move(row_id, "", index)
+
+        if wanted:
+            self.empty_label.place_forget()
+        else:
+            self.empty_label.configure(text=empty_text or self.empty_text)
+            self.empty_label.place(relx=0.5, rely=0.3, anchor="center")
+
+    def selected_ids(self):
+        return list(self.tree.selection())
+
+    def focused_id(self):
+        return self.tree.focus() or None
+
+    def select(self, row_ids):
+        row_ids = [row_id for row_id in map(str, row_ids) if self.tree.exists(row_id)]
+        self.tree.selection_set(row_ids)
+        if row_ids:
+            self.tree.focus(row_ids[0])
+            self.tree.see(row_ids[0])
+
+    def _run_action(self, callback):
+        row_id = self.focused_id()
+        if row_id is not None:
+            callback(row_id)
+
+    def _activate(self, row_id):
+        if row_id and self.on_activate:
+            self.on_activate(row_id)
+
+    def _on_double_click(self, event):
+        if self.tree.identify_region(event.x, event.y) == "cell":
+            self._activate(self.tree.identify_row(event.y))
+
+    def _show_menu(self, event):
+        row_id = self.tree.identify_row(event.y)
+        if not row_id or not self.actions:
+            return
+        if row_id not in self.tree.selection():
+            self.tree.selection_set(row_id)
+        self.tree.focus(row_id)
+        try:
+            self.menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self.menu.grab_release()
+
+    def _configure_style(self, header_color, font, row_height):
+        style = ttk.Style(self)
+        style.configure(
+            self.STYLE,
+            background="#ffffff",
+            fieldbackground="#ffffff",
+            foreground="#333333",
+            rowheight=row_height,
+            font=font,
+            borderwidth=0
+        )
+        style.configure(
+            f"{self.STYLE}.Heading",
+            background=header_color,
+            foreground="#ffffff",
+            font=(font[0], font[1], "bold"),
+            relief="flat",
+            padding=(6, 6)
+        )
+        style.map(f"{self.STYLE}.Heading", background=[("active", header_color)])
+        style.map(self.STYLE, background=[("selected", "#dbeafe")], foreground=[("selected", "#1e293b")])
+        style.layout(self.STYLE, [("Treeview.treearea", {"sticky": "nswe"})])
+
+    @staticmethod
+    def _column(spec):
+        key, heading, width = spec[:3]
+        anchor = spec[3] if len(spec) > 3 else "w"
+        return key, heading, width, anchor
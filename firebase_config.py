@@ -1,7 +1,13 @@
+import json
 import os
 import pyrebase
+import requests
 from dotenv import load_dotenv
 
+from resilience import ResilientCaller, CircuitOpenError, is_transient
+from session import TokenManager, AuthorizedDatabase
+from storage_transfer import TransferManager
+
 # Load environment variables
 load_dotenv()
 
@@ -34,9 +40,18 @@ class FirebaseManager:
                 
                 # Get references to services
                 self.auth = self.firebase.auth()
-                self.db = self.firebase.database()
                 self.storage = self.firebase.storage()
                 
+                # Every database request and stream picks up the current ID token
+                self.tokens = TokenManager(self)
+                self.db = AuthorizedDatabase(self.firebase.database(), self.tokens.current_token)
+                
+                # Retry budgets and circuit breaker shared by all calls below
+                self.resilience = ResilientCaller()
+                self._read_cache = {}
+                
+                self.transfers = TransferManager(self)
+                
                 self.initialized = True
                 print("Firebase client SDK initialized successfully")
                 
@@ -67,6 +82,18 @@ class FirebaseManager:
             # Store the refresh token for session management
             user_data['refresh_token'] = user.get('refreshToken', '')
             
+            self.tokens.start(
+                user['idToken'],
+                user_data['refresh_token'],
+                user.get('expiresIn', 3600),
+                user_data['uid'],
+                profile={
+                    'email': user_data['email'],
+                    'display_name': user_data['display_name'],
+                    'photo_url': user_data['photo_url']
+                }
+            )
+            
             return user_data
             
         except Exception as e:
@@ -109,7 +136,7 @@ class FirebaseManager:
             })
             
             # Store additional user data in the database
-            self.db.child("users").child(user['localId']).set(user_data)
+            self.set_data(f"users/{user['localId']}", user_data)
             
             # Format the return value consistently with sign_in_with_email_password
             result = {
@@ -185,60 +212,234 @@ class FirebaseManager:
         except Exception as e:
             error_msg = str(e)
             if 'TOKEN_EXPIRED' in error_msg or 'INVALID_REFRESH_TOKEN' in error_msg:
-                raise ValueError("Invalid or expired refresh token")
+                raise ValueError("Invalid or expired refresh token") from e
             else:
-                raise Exception(f"Error refreshing token: {error_msg}")
+                # Chained so callers can tell a rejected token from a network failure
+                raise Exception(f"Error refreshing token: {error_msg}") from e
+    
+    def restore_session(self):
+        """Refresh the persisted session. Returns the user, or None if it is no longer valid."""
+        try:
+            return self.tokens.restore()
+        except Exception as e:
+            print(f"Error restoring session: {e}")
+            raise
+    
+    def sign_out(self):
+        self.tokens.clear()
+        self.auth.current_user = None
+    
+    def _call(self, operation, func, idempotent=True):
+        return self.resilience.call(operation, func, idempotent=idempotent)
+    
+    def _ref(self, path, db=None):
+        """``path`` on ``db``, or on a fresh handle so concurrent callers never share pyrebase's path state."""
+        return (db or self.new_database()).child(path)
+    
+    def _read(self, path):
+        """Read through the resilience layer, serving the last good value while the circuit is open."""
+        try:
+            value = self._call("read", lambda: self._ref(path).get().val())
+        except Exception as e:
+            if path in self._read_cache and (isinstance(e, CircuitOpenError) or is_transient(e)):
+                print(f"Serving cached data for {path}: {e}")
+                return self._read_cache[path]
+            raise
+        
+        self._read_cache[path] = value
+        return value
     
     def get_data(self, path):
         try:
-            return self.db.child(path).get().val()
+            return self._read(path)
         except Exception as e:
             print(f"Error getting data: {e}")
             raise
     
     def set_data(self, path, data):
         try:
-            self.db.child(path).set(data)
+            self._call("write", lambda: self._ref(path).set(data))
             return True
         except Exception as e:
             print(f"Error setting data: {e}")
             raise
     
-    def update_data(self, path, updates):
+    def push_data(self, path, data):
+        """Append ``data`` under a server-generated key and return ``{'name': key}``.
+
+        Not retried: a push whose response was lost may already have been
+        written, and repeating it would add the record twice.
+        """
+        try:
+            return self._call("write", lambda: self._ref(path).push(data), idempotent=False)
+        except Exception as e:
+            print(f"Error pushing data to {path}: {e}")
+            raise
+    
+    def new_database(self):
+        """A separate authorized database handle for a worker thread.
+
+        pyrebase keeps the request path on the handle between ``child()`` and
+        the request, so threads writing concurrently must not share one.
+        """
+        return AuthorizedDatabase(self.firebase.database(), self.tokens.current_token)
+
+    def _rest(self, method, path, params=None, **kwargs):
+        """A raw REST request for what pyrebase does not expose (conditional writes, shallow reads)."""
+        url = f"{self.config['databaseURL'].rstrip('/')}/{path.strip('/')}.json"
+        params = dict(params or {})
+        token = self.tokens.current_token()
+        if token:
+            params["auth"] = token
+        return requests.request(method, url, params=params, timeout=30, **kwargs)
+
+    def count(self, path):
+        """Number of children under ``path``, read with ``shallow`` so only the keys are downloaded."""
+        def run():
+            response = self._rest("GET", path, params={"shallow": "true"})
+            response.raise_for_status()
+            return len(response.json() or {})
+
+        try:
+            return self._call("read", run)
+        except Exception as e:
+            print(f"Error counting {path}: {e}")
+            raise
+
+    def transaction(self, path, update, attempts=5):
+        """Atomically replace the value at ``path`` with ``update(current)``.
+
+        Uses the REST API's conditional requests: the value is read with its
+        ETag and written with ``if-match``, so if another client changed it in
+        between the write is refused (412) and ``update`` runs again on the
+        fresh value. Returning ``current`` itself writes nothing. Returns the
+        value left at ``path``.
+        """
+        def send(method, headers, data=None):
+            response = self._rest(method, path, headers=headers, data=data)
+            if response.status_code != 412:
+                response.raise_for_status()
+            return response
+
+        try:
+            response = self._call("read", lambda: send("GET", {"X-Firebase-ETag": "true"}))
+            for _ in range(attempts):
+                current = response.json()
+                value = update(current)
+                if value is current:
+                    return current
+                etag = response.headers["ETag"]
+                # A conditional write is safe to retry: a repeat after a lost response just gets a 412
+                response = self._call("write", lambda: send("PUT", {"if-match": etag}, json.dumps(value)))
+                if response.status_code != 412:
+                    return value
+            raise RuntimeError(f"{path} kept changing; try again")
+        except Exception as e:
+            print(f"Error in transaction on {path}: {e}")
+            raise
+
+    def query(self, path, order_by="$key", start_at=None, limit=None, equal_to=None):
+        """Read ``path`` ordered by key or by a child, optionally filtered and limited to ``limit`` records."""
+        def run():
+            ref = self.new_database().child(path)
+            ref = ref.order_by_key() if order_by == "$key" else ref.order_by_child(order_by)
+            if equal_to is not None:
+                ref = ref.equal_to(equal_to)
+            if start_at is not None:
+                ref = ref.start_at(start_at)
+            if limit:
+                ref = ref.limit_to_first(limit)
+            return ref.get().val()
+
+        try:
+            return self._call("read", run)
+        except Exception as e:
+            print(f"Error querying {path}: {e}")
+            raise
+
+    def update_data(self, path, updates, db=None):
         try:
-            self.db.child(path).update(updates)
+            self._call("write", lambda: self._ref(path, db).update(updates))
             return True
         except Exception as e:
             print(f"Error updating data: {e}")
             raise
     
+    def update_batched(self, path, updates, chunk_size=500, progress=None):
+        """Apply multi-path ``updates`` under ``path``, ``chunk_size`` paths per request.
+
+        ``updates`` is a dict or an iterable of ``(subpath, value)`` pairs, so
+        large imports can be streamed. Each chunk is an idempotent update and is
+        retried on its own. ``progress(written)`` is called after every chunk.
+        """
+        items = updates.items() if isinstance(updates, dict) else updates
+        written = 0
+        chunk = {}
+
+        def flush():
+            nonlocal written, chunk
+            batch = chunk
+            self._call("write", lambda: self._ref(path).update(batch))
+            written += len(batch)
+            chunk = {}
+            if progress:
+                progress(written)
+
+        try:
+            for subpath, value in items:
+                chunk[subpath] = value
+                if len(chunk) >= chunk_size:
+                    flush()
+            if chunk:
+                flush()
+            return written
+        except Exception as e:
+            print(f"Error updating {path} in batches: {e}")
+            raise
+
     def delete_data(self, path):
         try:
-            self.db.child(path).remove()
+            self._call("write", lambda: self._ref(path).remove())
             return True
         except Exception as e:
             print(f"Error deleting data: {e}")
             raise
     
-    def upload_file(self, file_path, storage_path):
+    def upload_file(self, file_path, storage_path, progress=None):
         try:
-            self.storage.child(storage_path).put(file_path)
-            return self.storage.child(storage_path).get_url(None)
+            return self.transfers.upload(file_path, storage_path, progress).result()['url']
         except Exception as e:
             print(f"Error uploading file: {e}")
             raise
     
-    def download_file(self, storage_path, local_path):
+    def download_file(self, storage_path, local_path, progress=None):
         try:
-            self.storage.child(storage_path).download(local_path)
+            self.transfers.download(storage_path, local_path, progress).result()
             return True
         except Exception as e:
             print(f"Error downloading file: {e}")
             raise
     
+    def get_cached_file(self, storage_path, progress=None):
+        """Return a local path for a Storage object, downloading it only when the cache is stale."""
+        try:
+            return self.transfers.fetch(storage_path, progress).result()
+        except Exception as e:
+            print(f"Error fetching file: {e}")
+            raise
+    
+    def upload_files(self, items, progress=None):
+        """Upload many ``(file_path, storage_path)`` pairs concurrently; returns futures by storage path."""
+        return self.transfers.upload_many(items, progress)
+    
+    def download_files(self, items, progress=None):
+        """Download many ``(storage_path, local_path)`` pairs concurrently; returns futures by storage path."""
+        return self.transfers.download_many(items, progress)
+    
     def delete_file(self, storage_path):
         try:
-            self.storage.child(storage_path).delete()
+            self._call("storage", lambda: self.storage.delete(storage_path, self.tokens.current_token()))
+            self.transfers.cache.invalidate(storage_path)
             return True
         except Exception as e:
             print(f"Error deleting file: {e}")
@@ -249,7 +450,7 @@ class FirebaseManager:
             user = self.auth.create_user_with_email_and_password(email, password)
             
             if user_data:
-                self.db.child("users").child(user['localId']).set(user_data)
+                self.set_data(f"users/{user['localId']}", user_data)
                 
             return user
         except Exception as e:
@@ -258,7 +459,7 @@ class FirebaseManager:
     
     def update_user_data(self, user_id, data):
         try:
-            self.db.child("users").child(user_id).update(data)
+            self._call("write", lambda: self._ref(f"users/{user_id}").update(data))
             return True
         except Exception as e:
             print(f"Error updating user data: {e}")
@@ -266,28 +467,31 @@ class FirebaseManager:
     
     def get_user_data(self, user_id):
         try:
-            return self.db.child("users").child(user_id).get().val()
+            return self._read(f"users/{user_id}")
         except Exception as e:
             print(f"Error getting user data: {e}")
             return None
     
     def get_collection(self, collection_path):
         try:
-            return self.db.child(collection_path).get().val()
+            return self._read(collection_path)
         except Exception as e:
             print(f"Error getting collection {collection_path}: {e}")
             return None
     
     def add_document(self, collection_path, data):
         try:
-            return self.db.child(collection_path).push(data)
+            # A client-generated key turns the push into an idempotent set that is safe to retry
+            key = self.db.generate_key()
+            self._call("write", lambda: self._ref(f"{collection_path}/{key}").set(data))
+            return {'name': key}
         except Exception as e:
             print(f"Error adding document to {collection_path}: {e}")
             raise
     
     def update_document(self, document_path, data):
         try:
-            self.db.child(document_path).update(data)
+            self._call("write", lambda: self._ref(document_path).update(data))
             return True
         except Exception as e:
             print(f"Error updating document {document_path}: {e}")
@@ -295,7 +499,7 @@ class FirebaseManager:
     
     def delete_document(self, document_path):
         try:
-            self.db.child(document_path).remove()
+            self._call("write", lambda: self._ref(document_path).remove())
             return True
         except Exception as e:
             print(f"Error deleting document {document_path}: {e}")
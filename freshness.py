@@ -0,0 +1,81 @@
+"""Per-collection freshness for stale-while-revalidate views.
+
+Views render whatever data is already in memory (from the local snapshot or
+an earlier visit) and a background revalidation patches in the server copy.
+This tracker records, per collection, when the data was last confirmed
+against the server and whether a revalidation is in flight, so views can show
+a "syncing" badge and an "updated at" time.
+"""
+
+import time
+from datetime import datetime
+
+
+def _clock(timestamp):
+    moment = datetime.fromtimestamp(timestamp)
+    if moment.date() == datetime.now().date():
+        return moment.strftime("%H:%M")
+    return moment.strftime("%b %d %H:%M")
+
+
+class Freshness:
+    def __init__(self):
+        self._synced_at = {}
+        self._live = set()
+        self._syncing = set()
+
+    def restore(self, synced_at):
+        """Load confirmation times saved with the snapshot; they still need revalidating."""
+        for collection, timestamp in (synced_at or {}).items():
+            if isinstance(timestamp, (int, float)):
+                self._synced_at.setdefault(collection, float(timestamp))
+
+    def export(self):
+        return dict(self._synced_at)
+
+    def begin(self, collection):
+        """Mark ``collection`` as revalidating; returns False if it already is."""
+        if collection in self._syncing:
+            return False
+        self._syncing.add(collection)
+        return True
+
+    def synced(self, collection, at=None):
+        self._syncing.discard(collection)
+        self._live.add(collection)
+        self._synced_at[collection] = at or time.time()
+
+    def failed(self, collection):
+        self._syncing.discard(collection)
+        self._live.discard(collection)
+
+    def detached(self, collection):
+        """The collection stopped receiving live updates; its data is kept but may go stale."""
+        self._live.discard(collection)
+
+    def forget(self):
+        self._synced_at.clear()
+        self._live.clear()
+        self._syncing.clear()
+
+    def synced_at(self, collection):
+        """Epoch seconds when ``collection`` was last confirmed against the server, or None."""
+        return self._synced_at.get(collection)
+
+    def is_syncing(self, collection):
+        return collection in self._syncing
+
+    def is_stale(self, collection):
+        return collection not in self._live
+
+    def describe(self, collections):
+        """Badge text and state ("syncing", "stale" or "fresh") for a view reading ``collections``."""
+        if any(collection in self._syncing for collection in collections):
+            return "⟳ Syncing…", "syncing"
+
+        times = [self._synced_at.get(collection) for collection in collections]
+        if any(collection not in self._live for collection in collections):
+            if None in times:
+                return "Not yet synced", "stale"
+            return f"Saved copy from {_clock(min(times))}", "stale"
+        return f"✓ Updated {_clock(max(times))}", "fresh"
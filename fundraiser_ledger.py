@@ -0,0 +1,231 @@
+"""Fundraiser transactions ledger kept in integer cents.
+
+Each sale, donation, refund or expense is appended under
+``fundraiser_transactions/<fundraiser>/<id>`` with a signed ``amount_cents``;
+nothing is edited in place. The multi-path update that appends a batch also
+moves the materialized totals with server-side increments:
+
+    fundraisers/<id>/raised_cents          net amount raised
+    fundraisers/<id>/transaction_count     entries in the ledger
+    fundraiser_sales/<id>/<cadet>          net amount credited to a cadet
+
+Money never passes through a float: amounts are parsed from text with
+``Decimal`` and everything after that is integer arithmetic, so summing
+thousands of transactions is exact. The first transaction for a fundraiser
+turns its old free-form ``raised`` / ``current_amount`` / ``total_raised``
+value into an "Opening balance" entry; as with the hours ledger, the writer
+claims the fundraiser record with a conditional write first, so only one
+client migrates it, working from the record as the server has it.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+from hours_ledger import CLAIM, claim_migration, increment, release_migration
+
+LEDGER = "fundraiser_transactions"
+SALES = "fundraiser_sales"
+OPENING_BALANCE = "Opening balance"
+
+# Transaction kind -> sign of its amount
+KINDS = {"sale": 1, "donation": 1, "refund": -1, "expense": -1}
+
+LEGACY_RAISED = ("raised", "current_amount", "total_raised")
+LEGACY_GOAL = ("goal_amount", "goal")
+
+
+def to_cents(value):
+    """Whole cents from a number or text such as ``"$1,234.5"``; raises ValueError if it is not money."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value * 100
+    text = str(value).replace("$", "").replace(",", "").strip()
+    try:
+        amount = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"{value!r} is not an amount") from None
+    if not amount.is_finite():
+        raise ValueError(f"{value!r} is not an amount")
+    return int((amount * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def format_cents(cents):
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(int(cents)), 100)
+    return f"{sign}${dollars:,}.{cents:02d}"
+
+
+def _legacy_cents(record, names):
+    for name in names:
+        value = record.get(name)
+        if value not in (None, ""):
+            try:
+                return to_cents(value)
+            except ValueError:
+                return 0
+    return 0
+
+
+def goal_cents(fundraiser):
+    if isinstance(fundraiser.get("goal_cents"), int):
+        return fundraiser["goal_cents"]
+    return _legacy_cents(fundraiser, LEGACY_GOAL)
+
+
+def raised_cents(fundraiser):
+    """Net amount raised: the materialized total once the ledger is started, else the old field."""
+    if isinstance(fundraiser.get("raised_cents"), int):
+        return fundraiser["raised_cents"]
+    return _legacy_cents(fundraiser, LEGACY_RAISED)
+
+
+def progress_bar(raised, goal, width=10):
+    """A text progress bar and percentage (to a tenth) from integer cents, or ``"N/A"`` without a goal."""
+    if goal <= 0:
+        return "N/A"
+    raised = max(0, raised)
+    filled = min(width, raised * width // goal)
+    tenths = min(1000, raised * 1000 // goal)
+    return f"{'█' * filled}{'░' * (width - filled)} {tenths // 10}.{tenths % 10}%"
+
+
+def signed_cents(kind, amount):
+    """The ledger amount for a positive ``amount`` of ``kind``."""
+    if kind not in KINDS:
+        raise ValueError(f"Unknown transaction type {kind!r}")
+    cents = to_cents(amount)
+    if cents <= 0:
+        raise ValueError("Amount must be greater than zero")
+    return KINDS[kind] * cents
+
+
+def transaction_updates(fundraiser_id, transactions, fundraiser, entered_by, generate_key, now=None):
+    """Build one root multi-path update appending ``transactions`` to a fundraiser's ledger.
+
+    ``transactions`` are dicts with ``kind``, a signed ``amount_cents`` and
+    optionally ``cadet_id``, ``quantity``, ``note`` and ``date``.
+    ``fundraiser`` is the current record; while it has no ``raised_cents``
+    the ledger has not been started and the totals are set absolutely.
+    """
+    now = now or datetime.now().isoformat()
+    today = date.today().isoformat()
+    updates = {}
+    net = 0
+    count = 0
+    by_cadet = defaultdict(int)
+
+    def append(transaction):
+        nonlocal net, count
+        cents = transaction["amount_cents"]
+        if not isinstance(cents, int) or isinstance(cents, bool):
+            raise ValueError("amount_cents must be an integer")
+        cadet_id = transaction.get("cadet_id") or ""
+        updates[f"{LEDGER}/{fundraiser_id}/{generate_key()}"] = {
+            "kind": transaction.get("kind", "sale"),
+            "amount_cents": cents,
+            "cadet_id": cadet_id,
+            "quantity": int(transaction.get("quantity") or 0),
+            "note": transaction.get("note", ""),
+            "date": transaction.get("date") or today,
+            "entered_by": entered_by or "",
+            "created_at": now
+        }
+        net += cents
+        count += 1
+        if cadet_id:
+            by_cadet[cadet_id] += cents
+
+    for transaction in transactions:
+        append(transaction)
+    if not count:
+        return {}
+
+    for cadet_id, cents in by_cadet.items():
+        updates[f"{SALES}/{fundraiser_id}/{cadet_id}"] = increment(cents)
+    updates[f"fundraisers/{fundraiser_id}/updated_at"] = now
+
+    if isinstance(fundraiser.get("raised_cents"), int):
+        updates[f"fundraisers/{fundraiser_id}/raised_cents"] = increment(net)
+        updates[f"fundraisers/{fundraiser_id}/transaction_count"] = increment(count)
+        return updates
+
+    # First transaction: carry the old overwritten total over as an opening balance
+    opening = _legacy_cents(fundraiser, LEGACY_RAISED)
+    if opening:
+        append({"kind": "opening", "amount_cents": opening, "note": OPENING_BALANCE, "date": today})
+    updates[f"fundraisers/{fundraiser_id}/raised_cents"] = net
+    updates[f"fundraisers/{fundraiser_id}/transaction_count"] = count
+    goal = goal_cents(fundraiser)
+    if goal:
+        updates[f"fundraisers/{fundraiser_id}/goal_cents"] = goal
+    return updates
+
+
+def calculate_balances(transactions, today=None):
+    """``(balance, month_income)`` in cents over ``transactions``.
+
+    ``balance`` is the net of every transaction; ``month_income`` adds up the
+    incoming amounts dated in the current month.
+    """
+    month = (today or date.today()).isoformat()[:7]
+    balance = 0
+    month_income = 0
+    for transaction in transactions:
+        if not isinstance(transaction, dict):
+            continue
+        cents = transaction.get("amount_cents")
+        if not isinstance(cents, int):
+            continue
+        balance += cents
+        if cents > 0 and str(transaction.get("date", "")).startswith(month):
+            month_income += cents
+    return balance, month_income
+
+
+class FundraiserLedger:
+    def __init__(self, firebase):
+        self.firebase = firebase
+
+    def record(self, fundraiser_id, transactions, entered_by):
+        """Append ``transactions`` and update the totals in a single request; returns the entry count.
+
+        The fundraiser is read fresh from the server; its first transaction
+        claims it and migrates the legacy total, and ``LedgerBusyError`` is
+        raised while another client holds that claim.
+        """
+        if not transactions:
+            return 0
+
+        path = f"fundraisers/{fundraiser_id}"
+
+        def started(fundraiser):
+            if not fundraiser:
+                raise ValueError("This fundraiser no longer exists")
+            return isinstance(fundraiser.get("raised_cents"), int)
+
+        fundraiser, claim = claim_migration(self.firebase, path, started, entered_by)
+        updates = transaction_updates(fundraiser_id, transactions, fundraiser, entered_by, self.firebase.db.generate_key)
+        if claim is None:
+            self.firebase.update_data("", updates)
+        else:
+            updates[f"{path}/{CLAIM}"] = None
+            try:
+                self.firebase.update_data("", updates)
+            except Exception:
+                release_migration(self.firebase, path, claim)
+                raise
+        return sum(1 for key in updates if key.startswith(f"{LEDGER}/"))
+
+    def history(self, fundraiser_id):
+        """A fundraiser's transactions, oldest first."""
+        transactions = self.firebase.get_data(f"{LEDGER}/{fundraiser_id}")
+        rows = [(key, value) for key, value in dict(transactions or {}).items() if isinstance(value, dict)]
+        return sorted(rows, key=lambda item: (str(item[1].get("date", "")), str(item[1].get("created_at", ""))))
+
+    def delete(self, fundraiser_id):
+        """Remove a fundraiser together with its ledger and per-cadet sales."""
+        self.firebase.update_data("", {
+            f"fundraisers/{fundraiser_id}": None,
+            f"{LEDGER}/{fundraiser_id}": None,
+            f"{SALES}/{fundraiser_id}": None
+        })
@@ -0,0 +1,177 @@
+import tkinter as tk
+
+import customtkinter as ctk
+
+from hours_ledger import parse_hours, parse_paste, paste_targets
+
+
+class HoursGrid(ctk.CTkFrame):
+    """A keyboard-driven entry grid with one row per cadet.
+
+    ``rows`` is a list of ``(cadet_id, name, flight, hours, color)`` and
+    ``columns`` the editable cells as ``(key, heading, width)``. Tab and
+    Shift+Tab move across and wrap to the next row, the arrow keys and Enter
+    move between rows, and pasting a block copied from a spreadsheet fills the
+    cells down and to the right. Nothing is saved here: ``values()`` hands the
+    typed cells to the caller, which commits them in one batch.
+    """
+
+    LABEL_COLUMNS = (("Cadet", 200), ("Flight", 80), ("Current", 70))
+
+    def __init__(self, master, rows, columns, on_change=None, header_color="#2563eb",
+                 font=("Arial", 12), **kwargs):
+        kwargs.setdefault("fg_color", "white")
+        super().__init__(master, **kwargs)
+
+        self.rows = list(rows)
+        self.columns = list(columns)
+        self.on_change = on_change
+        self.cells = []
+        self._dirty = False
+        self._names = {}
+
+        header = tk.Frame(self, background=header_color)
+        header.pack(fill="x")
+        widths = [width for _, width in self.LABEL_COLUMNS] + [width for _, _, width in self.columns]
+        headings = [heading for heading, _ in self.LABEL_COLUMNS] + [heading for _, heading, _ in self.columns]
+        for column, (heading, width) in enumerate(zip(headings, widths)):
+            header.grid_columnconfigure(column, minsize=width)
+            tk.Label(
+                header, text=heading, background=header_color, foreground="#ffffff",
+                font=(font[0], font[1], "bold"), anchor="w", padx=6, pady=6
+            ).grid(row=0, column=column, sticky="we")
+
+        self.body = ctk.CTkScrollableFrame(self, fg_color="white")
+        self.body.pack(fill="both", expand=True)
+        for column, width in enumerate(widths):
+            self.body.grid_columnconfigure(column, minsize=width)
+
+        self.normal_background = "#ffffff"
+        self.error_background = "#fee2e2"
+        for row, (cadet_id, name, flight, hours, color) in enumerate(self.rows):
+            background = "#f8fafc" if row % 2 else "#ffffff"
+            for column, (text, foreground) in enumerate(((name, "#333333"), (flight, "#555555"), (f"{hours:g}", color))):
+                tk.Label(
+                    self.body, text=text, background=background, foreground=foreground,
+                    font=font, anchor="w", padx=6
+                ).grid(row=row, column=column, sticky="nswe")
+
+            cells = []
+            for column in range(len(self.columns)):
+                entry = tk.Entry(self.body, font=font, relief="solid", borderwidth=1, highlightthickness=1,
+                                 background=self.normal_background)
+                entry.grid(row=row, column=len(self.LABEL_COLUMNS) + column, sticky="we", padx=2, pady=1)
+                self._bind(entry, row, column)
+                cells.append(entry)
+            self.cells.append(cells)
+
+            first, last = name.split(" ", 1) if " " in name else (name, "")
+            for key in (f"{first} {last}", f"{last} {first}"):
+                self._names[" ".join(key.lower().split())] = row
+
+    def _bind(self, entry, row, column):
+        entry.bind("<Tab>", lambda e: self._move(row, column, 0, 1, wrap=True))
+        for sequence in ("<Shift-Tab>", "<ISO_Left_Tab>"):
+            entry.bind(sequence, lambda e: self._move(row, column, 0, -1, wrap=True))
+        entry.bind("<Up>", lambda e: self._move(row, column, -1, 0))
+        entry.bind("<Down>", lambda e: self._move(row, column, 1, 0))
+        entry.bind("<Return>", lambda e: self._move(row, column, 1, 0))
+        entry.bind("<Left>", lambda e: self._move(row, column, 0, -1) if entry.index("insert") == 0 else None)
+        entry.bind("<Right>", lambda e: self._move(row, column, 0, 1) if entry.index("insert") == entry.index("end") else None)
+        entry.bind("<<Paste>>", lambda e: self._paste(row, column))
+        entry.bind("<KeyRelease>", lambda e: self._changed())
+        entry.bind("<FocusOut>", lambda e: self._check(row, column))
+
+    def _move(self, row, column, rows, columns, wrap=False):
+        width = len(self.columns)
+        if wrap:
+            position = row * width + column + columns
+            row, column = divmod(position, width)
+        else:
+            row, column = row + rows, column + columns
+        if 0 <= row < len(self.cells) and 0 <= column < width:
+            self.focus_cell(row, column)
+        return "break"
+
+    def _paste(self, row, column):
+        try:
+            text = self.clipboard_get()
+        except tk.TclError:
+            return None
+        if "\t" not in text and "\n" not in text.strip():
+            # A single value pastes into the cell the usual way
+            return None
+
+        for target_row, target_column, value in paste_targets(
+                parse_paste(text), row, column, len(self.cells), len(self.columns), self._names):
+            self.set_value(target_row, target_column, value)
+        self._changed()
+        return "break"
+
+    def _check(self, row, column):
+        if self.columns[column][0] == "hours":
+            self.mark(row, not self._valid_hours(self.cells[row][column].get()))
+
+    @staticmethod
+    def _valid_hours(text):
+        if not text.strip():
+            return True
+        try:
+            parse_hours(text)
+        except ValueError:
+            return False
+        return True
+
+    def _changed(self):
+        self._dirty = True
+        if self.on_change:
+            self.on_change()
+
+    def focus_cell(self, row, column):
+        entry = self.cells[row][column]
+        entry.focus_set()
+        entry.select_range(0, "end")
+        entry.icursor("end")
+        self._see(entry)
+
+    def _see(self, entry):
+        canvas = getattr(self.body, "_parent_canvas", None)
+        if canvas is None:
+            return
+        self.body.update_idletasks()
+        height = self.body.winfo_height()
+        if height <= 0:
+            return
+        top, bottom = canvas.yview()
+        y = entry.winfo_y()
+        if y / height < top:
+            canvas.yview_moveto(y / height)
+        elif (y + entry.winfo_height()) / height > bottom:
+            canvas.yview_moveto((y + entry.winfo_height()) / height - (bottom - top))
+
+    def set_value(self, row, column, value):
+        entry = self.cells[row][column]
+        entry.delete(0, "end")
+        entry.insert(0, value)
+        self._check(row, column)
+
+    def mark(self, row, invalid):
+        """Highlight ``row``'s hours cell when it holds something that is not an hour amount."""
+        column = next((i for i, (key, _, _) in enumerate(self.columns) if key == "hours"), 0)
+        self.cells[row][column].configure(background=self.error_background if invalid else self.normal_background)
+
+    def mark_errors(self, cadet_ids):
+        cadet_ids = set(cadet_ids)
+        for row, (cadet_id, *_) in enumerate(self.rows):
+            self.mark(row, cadet_id in cadet_ids)
+
+    def values(self):
+        """``[(cadet_id, {column key: text}), ...]`` for every row, in grid order."""
+        return [
+            (cadet_id, {key: cell.get() for (key, _, _), cell in zip(self.columns, cells)})
+            for (cadet_id, *_), cells in zip(self.rows, self.cells)
+        ]
+
+    @property
+    def dirty(self):
+        return self._dirty and any(text.strip() for _, cells in self.values() for text in cells.values())
@@ -0,0 +1,278 @@
+"""Append-only community service hours ledger with materialized totals.
+
+Every change to a cadet's hours is a new entry under ``cs_hours_ledger``
+(cadet, date, event, hours, entered_by); corrections are negative entries,
+nothing is edited in place. The same multi-path update that appends entries
+bumps the materialized totals with server-side increments:
+
+    cadets/<id>/cs_hours              hours for that cadet
+    cs_hours_totals/flights/<flight>  hours for the flight
+    cs_hours_totals/all               hours for the unit
+
+The first write also turns the old free-form ``cs_hours`` / ``CS Hours`` /
+``communityServiceHours`` values into "Opening balance" entries so the
+totals start from what was already recorded. Whether that has happened is
+decided on the server: the writer first claims ``cs_hours_totals`` with a
+conditional write, so only one client ever migrates, and it reads the legacy
+values fresh rather than from its cache.
+"""
+
+import re
+import time
+from collections import defaultdict
+from datetime import date, datetime
+
+from reports import cs_hours
+
+LEDGER = "cs_hours_ledger"
+TOTALS = "cs_hours_totals"
+OPENING_BALANCE = "Opening balance"
+
+# Field holding a client's claim on a one-time migration; a claim older than
+# CLAIM_TIMEOUT seconds is assumed abandoned (its writer crashed)
+CLAIM = "ledger_claim"
+CLAIM_TIMEOUT = 300
+
+
+class LedgerBusyError(Exception):
+    """Another client is starting the ledger; the write should be tried again shortly."""
+
+
+def increment(amount):
+    return {".sv": {"increment": amount}}
+
+
+def flight_key(flight):
+    """Database key for a flight name; keys cannot contain . $ # [ ] or /."""
+    flight = str(flight or "").strip()
+    return re.sub(r"[.$#\[\]/]", "_", flight) if flight else "Unassigned"
+
+
+def _flight(cadet):
+    return cadet.get('flight', cadet.get('Flight', ''))
+
+
+def parse_hours(value):
+    """Hours as a float rounded to quarter hours; raises ValueError for anything else."""
+    hours = round(float(str(value).strip()) * 4) / 4
+    if hours == 0:
+        raise ValueError("Hours must not be zero")
+    if abs(hours) > 24:
+        raise ValueError("A single entry cannot exceed 24 hours")
+    return hours
+
+
+def claim_migration(firebase, path, started, claimed_by):
+    """Claim the one-time ledger migration of the node at ``path`` with a conditional write.
+
+    Returns ``(node, token)`` where ``node`` is the value read from the
+    server. ``token`` is None when ``started(node)`` says the migration
+    already happened, else the claim to pass to ``release_migration`` if the
+    migration fails. Raises ``LedgerBusyError`` while another client holds an
+    unexpired claim.
+    """
+    claim = {"token": firebase.db.generate_key(), "claimed_at": time.time(), "by": claimed_by or ""}
+    read = {}
+
+    def take(current):
+        node = dict(current) if isinstance(current, dict) else {}
+        held = node.pop(CLAIM, None)
+        read["node"] = node
+        if started(node):
+            read["started"] = True
+            return current
+        if isinstance(held, dict) and held.get("token") != claim["token"]:
+            if time.time() - float(held.get("claimed_at") or 0) < CLAIM_TIMEOUT:
+                raise LedgerBusyError("The ledger is being set up by another user; try again in a moment.")
+        read["started"] = False
+        return {**node, CLAIM: claim}
+
+    firebase.transaction(path, take)
+    return read["node"], None if read["started"] else claim["token"]
+
+
+def release_migration(firebase, path, token):
+    """Drop this client's claim on ``path`` after a failed migration."""
+    def release(current):
+        if not isinstance(current, dict) or (current.get(CLAIM) or {}).get("token") != token:
+            return current
+        return {key: value for key, value in current.items() if key != CLAIM} or None
+
+    try:
+        firebase.transaction(path, release)
+    except Exception as e:
+        print(f"Error releasing the ledger claim on {path}: {e}")
+
+
+def ledger_updates(entries, cadets, started, entered_by, generate_key, now=None):
+    """Build one root multi-path update that appends ``entries`` and moves the totals.
+
+    ``entries`` are dicts with ``cadet_id``, ``hours`` and optionally ``date``
+    and ``event``. Until the ledger is ``started`` opening balances are
+    written, and the totals set as absolute values, alongside the entries.
+    """
+    now = now or datetime.now().isoformat()
+    today = date.today().isoformat()
+    updates = {}
+    by_cadet = defaultdict(float)
+
+    def append(cadet_id, hours, entry_date, event):
+        updates[f"{LEDGER}/{generate_key()}"] = {
+            "cadet_id": cadet_id,
+            "date": entry_date or today,
+            "event": event or "",
+            "hours": hours,
+            "entered_by": entered_by or "",
+            "created_at": now
+        }
+        by_cadet[cadet_id] += hours
+
+    for entry in entries:
+        cadet_id = entry["cadet_id"]
+        if not isinstance(cadets.get(cadet_id), dict):
+            raise ValueError(f"Unknown cadet {cadet_id}")
+        append(cadet_id, float(entry["hours"]), entry.get("date"), entry.get("event"))
+
+    if not by_cadet:
+        return {}
+
+    if started:
+        by_flight = defaultdict(float)
+        for cadet_id, hours in by_cadet.items():
+            by_flight[flight_key(_flight(cadets[cadet_id]))] += hours
+            updates[f"cadets/{cadet_id}/cs_hours"] = increment(hours)
+            updates[f"cadets/{cadet_id}/updated_at"] = now
+        for flight, hours in by_flight.items():
+            updates[f"{TOTALS}/flights/{flight}"] = increment(hours)
+        updates[f"{TOTALS}/all"] = increment(sum(by_cadet.values()))
+        return updates
+
+    # First write: carry the legacy per-cadet numbers over as opening balances
+    # and set every total absolutely, since increments cannot add to a string.
+    balances = {}
+    for cadet_id, cadet in cadets.items():
+        if not isinstance(cadet, dict):
+            continue
+        opening = cs_hours(cadet)
+        if opening:
+            append(cadet_id, opening, today, OPENING_BALANCE)
+        balances[cadet_id] = by_cadet.get(cadet_id, 0.0)
+
+    flights = defaultdict(float)
+    for cadet_id, hours in balances.items():
+        flights[flight_key(_flight(cadets[cadet_id]))] += hours
+        if hours or cadets[cadet_id].get("cs_hours") not in (None, hours):
+            updates[f"cadets/{cadet_id}/cs_hours"] = hours
+            updates[f"cadets/{cadet_id}/updated_at"] = now
+
+    updates[TOTALS] = {"flights": dict(flights), "all": sum(balances.values()), "started_at": now}
+    return updates
+
+
+def parse_paste(text):
+    """Rows of cells from a block copied out of a spreadsheet (tab-separated lines)."""
+    lines = str(text).replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    while lines and not lines[-1].strip():
+        lines.pop()
+    return [line.split("\t") for line in lines]
+
+
+def _is_number(cell):
+    try:
+        float(str(cell).strip())
+    except ValueError:
+        return False
+    return True
+
+
+def paste_targets(cells, row, column, row_count, column_count, names=None):
+    """Place pasted ``cells`` on a grid, yielding ``(row, column, value)``.
+
+    Cells fill down and right from ``(row, column)`` and anything past the
+    grid's edge is dropped. When ``names`` (lower-case cadet name -> row) is
+    given, a pasted line that starts with a cadet's name goes to that cadet's
+    row, with the remaining cells starting at the first column, so a
+    name/hours sheet lines up whatever order it was sorted in.
+    """
+    for offset, line in enumerate(cells):
+        target_row, target_column = row + offset, column
+        if names and len(line) > 1 and not _is_number(line[0]):
+            name = " ".join(line[0].replace(",", " ").lower().split())
+            if name in names:
+                target_row, target_column, line = names[name], 0, line[1:]
+        if not 0 <= target_row < row_count:
+            continue
+        for index, value in enumerate(line):
+            if target_column + index < column_count:
+                yield target_row, target_column + index, value.strip()
+
+
+def grid_entries(rows, entry_date, event):
+    """Ledger entries from ``(cadet_id, hours_text, event_text)`` grid rows.
+
+    Rows with blank hours are skipped and a blank event falls back to
+    ``event``. Returns ``(entries, errors)`` where ``errors`` maps cadet ids
+    to the reason their hours were rejected.
+    """
+    entries = []
+    errors = {}
+    for cadet_id, hours_text, event_text in rows:
+        if not str(hours_text).strip():
+            continue
+        try:
+            hours = parse_hours(hours_text)
+        except ValueError as e:
+            errors[cadet_id] = str(e) if _is_number(hours_text) else f"{hours_text!r} is not a number"
+            continue
+        entries.append({"cadet_id": cadet_id, "date": entry_date, "event": str(event_text).strip() or event, "hours": hours})
+    return entries, errors
+
+
+class HoursLedger:
+    def __init__(self, firebase):
+        self.firebase = firebase
+        # Set once the ledger is known to be started, so later writes skip the claim round trip
+        self.started = False
+
+    def record(self, entries, cadets, entered_by):
+        """Append ``entries`` and update the totals in a single request; returns the entry count.
+
+        The first write for a unit claims the ledger and migrates the legacy
+        hours read fresh from the server; raises ``LedgerBusyError`` while
+        another client holds that claim. Once the ledger has started, each
+        call is one multi-path update.
+        """
+        if not entries:
+            return 0
+
+        claim = None
+        if not self.started:
+            _, claim = claim_migration(self.firebase, TOTALS, lambda totals: "started_at" in totals, entered_by)
+        if claim is None:
+            updates = ledger_updates(entries, cadets, True, entered_by, self.firebase.db.generate_key)
+            self.firebase.update_data("", updates)
+        else:
+            try:
+                # Opening balances come from the server's legacy values, not a possibly stale cache;
+                # setting cs_hours_totals replaces the claim in the same update.
+                cadets = dict(self.firebase.get_data("cadets") or {})
+                updates = ledger_updates(entries, cadets, False, entered_by, self.firebase.db.generate_key)
+                self.firebase.update_data("", updates)
+            except Exception:
+                release_migration(self.firebase, TOTALS, claim)
+                raise
+        self.started = True
+        return sum(1 for path in updates if path.startswith(f"{LEDGER}/"))
+
+    def history(self, cadet_id):
+        """Ledger entries for one cadet, oldest first."""
+        try:
+            entries = self.firebase.query(LEDGER, order_by="cadet_id", equal_to=cadet_id)
+        except Exception:
+            # No ".indexOn": ["cadet_id"] rule on the ledger; read it all and filter here
+            entries = self.firebase.get_data(LEDGER)
+        rows = [
+            (entry_id, entry) for entry_id, entry in dict(entries or {}).items()
+            if isinstance(entry, dict) and entry.get("cadet_id") == cadet_id
+        ]
+        return sorted(rows, key=lambda item: (str(item[1].get("date", "")), str(item[1].get("created_at", ""))))
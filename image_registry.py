@@ -0,0 +1,124 @@
+import os
+import threading
+
+import customtkinter as ctk
+from PIL import Image
+
+
+class ImageRegistry:
+    """App-wide cache of decoded images and shared CTkImage instances.
+
+    Each asset is decoded once; every requested size gets its own pre-scaled
+    light and dark variant so widgets never resize the full-resolution source.
+    """
+
+    # Icons are drawn at this multiple of their size and downsampled for smooth edges.
+    ICON_OVERSAMPLE = 4
+
+    def __init__(self, asset_dirs=None):
+        self.asset_dirs = asset_dirs or [os.getcwd(), os.path.dirname(os.path.abspath(__file__))]
+        self._sources = {}
+        self._images = {}
+        self._lock = threading.Lock()
+
+    def image(self, name, size):
+        """Return the shared CTkImage for asset ``name`` at ``size`` (w, h), or None if missing.
+
+        A ``<stem>_dark<ext>`` file next to the asset is used in dark mode when present.
+        """
+        size = self._size(size)
+        key = ("asset", name, size)
+        with self._lock:
+            if key in self._images:
+                return self._images[key]
+
+            light = self._source(name)
+            if light is None:
+                self._images[key] = None
+                return None
+
+            stem, ext = os.path.splitext(name)
+            dark = self._source(f"{stem}_dark{ext}") or light
+
+            image = ctk.CTkImage(
+                light_image=self._scaled(light, size),
+                dark_image=self._scaled(dark, size),
+                size=size
+            )
+            self._images[key] = image
+            return image
+
+    def icon(self, name, size=16, light_color="#333333", dark_color=None):
+        """Return a shared CTkImage for one of the built-in vector icons."""
+        size = self._size(size)
+        dark_color = dark_color or light_color
+        key = ("icon", name, size, light_color, dark_color)
+        with self._lock:
+            if key not in self._images:
+                self._images[key] = ctk.CTkImage(
+                    light_image=self._draw_icon(name, size, light_color),
+                    dark_image=self._draw_icon(name, size, dark_color),
+                    size=size
+                )
+            return self._images[key]
+
+    def clear(self):
+        with self._lock:
+            self._sources.clear()
+            self._images.clear()
+
+    def _source(self, name):
+        if name in self._sources:
+            return self._sources[name]
+
+        source = None
+        for directory in self.asset_dirs:
+            path = os.path.join(directory, name)
+            if not os.path.exists(path):
+                continue
+            try:
+                with Image.open(path) as img:
+                    source = img.convert("RGBA")
+            except Exception as e:
+                print(f"Error loading image {path}: {e}")
+            break
+
+        self._sources[name] = source
+        return source
+
+    def _scaled(self, source, size):
+        if source.size == size:
+            return source
+        return source.resize(size, Image.LANCZOS)
+
+    def _draw_icon(self, name, size, color):
+        from PIL import ImageDraw
+
+        scale = self.ICON_OVERSAMPLE
+        w, h = size[0] * scale, size[1] * scale
+        canvas = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(canvas)
+        stroke = max(1, round(min(w, h) / 8))
+        pad = stroke * 1.5
+
+        if name == "edit":
+            # Pencil: a thick diagonal shaft with a pointed tip in the lower left.
+            draw.line([(w - pad, pad), (pad + stroke * 2, h - pad - stroke * 2)], fill=color, width=stroke * 2)
+            draw.polygon([
+                (pad, h - pad),
+                (pad + stroke * 2.5, h - pad - stroke * 0.5),
+                (pad + stroke * 0.5, h - pad - stroke * 2.5)
+            ], fill=color)
+        elif name == "delete":
+            draw.line([(pad, pad), (w - pad, h - pad)], fill=color, width=stroke)
+            draw.line([(w - pad, pad), (pad, h - pad)], fill=color, width=stroke)
+        else:
+            raise KeyError(f"Unknown icon: {name}")
+
+        return canvas.resize(size, Image.LANCZOS)
+
+    @staticmethod
+    def _size(size):
+        if isinstance(size, int):
+            return (size, size)
+        return tuple(size)
@@ -0,0 +1,99 @@
+from bisect import bisect_left, insort
+
+
+class FundraiserLeaderboard:
+    """Per-cadet fundraiser contributions ranked per fundraiser and overall.
+
+    Fed from the materialized ``fundraiser_sales`` node ({fundraiser: {cadet:
+    cents}}). Each ranking is a list of ``(-cents, cadet_id)`` kept sorted with
+    bisect, so a sale moves one cadet in two lists and the top N is a slice;
+    the ledger is never rescanned. Only cadets with a positive total are
+    ranked.
+    """
+
+    def __init__(self):
+        self._source = None
+        self._sales = {}
+        self._totals = {}
+        self._ranked = {}
+        self._overall = []
+
+    def sync(self, sales):
+        """Rebuild if ``sales`` is a different collection object than the one indexed."""
+        if sales is not self._source:
+            self.rebuild(sales)
+        return self._source
+
+    def rebuild(self, sales):
+        self._source = sales if isinstance(sales, dict) else {}
+        self._sales = {}
+        self._totals = {}
+        self._ranked = {}
+        self._overall = []
+        for fundraiser_id in list(self._source):
+            self._load(fundraiser_id)
+
+    def refresh(self, sales, fundraiser_ids=None):
+        """Re-rank the given fundraisers after an in-place change, or everything if ``fundraiser_ids`` is None."""
+        if fundraiser_ids is None or sales is not self._source:
+            self.rebuild(sales)
+            return
+
+        for fundraiser_id in fundraiser_ids:
+            self._load(fundraiser_id)
+
+    def _load(self, fundraiser_id):
+        current = self._source.get(fundraiser_id)
+        current = {
+            str(cadet_id): cents for cadet_id, cents in (current.items() if isinstance(current, dict) else ())
+            if isinstance(cents, int) and not isinstance(cents, bool)
+        }
+        previous = self._sales.get(fundraiser_id, {})
+        for cadet_id in previous.keys() | current.keys():
+            if previous.get(cadet_id, 0) != current.get(cadet_id, 0):
+                self._set(fundraiser_id, cadet_id, previous.get(cadet_id, 0), current.get(cadet_id, 0))
+
+        if current:
+            self._sales[fundraiser_id] = current
+        else:
+            self._sales.pop(fundraiser_id, None)
+            self._ranked.pop(fundraiser_id, None)
+
+    def _set(self, fundraiser_id, cadet_id, old, new):
+        ranked = self._ranked.setdefault(fundraiser_id, [])
+        if old > 0:
+            self._discard(ranked, (-old, cadet_id))
+        if new > 0:
+            insort(ranked, (-new, cadet_id))
+
+        total = self._totals.get(cadet_id, 0)
+        if total > 0:
+            self._discard(self._overall, (-total, cadet_id))
+        total += new - old
+        if total:
+            self._totals[cadet_id] = total
+        else:
+            self._totals.pop(cadet_id, None)
+        if total > 0:
+            insort(self._overall, (-total, cadet_id))
+
+    @staticmethod
+    def _discard(entries, entry):
+        index = bisect_left(entries, entry)
+        if index < len(entries) and entries[index] == entry:
+            del entries[index]
+
+    def top(self, n=10, fundraiser_id=None):
+        """``[(cadet_id, cents), ...]`` for the ``n`` best sellers of one fundraiser, or across all of them."""
+        entries = self._overall if fundraiser_id is None else self._ranked.get(fundraiser_id, ())
+        return [(cadet_id, -cents) for cents, cadet_id in entries[:n]]
+
+    def total(self, cadet_id, fundraiser_id=None):
+        """Net cents a cadet has raised for one fundraiser, or across all of them."""
+        if fundraiser_id is None:
+            return self._totals.get(cadet_id, 0)
+        return self._sales.get(fundraiser_id, {}).get(cadet_id, 0)
+
+    def participants(self, fundraiser_id=None):
+        """Number of cadets with a positive total."""
+        return len(self._overall if fundraiser_id is None else self._ranked.get(fundraiser_id, ()))
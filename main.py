@@ -1,24 +1,50 @@
+import time
+
+_STARTUP_STARTED = time.perf_counter()
+
 import customtkinter as ctk
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import messagebox, ttk
 from datetime import datetime, timedelta
 import json
 import os
 import sys
 import re
-import time
+import queue
+from functools import lru_cache
 
 from concurrent.futures import ThreadPoolExecutor
-from dateutil.relativedelta import relativedelta
-from PIL import Image, ImageTk, ImageDraw, ImageFont
-import pyrebase
 from dotenv import load_dotenv
 
-from firebase_config import FirebaseManager
+# firebase_config (and with it pyrebase) is imported once the loading screen is visible
+from realtime import StreamManager, apply_stream_event, changed_children
+from session import user_data_dir
+from snapshot_store import SnapshotStore
+from freshness import Freshness
+from hours_ledger import HoursLedger, grid_entries, parse_hours
+from hours_grid import HoursGrid
+from fundraiser_ledger import (FundraiserLedger, KINDS as TRANSACTION_KINDS, calculate_balances, format_cents,
+                               goal_cents, progress_bar, raised_cents, signed_cents, to_cents)
+from thumbnails import ThumbnailService
+from image_registry import ImageRegistry
+from cadet_index import CadetIndex, SORT_FIELDS
+from leaderboard import FundraiserLeaderboard
+from data_table import DataTable
+from reports import REPORTS, REQUIRED_CS_HOURS, chunked
+from report_export import FORMATS, ExportCancelled, export_report, supported_formats
+from roster_import import FIELDS as ROSTER_FIELDS, apply_import, plan_import, read_headers, suggest_mapping
 import threading
 
 load_dotenv()
 
+
+@lru_cache(maxsize=None)
+def font_available(family):
+    # Resolving a single family is cheap; tkfont.families() enumerates every installed font
+    return tkfont.Font(family=family).actual("family") == family
+
+
 class AFJROTCApp:
     def _init_styles(self):
         # Modern color palette
@@ -31,6 +57,9 @@ class AFJROTCApp:
         self.warning_color = "#f59e0b"   # Amber
         self.danger_color = "#ef4444"    # Red
         
+        # Community service status against the hours requirement
+        self.hours_colors = {"red": self.danger_color, "yellow": self.warning_color, "green": self.success_color}
+        
         # Neutral colors
         self.bg_color = "#f8fafc"        # Lightest gray
         self.card_bg = "#ffffff"          # White
@@ -40,7 +69,7 @@ class AFJROTCApp:
         self.text_light = "#94a3b8"       # Light slate
         
         # Typography
-        self.font_family = "Inter" if 'Inter' in [f for f in tk.font.families()] else "Segoe UI"
+        self.font_family = "Inter" if font_available("Inter") else "Segoe UI"
         self.display_font = (self.font_family, 32, "bold")
         self.title_font = (self.font_family, 24, "bold")
         self.subtitle_font = (self.font_family, 16, "normal")
@@ -141,18 +170,71 @@ class AFJROTCApp:
         ctk.set_appearance_mode("light")
         ctk.set_default_color_theme("blue")
         
-        self.firebase = FirebaseManager()
         self.current_user = None
+        self.time_to_interactive = None
+        self._session_pending = False
+        
+        self._stream_subscriptions = {}
+        self._stream_detach_ids = {}
+        self.stream_idle_timeout_ms = 5 * 60 * 1000
+        
+        # Collections each view needs streamed. The dashboard streams only the materialized
+        # hours totals; its counts and upcoming events come from bounded reads.
+        self.view_streams = {
+            "dashboard": ("cs_hours_totals",),
+            "cadets": ("cadets", "events"),  # events for the bulk hours picker
+            "calendar": ("events",),
+            "fundraisers": ("fundraisers", "fundraiser_sales", "cadets"),
+            "jobs": ("jobs", "cadets"),
+            "contacts": ("contacts",),
+            "uniforms": ("uniforms",),
+            "reports": ("cadets", "fundraisers", "fundraiser_sales")
+        }
+        # Every collection any view reads, in first-use order
+        self.collections = tuple(dict.fromkeys(c for names in self.view_streams.values() for c in names))
+        self.stream_update_methods = {
+            "cadets": ["update_cadets_display", "update_dashboard"],
+            "jobs": ["update_jobs_display", "update_dashboard"],
+            "events": ["update_calendar_display", "update_upcoming_events", "update_dashboard"],
+            "fundraisers": ["update_fundraisers_display", "update_dashboard"],
+            "contacts": ["update_contacts_display"],
+            "uniforms": ["update_uniforms_display"],
+            "cs_hours_totals": ["sync_hours_ledger", "update_dashboard"],
+            "fundraiser_sales": ["update_fundraisers_display"]
+        }
         
         self.executor = ThreadPoolExecutor(max_workers=5)
+        self._cadet_photo_rows = []
+        self._photo_load_scheduled = False
         
         self.events = {}
         self.jobs = {}
         self.cadets = {}
         self.fundraisers = {}
         self.contacts = {}
+        self.uniforms = {}
+        self.cs_hours_totals = {}
+        self.fundraiser_sales = {}
         self.upcoming_events = []
-        self.fundraiser_participants = {}
+        # Results of the dashboard's bounded reads, used while those collections are not streamed
+        self.dashboard_counts = {}
+        self.dashboard_events = {}
+        self.dashboard_query_limit = 50
+        self._dashboard_fetching = False
+        self.snapshot = None
+        self._snapshot_waiting = set()
+        
+        # When each collection was last confirmed against the server, for the views' sync badges
+        self.freshness = Freshness()
+        self._sync_badges = []
+        
+        # Sorted views over collections, kept current from stream events
+        self.cadet_index = CadetIndex()
+        # Per-cadet fundraiser contributions and top sellers, from fundraiser_sales
+        self.fundraiser_participants = FundraiserLeaderboard()
+        self.leaderboard_size = 10
+        self.collection_indexes = {"cadets": self.cadet_index, "fundraiser_sales": self.fundraiser_participants}
+        self.cadet_sort = [("name", False)]
         
         self.sidebar = None
         self.main_container = None
@@ -162,133 +244,263 @@ class AFJROTCApp:
         self.loading_frame = ctk.CTkFrame(self.root, fg_color="white")
         self.loading_label = ctk.CTkLabel(self.loading_frame, text="Loading...", font=("Arial", 24), text_color=self.primary_color)
         
-        try:
-            if os.path.exists("logo.png"):
-                self.logo_img = ctk.CTkImage(
-                    light_image=Image.open("logo.png"),
-                    dark_image=Image.open("logo.png"),
-                    size=(100, 100)
-                )
-            else:
-                self.logo_img = None
-        except Exception as e:
-            print(f"Error loading logo: {e}")
-            self.logo_img = None
-            
-        self.edit_icon_text = "✏️"
-        self.delete_icon_text = "❌"
-        self.edit_icon = None
-        self.delete_icon = None
+        self.images = ImageRegistry()
+        self.logo_img = self.load_logo()
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.cleanup)
         
         self.show_startup_screen()
         
-    def create_icon(self, master, text, color):
-        return ctk.CTkLabel(
-            master=master,
-            text=text,
-            text_color=color,
-            font=("Arial", 14)
-        )
+    def create_icon(self, name, color, size=16):
+        return self.images.icon(name, size, color)
         
     def clear_content_frame(self):
         if hasattr(self, 'content_frame') and self.content_frame:
             for widget in self.content_frame.winfo_children():
                 widget.destroy()
                 
-    def update_dashboard(self, force_update=False):
+    def setup_realtime_listeners(self):
         try:
-            if hasattr(self, '_updating_dashboard') and self._updating_dashboard:
-                return
-                
-            self._updating_dashboard = True
-            
-            self._update_dashboard_stats()
+            for collection in self.view_streams["dashboard"]:
+                self.subscribe_collection(collection)
             
-            if hasattr(self, 'show_dashboard') and not hasattr(self, 'current_view') or self.current_view != 'dashboard':
-                self.show_dashboard()
-                
         except Exception as e:
-            print(f"Error updating dashboard: {e}")
+            error_msg = f"Error setting up real-time listeners: {str(e)}"
+            print(error_msg)
+            messagebox.showerror("Error", error_msg)
+    
+    def subscribe_collection(self, collection):
+        if collection in self._stream_subscriptions:
+            return
+        
+        callback = self._create_stream_callback(collection, self.stream_update_methods.get(collection, []))
+        # Each collection streams on its own root, so connecting downloads only that collection
+        # and its first event is the full snapshot the view needs.
+        self.freshness.begin(collection)
+        try:
+            self._stream_subscriptions[collection] = self.streams.subscribe("", callback, root=collection)
+            if not self.streams.stats(collection)["connected"]:
+                # The supervisor keeps retrying; its first snapshot marks the collection synced
+                self.freshness.failed(collection)
+        except Exception:
+            self.freshness.failed(collection)
+            raise
         finally:
-            self._updating_dashboard = False
-            
-    def _update_dashboard_stats(self):
+            self.update_sync_badges()
+    
+    def unsubscribe_collection(self, collection, drop_data=True):
+        subscription_id = self._stream_subscriptions.pop(collection, None)
+        if subscription_id is None:
+            return
+        
         try:
-            if not hasattr(self, 'content_frame') or not self.content_frame:
-                return
-                
-            if hasattr(self, 'cadets'):
-                cadet_count = len(self.cadets)
-                if hasattr(self, 'cadet_count_label'):
-                    self.cadet_count_label.configure(text=str(cadet_count))
-            
+            self.streams.unsubscribe(subscription_id)
         except Exception as e:
-            print(f"Error updating dashboard stats: {e}")
-            
-    def setup_realtime_listeners(self):
-        if not hasattr(self, '_listeners') or not isinstance(self._listeners, dict):
-            self._listeners = {}
+            print(f"Error removing {collection} listener: {e}")
         
-        def create_callback(collection_name, update_methods=None):
-            update_methods = update_methods or []
-            
-            def callback(message):
-                try:
-                    if message.get("event") in ["put", "patch"]:
-                        data = message.get("data") or {}
-                        
-                        if hasattr(self, collection_name):
-                            if isinstance(data, list):
-                                setattr(self, collection_name, 
-                                       {item.get('id', idx): item for idx, item in enumerate(data) if item})
-                            else:
-                                setattr(self, collection_name, data)
-                        
-                        for method_name in update_methods:
-                            if hasattr(self, method_name):
-                                self.root.after(0, getattr(self, method_name))
-                                
-                except Exception as e:
-                    error_msg = f"Error in {collection_name} callback: {str(e)}"
-                    print(error_msg)
-                    self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
-            
-            return callback
+        if drop_data:
+            setattr(self, collection, {})
+    
+    def attach_view_streams(self, view):
+        """Stream the collections a view needs and schedule idle detach for the rest."""
+        if not self.current_user or self._session_pending:
+            return
+        
+        needed = set(self.view_streams.get(view, ()))
+        # New streams start with a full snapshot; only open ones that fell behind need a fetch
+        stale = [
+            c for c in needed
+            if c in self._stream_subscriptions and self.freshness.is_stale(c) and not self.freshness.is_syncing(c)
+        ]
         
         try:
-            listeners_config = {
-                "cadets": ["update_cadets_display", "update_dashboard"],
-                "jobs": ["update_jobs_display", "update_dashboard"],
-                "events": ["update_calendar_display", "update_upcoming_events", "update_dashboard"],
-                "fundraisers": ["update_fundraisers_display", "update_dashboard"],
-                "contacts": ["update_contacts_display"]
-            }
-            
-            for collection, methods in listeners_config.items():
-                if collection in self._listeners:
-                    try:
-                        self._listeners[collection]()
-                    except Exception as e:
-                        print(f"Error removing {collection} listener: {e}")
+            for collection in needed:
+                after_id = self._stream_detach_ids.pop(collection, None)
+                if after_id:
+                    self.root.after_cancel(after_id)
+                self.subscribe_collection(collection)
+        except Exception as e:
+            print(f"Error attaching streams for {view}: {e}")
+        
+        if stale:
+            self.revalidate(stale)
+        
+        for collection in list(self._stream_subscriptions):
+            if collection in needed or collection in self._stream_detach_ids:
+                continue
+            self._stream_detach_ids[collection] = self.root.after(
+                self.stream_idle_timeout_ms,
+                lambda c=collection: self._detach_idle_stream(c)
+            )
+    
+    def _detach_idle_stream(self, collection):
+        self._stream_detach_ids.pop(collection, None)
+        if collection in self.view_streams.get(getattr(self, 'current_view', None), ()):
+            return
+        # Keep the last-known data so the next visit renders at once and revalidates
+        self.unsubscribe_collection(collection, drop_data=False)
+        self.freshness.detached(collection)
+    
+    def _create_stream_callback(self, collection_name, update_methods=None):
+        update_methods = update_methods or []
+        
+        def apply_message(message):
+            applied = False
+            try:
+                data = apply_stream_event(
+                    getattr(self, collection_name, {}),
+                    message.get("path"),
+                    message.get("data"),
+                    message.get("event")
+                )
+                setattr(self, collection_name, data)
                 
-                callback = create_callback(collection, methods)
-                self._listeners[collection] = self.firebase.db.child(collection).stream(callback)
+                index = self.collection_indexes.get(collection_name)
+                if index is not None:
+                    index.refresh(data, changed_children(message.get("path"), message.get("data"), message.get("event")))
+                
+                for method_name in update_methods:
+                    getattr(self, method_name)()
+                applied = True
+                        
+            except Exception as e:
+                error_msg = f"Error in {collection_name} callback: {str(e)}"
+                print(error_msg)
+                messagebox.showerror("Error", error_msg)
+            finally:
+                # Always leave the syncing state, or the badge sticks and begin() refuses every retry
+                if applied:
+                    self.freshness.synced(collection_name)
+                else:
+                    self.freshness.failed(collection_name)
+                self.update_sync_badges()
             
-        except Exception as e:
-            error_msg = f"Error setting up real-time listeners: {str(e)}"
-            print(error_msg)
-            messagebox.showerror("Error", error_msg)
+            if applied and collection_name in self._snapshot_waiting:
+                self._snapshot_waiting.discard(collection_name)
+                if not self._snapshot_waiting:
+                    self.save_snapshot()
+        
+        def callback(message):
+            # Stream events arrive on the stream thread; apply them on the Tk thread.
+            self.root.after(0, lambda: apply_message(message))
+        
+        return callback
+    
+    def revalidate(self, collections, on_done=None):
+        """Fetch ``collections`` in the background and patch them in while views keep showing what they have."""
+        collections = [c for c in collections if self.freshness.begin(c)]
+        if not collections:
+            return
+        self.update_sync_badges()
+        remaining = [len(collections)]
+        
+        def finished():
+            remaining[0] -= 1
+            if remaining[0] == 0 and on_done:
+                on_done()
+        
+        def failed(collection):
+            self.freshness.failed(collection)
+            self.update_sync_badges()
+            # Replace any "Loading" placeholder with the view's normal contents
+            for method_name in self.stream_update_methods.get(collection, []):
+                getattr(self, method_name)()
+            finished()
+        
+        def fetch(collection):
+            try:
+                data = self.firebase.get_data(collection)
+            except Exception as e:
+                print(f"Error revalidating {collection}: {e}")
+                self.root.after(0, lambda: failed(collection))
+                return
+            # Applied like a stream snapshot, so indexes, views and freshness update the same way
+            callback = self._create_stream_callback(collection, self.stream_update_methods.get(collection, []))
+            callback({"event": "put", "path": "/", "data": data})
+            self.root.after(0, finished)
+        
+        for collection in collections:
+            self.executor.submit(fetch, collection)
+    
+    def loading_text(self, collection):
+        """The empty-state message while ``collection`` has no data yet and is still being fetched, else None."""
+        if not getattr(self, collection, None) and self.freshness.is_syncing(collection):
+            return f"Loading {collection}…"
+        return None
+    
+    def add_sync_badge(self, parent, view):
+        """Show whether ``view``'s data is syncing, live or a saved copy, next to its title."""
+        badge = ctk.CTkLabel(parent, text="", font=("Arial", 11), corner_radius=8, height=22)
+        badge.pack(side="left", padx=12)
+        self._sync_badges.append((badge, view))
+        self._render_sync_badge(badge, view)
+    
+    def update_sync_badges(self):
+        self._sync_badges = [(badge, view) for badge, view in self._sync_badges if badge.winfo_exists()]
+        for badge, view in self._sync_badges:
+            self._render_sync_badge(badge, view)
+    
+    def _render_sync_badge(self, badge, view):
+        text, state = self.freshness.describe(self.view_streams.get(view, ()))
+        background, foreground = {
+            "syncing": ("#fef3c7", "#92400e"),
+            "stale": ("#fee2e2", "#991b1b"),
+            "fresh": ("#dcfce7", "#166534")
+        }[state]
+        badge.configure(text=f"  {text}  ", fg_color=background, text_color=foreground)
+    
+    def teardown_realtime_listeners(self):
+        for after_id in self._stream_detach_ids.values():
+            try:
+                self.root.after_cancel(after_id)
+            except Exception:
+                pass
+        self._stream_detach_ids.clear()
+        
+        for collection in list(self._stream_subscriptions):
+            self.unsubscribe_collection(collection, drop_data=False)
+    
+    def get_stream_stats(self):
+        """Return realtime connection health, reconnect counts and downtime."""
+        roots = list(self.streams.stats().values()) if hasattr(self, 'streams') else []
+        if not roots:
+            return {
+                "connected": False,
+                "reconnects": 0,
+                "failed_attempts": 0,
+                "downtime": 0.0,
+                "last_event": None,
+                "last_disconnect": None
+            }
+        
+        # One stream per collection; report them together
+        def latest(key):
+            times = [stats[key] for stats in roots if stats[key] is not None]
+            return max(times) if times else None
+        
+        return {
+            "connected": all(stats["connected"] for stats in roots),
+            "reconnects": sum(stats["reconnects"] for stats in roots),
+            "failed_attempts": sum(stats["failed_attempts"] for stats in roots),
+            "downtime": sum(stats["downtime"] for stats in roots),
+            "last_event": latest("last_event"),
+            "last_disconnect": latest("last_disconnect")
+        }
     
     def cleanup(self):
         try:
-            if hasattr(self, '_listeners'):
-                for name, listener in self._listeners.items():
-                    try:
-                        if callable(listener):
-                            listener()
-                    except Exception as e:
-                        print(f"Error cleaning up {name} listener: {e}")
-                self._listeners.clear()
+            if self.current_user:
+                self.save_snapshot()
+            
+            if hasattr(self, 'streams'):
+                self.teardown_realtime_listeners()
+                try:
+                    self.streams.close()
+                except Exception as e:
+                    print(f"Error closing realtime streams: {e}")
+            
+            if hasattr(self, 'firebase') and hasattr(self.firebase, 'tokens'):
+                self.firebase.tokens.stop()
             
             if hasattr(self, 'executor'):
                 try:
@@ -296,6 +508,9 @@ class AFJROTCApp:
                 except Exception as e:
                     print(f"Error shutting down executor: {e}")
             
+            if hasattr(self, 'thumbnails'):
+                self.thumbnails.shutdown()
+            
             if hasattr(self, 'root'):
                 for after_id in getattr(self, '_after_ids', []):
                     try:
@@ -422,36 +637,202 @@ class AFJROTCApp:
         )
         logout_btn.pack(fill="x", pady=(5, 0))
         
-    def load_logo(self):
-        try:
-            if os.path.exists("logo.png"):
-                return ctk.CTkImage(
-                    light_image=Image.open("logo.png"),
-                    dark_image=Image.open("logo.png"),
-                    size=(100, 100)
-                )
-            return None
-        except Exception as e:
-            print(f"Error loading logo: {e}")
-            return None
+    def load_logo(self, size=100):
+        return self.images.image("logo.png", size)
 
     def show_startup_screen(self):
         self.loading_frame.pack(fill="both", expand=True)
         self.loading_label.pack(expand=True)
         
-        self.root.after(1000, self.check_session)
+        self.root.after(0, self.start_backend)
+
+    def start_backend(self):
+        # Paint the loading screen before importing the Firebase stack
+        self.root.update()
+        
+        from firebase_config import FirebaseManager
+        
+        self.firebase = FirebaseManager()
+        self.streams = StreamManager(
+            self.firebase.db,
+            token_provider=self.firebase.tokens.current_token,
+            new_database=self.firebase.new_database
+        )
+        self.firebase.tokens.add_listener(lambda token: self.streams.reconnect())
+        self.thumbnails = ThumbnailService(self.firebase)
+        self.hours_ledger = HoursLedger(self.firebase)
+        self.fundraiser_ledger = FundraiserLedger(self.firebase)
+        
+        self.check_session()
 
     def check_session(self):
+        stored_user = self.firebase.tokens.stored_profile()
+        if not stored_user:
+            self.loading_frame.pack_forget()
+            self.show_login()
+            self.report_time_to_interactive()
+            return
+        
+        # Render the last known dashboard immediately; the token refresh runs in the background
+        self.current_user = stored_user
+        self._session_pending = True
+        self.show_cached_dashboard()
+        self.report_time_to_interactive()
+        
+        self.executor.submit(self._restore_session_in_background)
+    
+    def _restore_session_in_background(self, attempt=0):
         try:
-            user = self.firebase.auth.current_user
-            if user:
-                self.current_user = user
-                self.after_login()
-            else:
-                self.show_login()
+            user = self.firebase.restore_session()
         except Exception as e:
-            print(f"Session check error: {e}")
+            # Only transient failures get here (a rejected token returns None): keep the
+            # cached dashboard and try again later
+            delay_ms = min(60000, 2000 * (2 ** attempt))
+            print(f"Session restore failed, retrying in {delay_ms // 1000}s: {e}")
+            self.root.after(delay_ms, lambda: self.executor.submit(self._restore_session_in_background, attempt + 1))
+            return
+        
+        self.root.after(0, lambda: self._on_session_restored(user))
+    
+    def _on_session_restored(self, user):
+        self._session_pending = False
+        
+        if not user:
+            # The stored session was revoked or expired; fall back to the login form
+            self.clear_snapshot()
+            self.current_user = None
+            if self.main_container:
+                self.main_container.destroy()
+                self.main_container = None
+                self.content_frame = None
             self.show_login()
+            return
+        
+        self.current_user = user
+        self.load_initial_data()
+        self.setup_realtime_listeners()
+        self.attach_view_streams(getattr(self, 'current_view', 'dashboard'))
+    
+    def show_cached_dashboard(self):
+        self.restore_snapshot()
+        
+        self.loading_frame.pack_forget()
+        if not self.main_container:
+            self.create_main_ui()
+        
+        self.update_upcoming_events()
+        self.show_dashboard()
+    
+    def snapshot_path(self):
+        uid = (self.current_user or {}).get('uid') or (self.current_user or {}).get('localId')
+        if not uid:
+            return None
+        return os.path.join(user_data_dir(), f"snapshot-{uid}.bin")
+    
+    def restore_snapshot(self):
+        """Map the signed-in user's local snapshot; records decode only when a view reads them."""
+        path = self.snapshot_path()
+        if not path:
+            return
+        if self.snapshot is None or self.snapshot.path != path:
+            self.snapshot = SnapshotStore(path)
+        
+        collections = self.snapshot.open()
+        self.freshness.restore(dict(collections.get("_freshness") or {}))
+        for collection, data in collections.items():
+            if collection in self.collections and not getattr(self, collection, None):
+                setattr(self, collection, data)
+    
+    def save_snapshot(self):
+        path = self.snapshot_path()
+        if not path or self._session_pending:
+            return
+        if self.snapshot is None or self.snapshot.path != path:
+            self.snapshot = SnapshotStore(path)
+        try:
+            collections = {
+                collection: getattr(self, collection)
+                for collection in self.collections
+                if isinstance(getattr(self, collection, None), dict)
+            }
+            collections["_freshness"] = self.freshness.export()
+            self.snapshot.save(collections)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error saving snapshot: {e}")
+    
+    def clear_snapshot(self):
+        if self.snapshot is not None:
+            self.snapshot.clear()
+            self.snapshot = None
+        self.freshness.forget()
+        uid = (self.current_user or {}).get('uid') or (self.current_user or {}).get('localId')
+        if uid:
+            # Also drop the JSON dashboard cache written by earlier versions
+            for name in (f"snapshot-{uid}.bin", f"dashboard-{uid}.json"):
+                try:
+                    os.remove(os.path.join(user_data_dir(), name))
+                except OSError:
+                    pass
+
+    def report_time_to_interactive(self):
+        if self.time_to_interactive is not None:
+            return
+        
+        def report():
+            self.time_to_interactive = time.perf_counter() - _STARTUP_STARTED
+            screen = "dashboard" if self.current_user else "login"
+            print(f"Time to interactive ({screen}): {self.time_to_interactive * 1000:.0f} ms")
+        
+        # Measured once the first screen has been laid out and drawn
+        self.root.after_idle(report)
+
+    def after_login(self):
+        if self.auth_frame:
+            self.auth_frame.destroy()
+            self.auth_frame = None
+        self.loading_frame.pack_forget()
+        
+        if not self.main_container:
+            self.create_main_ui()
+        
+        self.restore_snapshot()
+        self.load_initial_data()
+        self.setup_realtime_listeners()
+        self.show_dashboard()
+
+    def clear_auth_frame(self):
+        if self.auth_frame:
+            self.auth_frame.destroy()
+            self.auth_frame = None
+
+    def show_loading(self, message="Loading..."):
+        self.loading_label.configure(text=message)
+        self.loading_frame.pack(fill="both", expand=True)
+        self.loading_label.pack(expand=True)
+        self.loading_frame.lift()
+        self.root.update_idletasks()
+
+    def hide_loading(self):
+        self.loading_frame.pack_forget()
+        self.loading_label.configure(text="Loading...")
+
+    def handle_login(self):
+        email = self.email_entry.get().strip()
+        password = self.password_entry.get()
+        if not email or not password:
+            messagebox.showerror("Error", "Please enter your email and password")
+            return
+
+        try:
+            self.show_loading("Signing in...")
+            self.current_user = self.firebase.sign_in_with_email_password(email, password)
+        except Exception as e:
+            messagebox.showerror("Sign In Failed", str(e))
+            return
+        finally:
+            self.hide_loading()
+
+        self.after_login()
 
     def show_login(self):
         """Display the modern login screen."""
@@ -632,414 +1013,350 @@ class AFJROTCApp:
         # Bind Enter key to login
         self.password_entry.bind("<Return>", lambda e: self.handle_login())
 
-def show_signup(self):
-    """Display the modern signup screen."""
-    self.clear_auth_frame()
-    
-    # Main auth container with subtle gradient background
-    self.auth_frame = ctk.CTkFrame(self.root, fg_color=self.bg_color)
-    self.auth_frame.pack(fill="both", expand=True)
-    
-    # Center container for the signup card
-    center_frame = ctk.CTkFrame(self.auth_frame, fg_color="transparent")
-    center_frame.place(relx=0.5, rely=0.5, anchor="center")
-    
-    # Signup card with subtle shadow
-    card = ctk.CTkFrame(
-        center_frame, 
-        fg_color=self.card_bg,
-        corner_radius=self.radius_xl,
-        border_width=1,
-        border_color=self.border_color
-    )
-    card.pack(padx=self.space_xl, pady=self.space_xl, ipadx=self.space_xl, ipady=self.space_xl)
-    
-    # Logo and welcome section
-    header_frame = ctk.CTkFrame(card, fg_color="transparent")
-    header_frame.pack(pady=(0, self.space_xl))
-    
-    # Logo with circular background
-    if hasattr(self, 'logo_img'):
-        logo_bg = ctk.CTkFrame(
-            header_frame, 
-            fg_color=f"{self.primary_color}15",
-            width=80, 
-            height=80,
-            corner_radius=40
+    def show_signup(self):
+        """Display the modern signup screen."""
+        self.clear_auth_frame()
+        
+        # Main auth container with subtle gradient background
+        self.auth_frame = ctk.CTkFrame(self.root, fg_color=self.bg_color)
+        self.auth_frame.pack(fill="both", expand=True)
+        
+        # Center container for the signup card
+        center_frame = ctk.CTkFrame(self.auth_frame, fg_color="transparent")
+        center_frame.place(relx=0.5, rely=0.5, anchor="center")
+        
+        # Signup card with subtle shadow
+        card = ctk.CTkFrame(
+            center_frame, 
+            fg_color=self.card_bg,
+            corner_radius=self.radius_xl,
+            border_width=1,
+            border_color=self.border_color
         )
-        logo_bg.pack(pady=(0, self.space_md))
-        logo_bg.pack_propagate(False)
+        card.pack(padx=self.space_xl, pady=self.space_xl, ipadx=self.space_xl, ipady=self.space_xl)
         
-        logo_label = ctk.CTkLabel(
-            logo_bg, 
-            image=self.logo_img, 
-            text="",
-            fg_color="transparent"
+        # Logo and welcome section
+        header_frame = ctk.CTkFrame(card, fg_color="transparent")
+        header_frame.pack(pady=(0, self.space_xl))
+        
+        # Logo with circular background
+        if hasattr(self, 'logo_img'):
+            logo_bg = ctk.CTkFrame(
+                header_frame, 
+                fg_color=f"{self.primary_color}15",
+                width=80, 
+                height=80,
+                corner_radius=40
+            )
+            logo_bg.pack(pady=(0, self.space_md))
+            logo_bg.pack_propagate(False)
+            
+            logo_label = ctk.CTkLabel(
+                logo_bg, 
+                image=self.logo_img, 
+                text="",
+                fg_color="transparent"
+            )
+            logo_label.pack(expand=True)
+        
+        # Title and subtitle
+        title_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
+        title_frame.pack()
+        
+        ctk.CTkLabel(
+            title_frame,
+            text="Create Account",
+            font=self.title_font,
+            text_color=self.primary_color
+        ).pack(pady=(0, self.space_xs))
+        
+        ctk.CTkLabel(
+            title_frame,
+            text="Join AFJROTC AMS today",
+            font=self.subtitle_font,
+            text_color=self.text_secondary
+        ).pack()
+        
+        # Signup form
+        form_frame = ctk.CTkFrame(card, fg_color="transparent")
+        form_frame.pack(fill="both", expand=True, pady=(self.space_xl, 0))
+        
+        # Name field
+        name_container = ctk.CTkFrame(form_frame, fg_color="transparent")
+        name_container.pack(fill="x", pady=(0, self.space_md))
+        
+        ctk.CTkLabel(
+            name_container, 
+            text="Full Name", 
+            font=self.small_text,
+            text_color=self.text_primary,
+            anchor="w"
+        ).pack(fill="x", pady=(0, self.space_xs))
+        
+        self.signup_name = ctk.CTkEntry(
+            name_container,
+            placeholder_text="Enter your full name",
+            width=320,
+            height=self.input_height,
+            font=self.text_font,
+            fg_color="#ffffff",
+            border_color=self.border_color,
+            border_width=1,
+            text_color=self.text_primary,
+            corner_radius=self.radius_md,
+            placeholder_text_color=self.text_light
         )
-        logo_label.pack(expand=True)
-    
-    # Title and subtitle
-    title_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
-    title_frame.pack()
-    
-    ctk.CTkLabel(
-        title_frame,
-        text="Create Account",
-        font=self.title_font,
-        text_color=self.primary_color
-    ).pack(pady=(0, self.space_xs))
-    
-    ctk.CTkLabel(
-        title_frame,
-        text="Join AFJROTC AMS today",
-        font=self.subtitle_font,
-        text_color=self.text_secondary
-    ).pack()
-    
-    # Signup form
-    form_frame = ctk.CTkFrame(card, fg_color="transparent")
-    form_frame.pack(fill="both", expand=True, pady=(self.space_xl, 0))
-    
-    # Name field
-    name_container = ctk.CTkFrame(form_frame, fg_color="transparent")
-    name_container.pack(fill="x", pady=(0, self.space_md))
-    
-    ctk.CTkLabel(
-        name_container, 
-        text="Full Name", 
-        font=self.small_text,
-        text_color=self.text_primary,
-        anchor="w"
-    ).pack(fill="x", pady=(0, self.space_xs))
-    
-    self.signup_name = ctk.CTkEntry(
-        name_container,
-        placeholder_text="Enter your full name",
-        width=320,
-        height=self.input_height,
-        font=self.text_font,
-        fg_color="#ffffff",
-        border_color=self.border_color,
-        border_width=1,
-        text_color=self.text_primary,
-        corner_radius=self.radius_md,
-        placeholder_text_color=self.text_light
-    )
-    self.signup_name.pack(fill="x")
-    
-    # Email field
-    email_container = ctk.CTkFrame(form_frame, fg_color="transparent")
-    email_container.pack(fill="x", pady=(0, self.space_md))
-    
-    ctk.CTkLabel(
-        email_container, 
-        text="Email Address", 
-        font=self.small_text,
-        text_color=self.text_primary,
-        anchor="w"
-    ).pack(fill="x", pady=(0, self.space_xs))
-    
-    self.signup_email = ctk.CTkEntry(
-        email_container,
-        placeholder_text="your.email@example.com",
-        width=320,
-        height=self.input_height,
-        font=self.text_font,
-        fg_color="#ffffff",
-        border_color=self.border_color,
-        border_width=1,
-        text_color=self.text_primary,
-        corner_radius=self.radius_md,
-        placeholder_text_color=self.text_light
-    )
-    self.signup_email.pack(fill="x")
-    
-    # Password field
-    password_container = ctk.CTkFrame(form_frame, fg_color="transparent")
-    password_container.pack(fill="x", pady=(0, self.space_md))
-    
-    ctk.CTkLabel(
-        password_container, 
-        text="Password", 
-        font=self.small_text,
-        text_color=self.text_primary,
-        anchor="w"
-    ).pack(fill="x", pady=(0, self.space_xs))
-    
-    self.signup_password = ctk.CTkEntry(
-        password_container,
-        placeholder_text="Create a strong password",
-        show="•",
-        width=320,
-        height=self.input_height,
-        font=self.text_font,
-        fg_color="#ffffff",
-        border_color=self.border_color,
-        border_width=1,
-        text_color=self.text_primary,
-        corner_radius=self.radius_md,
-        placeholder_text_color=self.text_light
-    )
-    self.signup_password.pack(fill="x")
-    
-    # Confirm Password field
-    confirm_container = ctk.CTkFrame(form_frame, fg_color="transparent")
-    confirm_container.pack(fill="x", pady=(0, self.space_xl))
-    
-    ctk.CTkLabel(
-        confirm_container, 
-        text="Confirm Password", 
-        font=self.small_text,
-        text_color=self.text_primary,
-        anchor="w"
-    ).pack(fill="x", pady=(0, self.space_xs))
-    
-    self.signup_confirm_password = ctk.CTkEntry(
-        confirm_container,
-        placeholder_text="Confirm your password",
-        show="•",
-        width=320,
-        height=self.input_height,
-        font=self.text_font,
-        fg_color="#ffffff",
-        border_color=self.border_color,
-        border_width=1,
-        text_color=self.text_primary,
-        corner_radius=self.radius_md,
-        placeholder_text_color=self.text_light
-    )
-    self.signup_confirm_password.pack(fill="x")
-    
-    # Sign Up button
-    signup_btn = ctk.CTkButton(
-        form_frame,
-        text="Create Account",
-        command=self.handle_signup,
-        width="100%",
-        height=self.button_height,
-        font=self.button_font,
-        fg_color=self.primary_color,
-        hover_color=self.primary_dark,
-        text_color="#ffffff",
-        corner_radius=self.radius_md,
-        border_spacing=self.space_md
-    )
-    signup_btn.pack(pady=(self.space_xl, self.space_md))
-    
-    # Login prompt
-    login_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
-    login_frame.pack()
-    
-    ctk.CTkLabel(
-        login_frame,
-        text="Already have an account?",
-        font=self.small_text,
-        text_color=self.text_secondary
-    ).pack(side="left")
-    
-    login_link = ctk.CTkLabel(
-        login_frame,
-        text=" Sign in",
-        font=(self.small_text[0], self.small_text[1], "bold"),
-        text_color=self.primary_color,
-        cursor="hand2"
-    )
-    login_link.pack(side="left")
-    login_link.bind("<Button-1>", lambda e: self.show_login())
-    
-    # Set focus to name field after a short delay
-    self.root.after(100, lambda: self.signup_name.focus())
-    
-    # Bind Enter key to signup
-    self.signup_confirm_password.bind("<Return>", lambda e: self.handle_signup())
-
-def handle_signup(self):
-    """Handle user signup."""
-    name = self.signup_name.get().strip()
-    email = self.signup_email.get().strip()
-    password = self.signup_password.get()
-    confirm_password = self.signup_confirm_password.get()
-    
-    # Basic validation
-    if not name or not email or not password or not confirm_password:
-        messagebox.showerror("Error", "All fields are required")
-        return
-        
-    if password != confirm_password:
-        messagebox.showerror("Error", "Passwords do not match")
-        return
-        
-    if len(password) < 8:
-        messagebox.showerror("Error", "Password must be at least 8 characters long")
-        return
-    
-    try:
-        # Show loading state
-        self.show_loading("Creating your account...")
-        
-        # Create user with Firebase Authentication
-        user = self.firebase.auth.create_user_with_email_and_password(email, password)
-        
-        # Create user document in Firestore
-        user_data = {
-            'uid': user['localId'],
-            'email': email,
-            'displayName': name,
-            'createdAt': datetime.now().isoformat(),
-            'role': 'user'  # Default role
-        }
+        self.signup_name.pack(fill="x")
         
-        # Save additional user data to Firestore
-        self.firebase.db.child("users").child(user['localId']).set(user_data)
+        # Email field
+        email_container = ctk.CTkFrame(form_frame, fg_color="transparent")
+        email_container.pack(fill="x", pady=(0, self.space_md))
         
-        # Sign in the user
-        self.current_user = user
-        self.after_login()
+        ctk.CTkLabel(
+            email_container, 
+            text="Email Address", 
+            font=self.small_text,
+            text_color=self.text_primary,
+            anchor="w"
+        ).pack(fill="x", pady=(0, self.space_xs))
         
-    except Exception as e:
-        error_msg = str(e)
-        if "EMAIL_EXISTS" in error_msg:
-            messagebox.showerror("Error", "An account with this email already exists")
-        elif "INVALID_EMAIL" in error_msg:
-            messagebox.showerror("Error", "Please enter a valid email address")
-        elif "WEAK_PASSWORD" in error_msg:
-            messagebox.showerror("Error", "Password is too weak")
-        else:
-            messagebox.showerror("Error", f"Failed to create account: {error_msg}")
-    finally:
-        self.hide_loading()
-
-def logout(self):
-    """Handle user logout process."""
-    try:
-        if hasattr(self, 'current_user') and self.current_user:
-            # Log analytics event if analytics is available
-            if hasattr(self, 'analytics'):
-                try:
-                    self.analytics.capture(
-                        event_name='user_logout',
-                        distinct_id=self.current_user.get('email', 'unknown'),
-                        properties={
-                            'email': self.current_user.get('email'),
-                            'logout_time': datetime.now().isoformat(),
-                            'user_id': self.current_user.get('localId')
-                        }
-                    )
-                except Exception as analytics_error:
-                    print(f"Error logging analytics for logout: {analytics_error}")
-            
-            # Clear user data and reset UI
-            self.current_user = None
-            
-            # Clear any existing content
-            self.clear_content_frame()
-            
-            # Show login screen
-            self.show_login()
-            
-            # Clear any Firebase auth state
-            if hasattr(self, 'firebase') and hasattr(self.firebase, 'auth'):
-                self.firebase.auth.current_user = None
-            
-    except Exception as e:
-        print(f"Error during logout: {e}")
-        messagebox.showerror("Logout Error", "An error occurred during logout. Please try again.")
+        self.signup_email = ctk.CTkEntry(
+            email_container,
+            placeholder_text="your.email@example.com",
+            width=320,
+            height=self.input_height,
+            font=self.text_font,
+            fg_color="#ffffff",
+            border_color=self.border_color,
+            border_width=1,
+            text_color=self.text_primary,
+            corner_radius=self.radius_md,
+            placeholder_text_color=self.text_light
+        )
+        self.signup_email.pack(fill="x")
         
-        # Try to log the error to analytics
-        try:
-            if hasattr(self, 'analytics'):
-                self.analytics.capture(
-                    event_name='logout_error',
-                    distinct_id=self.current_user.get('email', 'unknown') if hasattr(self, 'current_user') and self.current_user else 'unknown',
-                    properties={
-                        'error': str(e),
-                        'timestamp': datetime.now().isoformat()
-                    },
-                    process_person=False
-                )
-        except Exception as analytics_error:
-            print(f"Error logging analytics for logout error: {analytics_error}")
+        # Password field
+        password_container = ctk.CTkFrame(form_frame, fg_color="transparent")
+        password_container.pack(fill="x", pady=(0, self.space_md))
         
-        self.load_initial_data()
+        ctk.CTkLabel(
+            password_container, 
+            text="Password", 
+            font=self.small_text,
+            text_color=self.text_primary,
+            anchor="w"
+        ).pack(fill="x", pady=(0, self.space_xs))
         
-        self.setup_realtime_listeners()
+        self.signup_password = ctk.CTkEntry(
+            password_container,
+            placeholder_text="Create a strong password",
+            show="•",
+            width=320,
+            height=self.input_height,
+            font=self.text_font,
+            fg_color="#ffffff",
+            border_color=self.border_color,
+            border_width=1,
+            text_color=self.text_primary,
+            corner_radius=self.radius_md,
+            placeholder_text_color=self.text_light
+        )
+        self.signup_password.pack(fill="x")
         
-    def load_initial_data(self):
-        try:
-            cadets = self.firebase.db.child("cadets").get().val() or {}
-            self.cadets = cadets
-            
-            events = self.firebase.db.child("events").get().val() or {}
-            self.events = events
+        # Confirm Password field
+        confirm_container = ctk.CTkFrame(form_frame, fg_color="transparent")
+        confirm_container.pack(fill="x", pady=(0, self.space_xl))
+        
+        ctk.CTkLabel(
+            confirm_container, 
+            text="Confirm Password", 
+            font=self.small_text,
+            text_color=self.text_primary,
+            anchor="w"
+        ).pack(fill="x", pady=(0, self.space_xs))
+        
+        self.signup_confirm_password = ctk.CTkEntry(
+            confirm_container,
+            placeholder_text="Confirm your password",
+            show="•",
+            width=320,
+            height=self.input_height,
+            font=self.text_font,
+            fg_color="#ffffff",
+            border_color=self.border_color,
+            border_width=1,
+            text_color=self.text_primary,
+            corner_radius=self.radius_md,
+            placeholder_text_color=self.text_light
+        )
+        self.signup_confirm_password.pack(fill="x")
+        
+        # Sign Up button
+        signup_btn = ctk.CTkButton(
+            form_frame,
+            text="Create Account",
+            command=self.handle_signup,
+            width="100%",
+            height=self.button_height,
+            font=self.button_font,
+            fg_color=self.primary_color,
+            hover_color=self.primary_dark,
+            text_color="#ffffff",
+            corner_radius=self.radius_md,
+            border_spacing=self.space_md
+        )
+        signup_btn.pack(pady=(self.space_xl, self.space_md))
+        
+        # Login prompt
+        login_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
+        login_frame.pack()
+        
+        ctk.CTkLabel(
+            login_frame,
+            text="Already have an account?",
+            font=self.small_text,
+            text_color=self.text_secondary
+        ).pack(side="left")
+        
+        login_link = ctk.CTkLabel(
+            login_frame,
+            text=" Sign in",
+            font=(self.small_text[0], self.small_text[1], "bold"),
+            text_color=self.primary_color,
+            cursor="hand2"
+        )
+        login_link.pack(side="left")
+        login_link.bind("<Button-1>", lambda e: self.show_login())
+        
+        # Set focus to name field after a short delay
+        self.root.after(100, lambda: self.signup_name.focus())
+        
+        # Bind Enter key to signup
+        self.signup_confirm_password.bind("<Return>", lambda e: self.handle_signup())
+
+    def handle_signup(self):
+        """Handle user signup."""
+        name = self.signup_name.get().strip()
+        email = self.signup_email.get().strip()
+        password = self.signup_password.get()
+        confirm_password = self.signup_confirm_password.get()
+        
+        # Basic validation
+        if not name or not email or not password or not confirm_password:
+            messagebox.showerror("Error", "All fields are required")
+            return
             
-            jobs = self.firebase.db.child("jobs").get().val() or {}
-            self.jobs = jobs
+        if password != confirm_password:
+            messagebox.showerror("Error", "Passwords do not match")
+            return
             
-            fundraisers = self.firebase.db.child("fundraisers").get().val() or {}
-            self.fundraisers = fundraisers
+        if len(password) < 8:
+            messagebox.showerror("Error", "Password must be at least 8 characters long")
+            return
+        
+        try:
+            # Show loading state
+            self.show_loading("Creating your account...")
+            
+            # Create user with Firebase Authentication
+            user = self.firebase.auth.create_user_with_email_and_password(email, password)
+            
+            # Create user document in Firestore
+            user_data = {
+                'uid': user['localId'],
+                'email': email,
+                'displayName': name,
+                'createdAt': datetime.now().isoformat(),
+                'role': 'user'  # Default role
+            }
             
-            contacts = self.firebase.db.child("contacts").get().val() or {}
-            self.contacts = contacts
+            # Save additional user data to Firestore
+            self.firebase.set_data(f"users/{user['localId']}", user_data)
             
-            self.update_upcoming_events()
-            self.update_dashboard()
+            # Sign in the user
+            self.current_user = user
+            self.after_login()
             
         except Exception as e:
-            print(f"Error loading initial data: {e}")
-            messagebox.showerror("Error", f"Failed to load data: {e}")
-    
-    def setup_realtime_listeners(self):
+            error_msg = str(e)
+            if "EMAIL_EXISTS" in error_msg:
+                messagebox.showerror("Error", "An account with this email already exists")
+            elif "INVALID_EMAIL" in error_msg:
+                messagebox.showerror("Error", "Please enter a valid email address")
+            elif "WEAK_PASSWORD" in error_msg:
+                messagebox.showerror("Error", "Password is too weak")
+            else:
+                messagebox.showerror("Error", f"Failed to create account: {error_msg}")
+        finally:
+            self.hide_loading()
+
+    def logout(self):
+        """Handle user logout process."""
         try:
-            def cadets_callback(message):
-                try:
-                    if message["event"] == "put" or message["event"] == "patch":
-                        data = message["data"] or {}
-                        if isinstance(data, list):
-                            self.cadets = {item.get('id', idx): item for idx, item in enumerate(data) if item}
-                        elif data and not any(key.startswith('-') for key in data.keys()):
-                            self.cadets = {'direct': data}
-                        else:
-                            self.cadets = data
-                            
-                        self.update_cadets_display()
-                        self.update_dashboard()
-                except Exception as e:
-                    print(f"Error in cadets_callback: {e}")
-            
-            self.firebase.db.child("cadets").stream(cadets_callback)
-            
-            def events_callback(message):
-                if message["event"] == "put" or message["event"] == "patch":
-                    self.events = message["data"] or {}
-                    self.update_calendar_display()
-                    self.update_upcoming_events()
-                    self.update_dashboard()
-            
-            self.firebase.db.child("events").stream(events_callback)
-            
-            def jobs_callback(message):
-                if message["event"] == "put" or message["event"] == "patch":
-                    self.jobs = message["data"] or {}
-                    self.update_dashboard()
-            
-            self.firebase.db.child("jobs").stream(jobs_callback)
-            
-            def fundraisers_callback(message):
-                if message["event"] == "put" or message["event"] == "patch":
-                    self.fundraisers = message["data"] or {}
-                    self.update_dashboard()
+            if hasattr(self, 'current_user') and self.current_user:
+                # Log analytics event if analytics is available
+                if hasattr(self, 'analytics'):
+                    try:
+                        self.analytics.capture(
+                            event_name='user_logout',
+                            distinct_id=self.current_user.get('email', 'unknown'),
+                            properties={
+                                'email': self.current_user.get('email'),
+                                'logout_time': datetime.now().isoformat(),
+                                'user_id': self.current_user.get('localId')
+                            }
+                        )
+                    except Exception as analytics_error:
+                        print(f"Error logging analytics for logout: {analytics_error}")
+                
+                # Clear user data and reset UI
+                self.clear_snapshot()
+                self.current_user = None
+                self.dashboard_counts = {}
+                self.dashboard_events = {}
+                
+                # Drop realtime subscriptions for the signed-out user
+                if hasattr(self, 'streams'):
+                    self.teardown_realtime_listeners()
+                
+                # Clear any existing content
+                self.clear_content_frame()
+                
+                # Show login screen
+                self.show_login()
+                
+                # Clear any Firebase auth state and the persisted session
+                if hasattr(self, 'firebase') and hasattr(self.firebase, 'tokens'):
+                    self.firebase.sign_out()
+                
+        except Exception as e:
+            print(f"Error during logout: {e}")
+            messagebox.showerror("Logout Error", "An error occurred during logout. Please try again.")
             
-            self.firebase.db.child("fundraisers").stream(fundraisers_callback)
+            # Try to log the error to analytics
+            try:
+                if hasattr(self, 'analytics'):
+                    self.analytics.capture(
+                        event_name='logout_error',
+                        distinct_id=self.current_user.get('email', 'unknown') if hasattr(self, 'current_user') and self.current_user else 'unknown',
+                        properties={
+                            'error': str(e),
+                            'timestamp': datetime.now().isoformat()
+                        },
+                        process_person=False
+                    )
+            except Exception as analytics_error:
+                print(f"Error logging analytics for logout error: {analytics_error}")
             
-            def contacts_callback(message):
-                if message["event"] == "put" or message["event"] == "patch":
-                    self.contacts = message["data"] or {}
+            self.load_initial_data()
             
-            self.firebase.db.child("contacts").stream(contacts_callback)
+            self.setup_realtime_listeners()
             
-        except Exception as e:
-            print(f"Error setting up real-time listeners: {e}")
-            messagebox.showerror("Error", f"Failed to set up real-time updates: {e}")
+    def load_initial_data(self):
+        # Views already show the snapshot; the dashboard streams' first events refresh it,
+        # and the snapshot is saved again once all of them have arrived
+        self.update_upcoming_events()
+        self._snapshot_waiting = set(self.view_streams["dashboard"])
     
     def create_main_ui(self):
         self.main_container = ctk.CTkFrame(self.root, fg_color="#f5f5f5")
@@ -1053,6 +1370,7 @@ def logout(self):
     def show_calendar(self):
         self.clear_content_frame()
         self.current_view = 'calendar'
+        self.attach_view_streams('calendar')
         self.calendar_frame = ctk.CTkFrame(self.content_frame, fg_color="white")
         self.calendar_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
@@ -1060,6 +1378,7 @@ def logout(self):
         header_frame.pack(fill="x")
         
         ctk.CTkLabel(header_frame, text="Events Calendar", font=("Arial Bold", 24), text_color=self.primary_color).pack(side="left")
+        self.add_sync_badge(header_frame, 'calendar')
         add_event_btn = ctk.CTkButton(header_frame, text="+ Add Event", command=self.add_event_dialog, fg_color=self.success_color, hover_color="#45a049")
         add_event_btn.pack(side="right")
         
@@ -1101,12 +1420,13 @@ def logout(self):
                 
                 row += 1
         else:
-            ctk.CTkLabel(self.calendar_list_frame, text="No events scheduled.", font=("Arial", 14), text_color="#555555").pack(pady=20)
+            ctk.CTkLabel(self.calendar_list_frame, text=self.loading_text('events') or "No events scheduled.", font=("Arial", 14), text_color="#555555").pack(pady=20)
 
         
     def show_dashboard(self):
         self.clear_content_frame()
         self.current_view = 'dashboard'
+        self.attach_view_streams('dashboard')
         self.dashboard_frame = ctk.CTkFrame(self.content_frame, fg_color="white")
         self.dashboard_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
@@ -1121,11 +1441,12 @@ def logout(self):
             font=("Arial Bold", 24), 
             text_color=self.primary_color
         ).pack(side="left")
+        self.add_sync_badge(header_frame, 'dashboard')
         
         refresh_btn = ctk.CTkButton(
             header_frame, 
             text="🔄 Refresh", 
-            command=self.update_dashboard,
+            command=lambda: (self.revalidate(self.view_streams["dashboard"]), self.refresh_dashboard_aggregates()),
             width=100,
             fg_color=self.accent_color,
             hover_color="#7ba4d1"
@@ -1189,6 +1510,24 @@ def logout(self):
         )
         self.fundraisers_count_label.pack(pady=(0, 10))
         
+        hours_card = ctk.CTkFrame(stats_frame, fg_color="#f5f5f5", corner_radius=10)
+        hours_card.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+        
+        ctk.CTkLabel(
+            hours_card, 
+            text="CS Hours", 
+            font=("Arial Bold", 16),
+            text_color=self.primary_color
+        ).pack(pady=(10, 5))
+        
+        self.cs_hours_label = ctk.CTkLabel(
+            hours_card, 
+            text="0", 
+            font=("Arial Bold", 24),
+            text_color="#333333"
+        )
+        self.cs_hours_label.pack(pady=(0, 10))
+        
         activity_frame = ctk.CTkFrame(self.dashboard_frame, fg_color="white")
         activity_frame.pack(fill="both", expand=True, pady=(10, 0))
         
@@ -1207,10 +1546,79 @@ def logout(self):
         self.activity_list.pack(fill="both", expand=True)
         
         self.update_dashboard()
+        self.refresh_dashboard_aggregates()
+    
+    def refresh_dashboard_aggregates(self):
+        """Fetch the dashboard's counts and upcoming events with bounded reads instead of whole-collection streams."""
+        if not self.current_user or self._session_pending or self._dashboard_fetching:
+            return
+        self._dashboard_fetching = True
+        today = datetime.now().date().isoformat()
+        
+        def bounded(collection, order_by):
+            try:
+                return dict(self.firebase.query(collection, order_by=order_by, start_at=today,
+                                                limit=self.dashboard_query_limit) or {})
+            except Exception as e:
+                # e.g. no ".indexOn" rule for order_by; keep the last-known value
+                print(f"Error reading {collection} for the dashboard: {e}")
+                return None
+        
+        def work():
+            counts = {}
+            try:
+                counts["cadets"] = self.firebase.count("cadets")
+            except Exception:
+                pass
+            events = bounded("events", "date")
+            fundraisers = bounded("fundraisers", "endDate")
+            
+            def apply():
+                self._dashboard_fetching = False
+                if events is not None:
+                    self.dashboard_events = events
+                if fundraisers is not None:
+                    counts["fundraisers"] = self._active_fundraiser_count(fundraisers)
+                self.dashboard_counts.update(counts)
+                self.update_upcoming_events()
+                self.update_dashboard()
+            self.root.after(0, apply)
+        
+        self.executor.submit(work)
+    
+    @staticmethod
+    def _active_fundraiser_count(fundraisers):
+        today = datetime.now().date().isoformat()
+        return sum(
+            1 for fundraiser in fundraisers.values()
+            if isinstance(fundraiser, dict) and str(fundraiser.get('status', '')).lower() == 'active'
+            and str(fundraiser.get('endDate', '')) >= today
+        )
+    
+    def _update_dashboard_counts(self):
+        if not hasattr(self, 'cadets_count_label') or not self.cadets_count_label.winfo_exists():
+            return
+        
+        # A collection streamed for another view is exact; otherwise use the bounded reads
+        if "cadets" in self._stream_subscriptions:
+            cadets = len(self.cadets)
+        else:
+            cadets = self.dashboard_counts.get("cadets", len(self.cadets))
+        if "fundraisers" in self._stream_subscriptions or "fundraisers" not in self.dashboard_counts:
+            fundraisers = self._active_fundraiser_count(self.fundraisers or {})
+        else:
+            fundraisers = self.dashboard_counts["fundraisers"]
+        totals = self.cs_hours_totals if isinstance(self.cs_hours_totals, dict) else {}
+        
+        self.cadets_count_label.configure(text=str(cadets))
+        self.events_count_label.configure(text=str(len(self.upcoming_events)))
+        self.fundraisers_count_label.configure(text=str(fundraisers))
+        self.cs_hours_label.configure(text=f"{float(totals.get('all') or 0):g}")
 
     def show_cadets(self):
         self.clear_content_frame()
         self.current_view = 'cadets'
+        self.attach_view_streams('cadets')
         self.cadets_frame = ctk.CTkFrame(self.content_frame, fg_color="white")
         self.cadets_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
@@ -1223,6 +1631,7 @@ def logout(self):
             font=("Arial Bold", 24), 
             text_color=self.primary_color
         ).pack(side="left")
+        self.add_sync_badge(header_frame, 'cadets')
         
         add_btn = ctk.CTkButton(
             header_frame, 
@@ -1233,6 +1642,24 @@ def logout(self):
         )
         add_btn.pack(side="right")
         
+        ctk.CTkButton(
+            header_frame,
+            text="Import...",
+            command=self.import_roster_dialog,
+            width=90,
+            fg_color=self.secondary_color,
+            hover_color=self.primary_color
+        ).pack(side="right", padx=(0, 10))
+        
+        ctk.CTkButton(
+            header_frame,
+            text="Enter Hours",
+            command=self.bulk_hours_dialog,
+            width=100,
+            fg_color=self.secondary_color,
+            hover_color=self.primary_color
+        ).pack(side="right", padx=(0, 10))
+        
         filter_frame = ctk.CTkFrame(self.cadets_frame, fg_color="white")
         filter_frame.pack(fill="x", pady=(10, 0))
         
@@ -1283,6 +1710,7 @@ def logout(self):
     def show_uniforms(self):
         self.clear_content_frame()
         self.current_view = 'uniforms'
+        self.attach_view_streams('uniforms')
         self.uniforms_frame = ctk.CTkFrame(self.content_frame, fg_color="white")
         self.uniforms_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
@@ -1295,6 +1723,7 @@ def logout(self):
             font=("Arial Bold", 24), 
             text_color=self.primary_color
         ).pack(side="left")
+        self.add_sync_badge(header_frame, 'uniforms')
         
         add_btn = ctk.CTkButton(
             header_frame, 
@@ -1305,11 +1734,22 @@ def logout(self):
         )
         add_btn.pack(side="right")
         
-        self.uniforms_list_frame = ctk.CTkScrollableFrame(
-            self.uniforms_frame, 
-            fg_color="transparent"
+        self.uniforms_table = DataTable(
+            self.uniforms_frame,
+            columns=[
+                ("name", "Item", 220),
+                ("size", "Size", 80),
+                ("condition", "Condition", 110),
+                ("available", "Available", 90),
+                ("assigned_to", "Assigned To", 200)
+            ],
+            actions=[("Edit", self.edit_uniform_dialog), (None, None), ("Delete", self.delete_uniform)],
+            on_activate=self.edit_uniform_dialog,
+            empty_text="No uniform items found. Click 'Add Uniform' to add a new item.",
+            header_color=self.primary_color,
+            tag_colors={"poor": "#F44336", "fair": "#B7791F"}
         )
-        self.uniforms_list_frame.pack(fill="both", expand=True, pady=10)
+        self.uniforms_table.pack(fill="both", expand=True, pady=10)
         
         self.update_uniforms_display()
 
@@ -1334,8 +1774,7 @@ def logout(self):
             ("Description", "text", fundraiser.get('description', '')),
             ("Start Date", "date", fundraiser.get('start_date', '')),
             ("End Date", "date", fundraiser.get('end_date', '')),
-            ("Goal Amount", "entry", fundraiser.get('goal_amount', '0')),
-            ("Current Amount", "entry", fundraiser.get('current_amount', '0')),
+            ("Goal Amount", "entry", format_cents(goal_cents(fundraiser))),
         ]
         
         entries = {}
@@ -1398,24 +1837,210 @@ def logout(self):
                         fundraiser_data[key] = widget.get("1.0", tk.END).strip()
                     else:
                         fundraiser_data[key] = widget.get()
-                self.firebase.db.child("fundraisers").child(fundraiser_id).update(fundraiser_data)
+                
+                # The amount raised only changes through the transactions ledger
+                try:
+                    fundraiser_data["goal_cents"] = to_cents(fundraiser_data["goal_amount"])
+                except ValueError:
+                    messagebox.showerror("Error", "Please enter a valid number for the goal amount")
+                    return
+                fundraiser_data["goal_amount"] = fundraiser_data["goal_cents"] / 100
+                fundraiser_data["updated_at"] = datetime.now().isoformat()
+                self.firebase.update_data(f"fundraisers/{fundraiser_id}", fundraiser_data)
                 
                 messagebox.showinfo("Success", "Fundraiser updated successfully!")
                 dialog.destroy()
                 self.update_fundraisers_display()
                 
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to update fundraiser: {str(e)}")
-        
-        save_btn = ctk.CTkButton(button_frame, text="Save", command=save_fundraiser)
-        save_btn.pack(side="left", padx=10)
-        
-        cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=dialog.destroy)
-        cancel_btn.pack(side="right", padx=10)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to update fundraiser: {str(e)}")
+        
+        save_btn = ctk.CTkButton(button_frame, text="Save", command=save_fundraiser)
+        save_btn.pack(side="left", padx=10)
+        
+        cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=dialog.destroy)
+        cancel_btn.pack(side="right", padx=10)
+    
+    def fundraiser_transactions_dialog(self, fundraiser_id):
+        """Record sales, donations, refunds and expenses against a fundraiser and show its ledger."""
+        if not isinstance((self.fundraisers or {}).get(fundraiser_id), dict):
+            messagebox.showerror("Error", "Fundraiser not found.")
+            return
+        
+        fundraiser = dict(self.fundraisers[fundraiser_id])
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title(f"Transactions - {fundraiser.get('name', 'Fundraiser')}")
+        dialog.geometry("720x640")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        summary_label = ctk.CTkLabel(dialog, text="", font=("Arial Bold", 16), text_color=self.primary_color, anchor="w")
+        summary_label.pack(fill="x", padx=20, pady=(20, 10))
+        
+        cadet_names = {}
+        for cadet_id, cadet in self.cadet_index.ordered((("name", False),)):
+            cadet_names[cadet_id] = f"{cadet.get('last_name', '')}, {cadet.get('first_name', '')}".strip(", ")
+        
+        history_table = DataTable(
+            dialog,
+            columns=[
+                ("date", "Date", 90),
+                ("kind", "Type", 80),
+                ("cadet", "Cadet", 150),
+                ("amount", "Amount", 90, "e"),
+                ("note", "Note", 170),
+                ("by", "Entered By", 110)
+            ],
+            empty_text="Loading transactions...",
+            header_color=self.primary_color,
+            selectmode="browse",
+            tag_colors={"out": self.danger_color}
+        )
+        history_table.pack(fill="both", expand=True, padx=20)
+        
+        form_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        form_frame.pack(fill="x", padx=20, pady=10)
+        
+        no_cadet = "(no cadet)"
+        cadet_choices = {no_cadet: ""}
+        for cadet_id, name in cadet_names.items():
+            cadet_choices.setdefault(name or cadet_id, cadet_id)
+        
+        kind_var = ctk.StringVar(value="Sale")
+        cadet_var = ctk.StringVar(value=no_cadet)
+        ctk.CTkLabel(form_frame, text="Type").grid(row=0, column=0, padx=5, sticky="w")
+        ctk.CTkOptionMenu(form_frame, values=[kind.title() for kind in TRANSACTION_KINDS], variable=kind_var, width=110).grid(row=1, column=0, padx=5)
+        ctk.CTkLabel(form_frame, text="Cadet").grid(row=0, column=1, padx=5, sticky="w")
+        ctk.CTkOptionMenu(form_frame, values=list(cadet_choices), variable=cadet_var, width=180).grid(row=1, column=1, padx=5)
+        
+        entries = {}
+        for column, (label, default, width) in enumerate((
+            ("Qty", "", 50),
+            ("Amount", "", 90),
+            ("Date", datetime.now().strftime("%Y-%m-%d"), 100)
+        ), start=2):
+            ctk.CTkLabel(form_frame, text=label).grid(row=0, column=column, padx=5, sticky="w")
+            entry = ctk.CTkEntry(form_frame, width=width)
+            entry.insert(0, default)
+            entry.grid(row=1, column=column, padx=5)
+            entries[label.lower()] = entry
+        
+        note_entry = ctk.CTkEntry(dialog, placeholder_text="Note (optional)")
+        note_entry.pack(fill="x", padx=20)
+        
+        price = fundraiser.get('item_price_cents')
+        if not isinstance(price, int):
+            try:
+                price = to_cents(fundraiser.get('item_price') or 0)
+            except ValueError:
+                price = 0
+        if price > 0:
+            ctk.CTkLabel(
+                dialog,
+                text=f"Leave the amount blank to charge {format_cents(price)} per item.",
+                font=("Arial", 11),
+                text_color="#666666"
+            ).pack(anchor="w", padx=20)
+        
+        def show_summary():
+            current = (self.fundraisers or {}).get(fundraiser_id)
+            current = current if isinstance(current, dict) else fundraiser
+            raised, goal = raised_cents(current), goal_cents(current)
+            text = f"{current.get('name', 'Fundraiser')}: {format_cents(raised)} raised"
+            if goal > 0:
+                text += f" of {format_cents(goal)}   {progress_bar(raised, goal)}"
+            summary_label.configure(text=text)
+        
+        def show_history(rows):
+            if not dialog.winfo_exists():
+                return
+            history_table.set_rows(
+                ((transaction_id, (
+                    transaction.get('date', ''),
+                    str(transaction.get('kind', '')).title(),
+                    cadet_names.get(transaction.get('cadet_id'), transaction.get('cadet_id', '')),
+                    format_cents(transaction.get('amount_cents', 0)),
+                    transaction.get('note', ''),
+                    transaction.get('entered_by', '')
+                ), ("out",) if transaction.get('amount_cents', 0) < 0 else ())
+                 for transaction_id, transaction in reversed(rows)),
+                empty_text="No transactions recorded yet."
+            )
+            show_summary()
+        
+        def load_history():
+            try:
+                rows = self.fundraiser_ledger.history(fundraiser_id)
+            except Exception as e:
+                print(f"Error loading fundraiser transactions: {e}")
+                rows = []
+            self.root.after(0, lambda: show_history(rows))
+        
+        def save():
+            kind = kind_var.get().lower()
+            try:
+                quantity = int(entries["qty"].get().strip() or 0)
+                if quantity < 0:
+                    raise ValueError("Quantity cannot be negative")
+                amount = entries["amount"].get().strip()
+                if not amount and quantity and price > 0:
+                    amount_cents = TRANSACTION_KINDS[kind] * quantity * price
+                else:
+                    amount_cents = signed_cents(kind, amount)
+                entry_date = datetime.strptime(entries["date"].get().strip(), "%Y-%m-%d").date().isoformat()
+            except ValueError as e:
+                messagebox.showerror("Invalid Entry", f"Check the quantity, amount and date (YYYY-MM-DD): {str(e)}", parent=dialog)
+                return
+            
+            transaction = {
+                "kind": kind,
+                "amount_cents": amount_cents,
+                "cadet_id": cadet_choices.get(cadet_var.get(), ""),
+                "quantity": quantity,
+                "note": note_entry.get().strip(),
+                "date": entry_date
+            }
+            entered_by = (self.current_user or {}).get('email', '')
+            save_btn.configure(state="disabled")
+            
+            def work():
+                try:
+                    self.fundraiser_ledger.record(fundraiser_id, [transaction], entered_by)
+                except Exception as e:
+                    def failed(error=e):
+                        if save_btn.winfo_exists():
+                            save_btn.configure(state="normal")
+                        messagebox.showerror("Error", f"Failed to record transaction: {str(error)}", parent=dialog)
+                    self.root.after(0, failed)
+                    return
+                
+                def done():
+                    if not dialog.winfo_exists():
+                        return
+                    save_btn.configure(state="normal")
+                    for key in ("qty", "amount"):
+                        entries[key].delete(0, "end")
+                    note_entry.delete(0, "end")
+                    entries["amount"].focus_set()
+                self.root.after(0, done)
+                load_history()
+            
+            self.executor.submit(work)
+        
+        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        button_frame.pack(fill="x", padx=20, pady=(10, 20))
+        save_btn = ctk.CTkButton(button_frame, text="Record", command=save, fg_color=self.success_color, hover_color="#45a049")
+        save_btn.pack(side="left")
+        ctk.CTkButton(button_frame, text="Close", command=dialog.destroy, fg_color="#9E9E9E").pack(side="right")
+        
+        show_summary()
+        entries["amount"].focus_set()
+        self.executor.submit(load_history)
     
     def show_fundraisers(self):
         self.clear_content_frame()
         self.current_view = 'fundraisers'
+        self.attach_view_streams('fundraisers')
         self.fundraisers_frame = ctk.CTkFrame(self.content_frame, fg_color="white")
         self.fundraisers_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
@@ -1428,6 +2053,7 @@ def logout(self):
             font=("Arial Bold", 24), 
             text_color=self.primary_color
         ).pack(side="left")
+        self.add_sync_badge(header_frame, 'fundraisers')
         
         add_btn = ctk.CTkButton(
             header_frame, 
@@ -1438,17 +2064,58 @@ def logout(self):
         )
         add_btn.pack(side="right")
         
-        self.fundraisers_list_frame = ctk.CTkScrollableFrame(
-            self.fundraisers_frame, 
-            fg_color="transparent"
+        self.fundraisers_table = DataTable(
+            self.fundraisers_frame,
+            columns=[
+                ("name", "Name", 220),
+                ("date", "Date", 100),
+                ("goal", "Goal", 100, "e"),
+                ("raised", "Raised", 100, "e"),
+                ("progress", "Progress", 160),
+                ("sellers", "Sellers", 70, "e"),
+                ("status", "Status", 100)
+            ],
+            actions=[
+                ("Transactions...", self.fundraiser_transactions_dialog),
+                ("Edit", self.edit_fundraiser_dialog),
+                (None, None),
+                ("Delete", self.delete_fundraiser)
+            ],
+            on_activate=self.fundraiser_transactions_dialog,
+            on_select=lambda ids: self.update_fundraiser_leaderboard(),
+            empty_text="No fundraisers found. Click 'Add Fundraiser' to create a new one.",
+            header_color=self.primary_color,
+            tag_colors={"completed": "#9E9E9E"}
+        )
+        self.fundraisers_table.pack(fill="both", expand=True, pady=10)
+        
+        leaderboard_frame = ctk.CTkFrame(self.fundraisers_frame, fg_color="#f5f5f5", corner_radius=10)
+        leaderboard_frame.pack(fill="x")
+        
+        self.fundraiser_leaderboard_label = ctk.CTkLabel(
+            leaderboard_frame,
+            text="Top Sellers",
+            font=("Arial Bold", 16),
+            text_color=self.primary_color
+        )
+        self.fundraiser_leaderboard_label.pack(anchor="w", padx=10, pady=(10, 5))
+        
+        self.fundraiser_leaderboard_table = DataTable(
+            leaderboard_frame,
+            columns=[("rank", "#", 40, "e"), ("cadet", "Cadet", 220), ("flight", "Flight", 80), ("raised", "Raised", 100, "e")],
+            empty_text="No sales recorded yet.",
+            header_color=self.primary_color,
+            selectmode="none"
         )
-        self.fundraisers_list_frame.pack(fill="both", expand=True, pady=10)
+        self.fundraiser_leaderboard_table.tree.configure(height=self.leaderboard_size)
+        self.fundraiser_leaderboard_table.pack(fill="x", padx=10, pady=(0, 10))
         
         self.update_fundraisers_display()
 
     def show_contacts(self):
         self.clear_content_frame()
         self.current_view = 'contacts'
+        self.attach_view_streams('contacts')
         
         self.contacts_frame = ctk.CTkFrame(self.content_frame, fg_color="white")
         self.contacts_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -1462,6 +2129,7 @@ def logout(self):
             font=("Arial", 24, "bold"),
             text_color=self.primary_color
         ).pack(side="left")
+        self.add_sync_badge(header_frame, 'contacts')
         
         add_btn = ctk.CTkButton(
             header_frame,
@@ -1474,17 +2142,33 @@ def logout(self):
         )
         add_btn.pack(side="right")
         
-        self.contacts_list_frame = ctk.CTkScrollableFrame(
-            self.contacts_frame, 
-            fg_color="transparent"
+        self.contacts_table = DataTable(
+            self.contacts_frame,
+            columns=[
+                ("name", "Name", 200),
+                ("organization", "Organization", 180),
+                ("phone", "Phone", 120),
+                ("email", "Email", 220),
+                ("type", "Type", 100)
+            ],
+            actions=[("Edit", self.edit_contact_dialog), (None, None), ("Delete", self.delete_contact)],
+            on_activate=self.edit_contact_dialog,
+            empty_text="No contacts found. Click 'Add Contact' to add a new contact.",
+            header_color=self.primary_color,
+            tag_colors={
+                "Vendor": "#4CAF50",
+                "School": "#2196F3",
+                "Military": "#9C27B0"
+            }
         )
-        self.contacts_list_frame.pack(fill=tk.BOTH, expand=True)
+        self.contacts_table.pack(fill=tk.BOTH, expand=True)
         
         self.update_contacts_display()
 
     def show_reports(self):
         self.clear_content_frame()
         self.current_view = 'reports'
+        self.attach_view_streams('reports')
         self.reports_frame = ctk.CTkFrame(self.content_frame, fg_color="white")
         self.reports_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
@@ -1549,6 +2233,8 @@ def logout(self):
     
     def show_jobs(self):
         self.clear_content_frame()
+        self.current_view = 'jobs'
+        self.attach_view_streams('jobs')
         
         main_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
@@ -1563,6 +2249,7 @@ def logout(self):
             text_color=self.primary_color
         )
         title_label.pack(side="left")
+        self.add_sync_badge(header_frame, 'jobs')
         
         add_btn = ctk.CTkButton(
             header_frame,
@@ -1573,44 +2260,64 @@ def logout(self):
         )
         add_btn.pack(side="right", padx=10)
         
-        table_frame = ctk.CTkFrame(main_frame)
-        table_frame.pack(fill="both", expand=True)
+        # Toolbar actions apply to the current selection
+        toolbar = ctk.CTkFrame(main_frame, fg_color="transparent")
+        toolbar.pack(fill="x", pady=(0, 10))
         
-        columns = ("cadet", "title", "status", "assigned_date", "due_date", "priority", "actions")
-        self.jobs_tree = ttk.Treeview(
-            table_frame,
-            columns=columns,
-            show="headings",
-            selectmode="browse"
+        self.job_toolbar_buttons = [
+            ctk.CTkButton(toolbar, text="Edit", width=90, command=lambda: self.edit_selected_job()),
+            ctk.CTkButton(
+                toolbar, text="Mark Completed", width=130,
+                command=lambda: self.set_jobs_status(self.jobs_table.selected_ids(), "Completed")
+            ),
+            ctk.CTkButton(
+                toolbar, text="Delete", width=90,
+                fg_color=self.danger_color, hover_color="#c43e3e",
+                command=lambda: self.delete_jobs(self.jobs_table.selected_ids())
+            )
+        ]
+        for button in self.job_toolbar_buttons:
+            button.pack(side="left", padx=(0, 8))
+        
+        ctk.CTkLabel(
+            toolbar,
+            text="Enter: edit   Ctrl+D: mark completed   Delete: remove   Ctrl+N: new job",
+            text_color="#666666",
+            font=("Arial", 11)
+        ).pack(side="right")
+        
+        self.jobs_table = DataTable(
+            main_frame,
+            columns=[
+                ("cadet", "Cadet", 150),
+                ("title", "Job Title", 220),
+                ("status", "Status", 100),
+                ("assigned_date", "Assigned On", 120),
+                ("due_date", "Due Date", 120),
+                ("priority", "Priority", 100)
+            ],
+            actions=[
+                ("Edit", self.edit_job_dialog),
+                ("Mark Completed", lambda job_id: self.set_jobs_status(self.jobs_table.selected_ids(), "Completed")),
+                (None, None),
+                ("Delete", lambda job_id: self.delete_jobs(self.jobs_table.selected_ids()))
+            ],
+            on_activate=self.edit_job_dialog,
+            on_select=self._update_job_toolbar,
+            empty_text="No job assignments yet. Click 'Add Job' to create one.",
+            header_color=self.primary_color,
+            tag_colors={"completed": "#9E9E9E", "cancelled": "#9E9E9E", "high": self.danger_color}
         )
+        self.jobs_table.pack(fill="both", expand=True)
         
-        self.jobs_tree.heading("cadet", text="Cadet")
-        self.jobs_tree.heading("title", text="Job Title")
-        self.jobs_tree.heading("status", text="Status")
-        self.jobs_tree.heading("assigned_date", text="Assigned On")
-        self.jobs_tree.heading("due_date", text="Due Date")
-        self.jobs_tree.heading("priority", text="Priority")
-        self.jobs_tree.heading("actions", text="Actions")
-        
-        self.jobs_tree.column("cadet", width=150)
-        self.jobs_tree.column("title", width=200)
-        self.jobs_tree.column("status", width=100)
-        self.jobs_tree.column("assigned_date", width=120)
-        self.jobs_tree.column("due_date", width=120)
-        self.jobs_tree.column("priority", width=100)
-        self.jobs_tree.column("actions", width=150)
-        
-        v_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self.jobs_tree.yview)
-        h_scroll = ttk.Scrollbar(table_frame, orient="horizontal", command=self.jobs_tree.xview)
-        self.jobs_tree.configure(yscrollcommand=v_scroll.set, xscrollcommand=h_scroll.set)
-        
-        self.jobs_tree.grid(row=0, column=0, sticky="nsew")
-        v_scroll.grid(row=0, column=1, sticky="ns")
-        h_scroll.grid(row=1, column=0, sticky="ew")
-        
-        table_frame.grid_rowconfigure(0, weight=1)
-        table_frame.grid_columnconfigure(0, weight=1)
+        tree = self.jobs_table.tree
+        tree.bind("<Delete>", lambda e: self.delete_jobs(self.jobs_table.selected_ids()))
+        tree.bind("<BackSpace>", lambda e: self.delete_jobs(self.jobs_table.selected_ids()))
+        tree.bind("<Control-d>", lambda e: self.set_jobs_status(self.jobs_table.selected_ids(), "Completed"))
+        tree.bind("<Control-n>", lambda e: self.add_job_dialog())
+        tree.bind("<Control-a>", lambda e: self.jobs_table.select(tree.get_children("")) or "break")
         
+        self._update_job_toolbar([])
         self.update_jobs_display()
     
     def add_job_dialog(self):
@@ -1738,8 +2445,8 @@ def logout(self):
                 job_data["created_at"] = datetime.now().isoformat()
                 job_data["updated_at"] = job_data["created_at"]
                 
-                job_ref = self.firebase.db.reference("jobs").push()
-                job_ref.set(job_data)
+                # A client-generated key makes the write a set that is safe to retry
+                self.firebase.add_document("jobs", job_data)
                 
                 self.update_jobs_display()
                 
@@ -1757,53 +2464,61 @@ def logout(self):
         cancel_btn.pack(side="right", padx=10)
     
     def update_jobs_display(self):
-        if not hasattr(self, 'jobs_tree'):
+        if not hasattr(self, 'jobs_table') or not self.jobs_table.winfo_exists():
             return
-            
-        for item in self.jobs_tree.get_children():
-            self.jobs_tree.delete(item)
-            
-        for job_id, job in self.jobs.items():
+        
+        rows = []
+        for job_id, job in (self.jobs or {}).items():
             if not isinstance(job, dict):
                 continue
-                
-            action_frame = ctk.CTkFrame(self.jobs_tree, fg_color="transparent")
-            
-            edit_btn = ctk.CTkButton(
-                action_frame,
-                text="✏️",
-                width=30,
-                height=30,
-                fg_color="transparent",
-                text_color="#1a73e8",
-                hover_color="#e8f0fe",
-                command=lambda jid=job_id: self.edit_job_dialog(jid)
-            )
-            edit_btn.pack(side="left", padx=2)
             
-            delete_btn = ctk.CTkButton(
-                action_frame,
-                text="🗑️",
-                width=30,
-                height=30,
-                fg_color="transparent",
-                text_color="#d93025",
-                hover_color="#fce8e6",
-                command=lambda jid=job_id: self.delete_job(jid)
-            )
-            delete_btn.pack(side="left", padx=2)
-            
-            item_id = self.jobs_tree.insert("", "end", values=(
+            status = job.get("status", "Pending")
+            priority = job.get("priority", "Medium")
+            tags = (str(status).lower(),) if status in ("Completed", "Cancelled") else (str(priority).lower(),)
+            rows.append((job_id, (
                 job.get("cadet", "N/A"),
                 job.get("title", "No Title"),
-                job.get("status", "Pending"),
+                status,
                 job.get("assigned_date", "N/A"),
                 job.get("due_date", "N/A"),
-                job.get("priority", "Medium"),
-            ), tags=(job_id,))
-            
-            self.jobs_tree.set(item_id, "actions", "")
-            self.jobs_tree.window_create(item_id, column="actions", window=action_frame)
+                priority
+            ), tags))
+        
+        # Items are keyed by job id, so refreshes only touch rows that changed
+        self.jobs_table.set_rows(rows, empty_text=self.loading_text('jobs'))
+        self._update_job_toolbar(self.jobs_table.selected_ids())
+    
+    def _update_job_toolbar(self, selected_ids):
+        if not hasattr(self, 'job_toolbar_buttons'):
+            return
+        
+        edit_btn, complete_btn, delete_btn = self.job_toolbar_buttons
+        edit_btn.configure(state="normal" if len(selected_ids) == 1 else "disabled")
+        complete_btn.configure(state="normal" if selected_ids else "disabled")
+        delete_btn.configure(state="normal" if selected_ids else "disabled")
+    
+    def edit_selected_job(self):
+        selected = self.jobs_table.selected_ids()
+        if len(selected) == 1:
+            self.edit_job_dialog(selected[0])
+    
+    def set_jobs_status(self, job_ids, status):
+        job_ids = [job_id for job_id in job_ids if job_id in self.jobs]
+        if not job_ids:
+            return "break"
+        
+        now = datetime.now().isoformat()
+        updates = {}
+        for job_id in job_ids:
+            updates[f"{job_id}/status"] = status
+            updates[f"{job_id}/updated_at"] = now
+        
+        try:
+            # One multi-path update for the whole selection
+            self.firebase.update_data("jobs", updates)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to update jobs: {str(e)}")
+        return "break"
     
     def edit_job_dialog(self, job_id):
         job = self.jobs.get(job_id)
@@ -1837,17 +2552,26 @@ def logout(self):
         dialog.destroy()
     
     def delete_job(self, job_id):
-        if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this job assignment?"):
+        self.delete_jobs([job_id])
+    
+    def delete_jobs(self, job_ids):
+        job_ids = [job_id for job_id in job_ids if job_id in self.jobs]
+        if not job_ids:
+            return "break"
+        
+        prompt = ("Are you sure you want to delete this job assignment?" if len(job_ids) == 1
+                  else f"Are you sure you want to delete {len(job_ids)} job assignments?")
+        if messagebox.askyesno("Confirm Delete", prompt):
             try:
-                self.firebase.db.reference(f"jobs/{job_id}").delete()
-                self.update_jobs_display()
-                messagebox.showinfo("Success", "Job assignment deleted successfully!")
+                self.firebase.update_data("jobs", {job_id: None for job_id in job_ids})
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete job: {str(e)}")
+        return "break"
     
     def show_settings(self):
         self.clear_content_frame()
         self.current_view = 'settings'
+        self.attach_view_streams('settings')
         self.settings_frame = ctk.CTkFrame(self.content_frame, fg_color="white")
         self.settings_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
@@ -1889,6 +2613,25 @@ def logout(self):
         )
         theme_menu.pack(side="left")
         
+        ctk.CTkLabel(
+            general_tab,
+            text="Realtime Connection",
+            font=("Arial Bold", 16),
+            text_color=self.primary_color
+        ).pack(anchor="w", pady=(20, 5))
+        
+        stream_stats = self.get_stream_stats()
+        ctk.CTkLabel(
+            general_tab,
+            text=(
+                f"Status: {'Connected' if stream_stats['connected'] else 'Reconnecting'}    "
+                f"Reconnects: {stream_stats['reconnects']}    "
+                f"Downtime: {stream_stats['downtime']:.0f}s"
+            ),
+            font=("Arial", 12),
+            text_color="#555555"
+        ).pack(anchor="w", pady=5)
+        
         account_tab = tabview.add("Account")
         
         ctk.CTkLabel(
@@ -1949,6 +2692,7 @@ def logout(self):
         """Display the help view"""
         self.clear_content_frame()
         self.current_view = 'help'
+        self.attach_view_streams('help')
         self.help_frame = ctk.CTkFrame(self.content_frame, fg_color="white")
         self.help_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
@@ -2193,378 +2937,128 @@ def logout(self):
         dialog.bind('<Return>', lambda e: change_password())
 
     def update_contacts_display(self):
-        if not hasattr(self, 'contacts_list_frame') or not self.contacts_list_frame.winfo_exists():
+        if not hasattr(self, 'contacts_table') or not self.contacts_table.winfo_exists():
             return
+        
+        rows = []
+        for contact_id, contact in (self.contacts or {}).items():
+            if not isinstance(contact, dict):
+                continue
             
-        for widget in self.contacts_list_frame.winfo_children():
-            widget.destroy()
-            
-        if hasattr(self, 'contacts') and self.contacts:
-            headers = ["Name", "Organization", "Phone", "Email", "Type", "Actions"]
-            for i, header in enumerate(headers):
-                ctk.CTkLabel(
-                    self.contacts_list_frame,
-                    text=header,
-                    font=("Arial", 12, "bold"),
-                    text_color=self.primary_color
-                ).grid(row=0, column=i, padx=5, pady=5, sticky="w")
-            
-            for idx, (contact_id, contact) in enumerate(self.contacts.items(), 1):
-                if not isinstance(contact, dict):
-                    continue
-                    
-                name = f"{contact.get('last_name', '')}, {contact.get('first_name', '')}"
-                ctk.CTkLabel(
-                    self.contacts_list_frame,
-                    text=name.strip(", ") if name.strip(", ") else "N/A",
-                    font=("Arial", 12)
-                ).grid(row=idx, column=0, padx=5, pady=2, sticky="w")
-                
-                org = contact.get('organization', 'N/A')
-                ctk.CTkLabel(
-                    self.contacts_list_frame,
-                    text=org,
-                    font=("Arial", 12)
-                ).grid(row=idx, column=1, padx=5, pady=2, sticky="w")
-                
-                phone = contact.get('phone', 'N/A')
-                ctk.CTkLabel(
-                    self.contacts_list_frame,
-                    text=phone,
-                    font=("Arial", 12)
-                ).grid(row=idx, column=2, padx=5, pady=2, sticky="w")
-                
-                email = contact.get('email', 'N/A')
-                ctk.CTkLabel(
-                    self.contacts_list_frame,
-                    text=email,
-                    font=("Arial", 12)
-                ).grid(row=idx, column=3, padx=5, pady=2, sticky="w")
-                
-                contact_type = contact.get('type', 'Other')
-                type_color = {
-                    'Vendor': '#4CAF50',
-                    'School': '#2196F3',
-                    'Military': '#9C27B0',
-                    'Other': '#607D8B'
-                }.get(contact_type, '#607D8B')
-                
-                ctk.CTkLabel(
-                    self.contacts_list_frame,
-                    text=contact_type,
-                    font=("Arial", 12, "bold"),
-                    text_color=type_color
-                ).grid(row=idx, column=4, padx=5, pady=2, sticky="w")
-                
-                btn_frame = ctk.CTkFrame(self.contacts_list_frame, fg_color="transparent")
-                btn_frame.grid(row=idx, column=5, padx=5, pady=2, sticky="e")
-                
-                ctk.CTkButton(
-                    btn_frame,
-                    text="Edit",
-                    width=60,
-                    height=25,
-                    font=("Arial", 10),
-                    command=lambda cid=contact_id: self.edit_contact_dialog(cid)
-                ).pack(side="left", padx=2)
-                
-                ctk.CTkButton(
-                    btn_frame,
-                    text="Delete",
-                    width=60,
-                    height=25,
-                    font=("Arial", 10),
-                    fg_color=self.danger_color,
-                    hover_color="#c43e3e",
-                    command=lambda cid=contact_id: self.delete_contact(cid)
-                ).pack(side="left", padx=2)
-        else:
-            ctk.CTkLabel(
-                self.contacts_list_frame,
-                text="No contacts found. Click 'Add Contact' to add a new contact.",
-                text_color="#666666",
-                font=("Arial", 14)
-            ).pack(pady=40)
+            name = f"{contact.get('last_name', '')}, {contact.get('first_name', '')}".strip(", ")
+            contact_type = contact.get('type', 'Other')
+            rows.append((contact_id, (
+                name or "N/A",
+                contact.get('organization', 'N/A'),
+                contact.get('phone', 'N/A'),
+                contact.get('email', 'N/A'),
+                contact_type
+            ), (contact_type,)))
+        
+        self.contacts_table.set_rows(rows, empty_text=self.loading_text('contacts'))
 
     def update_fundraisers_display(self):
-        if not hasattr(self, 'fundraisers_list_frame') or not self.fundraisers_list_frame.winfo_exists():
+        if not hasattr(self, 'fundraisers_table') or not self.fundraisers_table.winfo_exists():
             return
+        
+        self.fundraiser_participants.sync(self.fundraiser_sales)
+        today = datetime.now()
+        rows = []
+        for fundraiser_id, fundraiser in (self.fundraisers or {}).items():
+            if not isinstance(fundraiser, dict):
+                continue
             
-        for widget in self.fundraisers_list_frame.winfo_children():
-            widget.destroy()
+            date_str = fundraiser.get('date', 'N/A')
             
-        if hasattr(self, 'fundraisers') and self.fundraisers:
-            headers = ["Name", "Date", "Goal", "Raised", "Progress", "Status", "Actions"]
-            for i, header in enumerate(headers):
-                ctk.CTkLabel(
-                    self.fundraisers_list_frame,
-                    text=header,
-                    font=("Arial", 12, "bold"),
-                    text_color=self.primary_color
-                ).grid(row=0, column=i, padx=5, pady=5, sticky="w")
+            # Integer cents from the materialized ledger totals
+            goal = goal_cents(fundraiser)
+            raised = raised_cents(fundraiser)
             
-            for idx, (fundraiser_id, fundraiser) in enumerate(self.fundraisers.items(), 1):
-                if not isinstance(fundraiser, dict):
-                    continue
-                    
-                ctk.CTkLabel(
-                    self.fundraisers_list_frame,
-                    text=fundraiser.get('name', 'N/A'),
-                    font=("Arial", 12)
-                ).grid(row=idx, column=0, padx=5, pady=2, sticky="w")
-                
-                date_str = fundraiser.get('date', 'N/A')
-                ctk.CTkLabel(
-                    self.fundraisers_list_frame,
-                    text=date_str,
-                    font=("Arial", 12)
-                ).grid(row=idx, column=1, padx=5, pady=2, sticky="w")
-                
-                goal = fundraiser.get('goal', 0)
-                try:
-                    goal = float(goal)
-                    goal_text = f"${goal:,.2f}"
-                except (ValueError, TypeError):
-                    goal_text = "N/A"
-                    
-                ctk.CTkLabel(
-                    self.fundraisers_list_frame,
-                    text=goal_text,
-                    font=("Arial", 12)
-                ).grid(row=idx, column=2, padx=5, pady=2, sticky="w")
-                
-                raised_amt = fundraiser.get('raised', 0)
-                try:
-                    raised_amt = float(raised_amt)
-                    raised_text = f"${raised_amt:,.2f}"
-                except (ValueError, TypeError):
-                    raised_text = "$0.00"
-                    
-                ctk.CTkLabel(
-                    self.fundraisers_list_frame,
-                    text=raised_text,
-                    font=("Arial", 12)
-                ).grid(row=idx, column=3, padx=5, pady=2, sticky="w")
-                
-                progress_frame = ctk.CTkFrame(self.fundraisers_list_frame, fg_color="transparent")
-                progress_frame.grid(row=idx, column=4, padx=5, pady=2, sticky="nsew")
-                
-                try:
-                    progress = min(raised_amt / goal * 100 if goal > 0 else 0, 100)
-                    progress_color = "#4CAF50"  # Green
-                    if progress < 50:
-                        progress_color = "#F44336"  # Red
-                    elif progress < 75:
-                        progress_color = "#FFC107"  # Yellow
-                        
-                    ctk.CTkProgressBar(
-                        progress_frame,
-                        width=100,
-                        height=20,
-                        fg_color="#e0e0e0",
-                        progress_color=progress_color
-                    ).pack(fill="x", expand=True)
-                    progress_frame.progress = progress / 100
-                    
-                    ctk.CTkLabel(
-                        progress_frame,
-                        text=f"{progress:.1f}%",
-                        font=("Arial", 10)
-                    ).pack(pady=2)
-                except (ValueError, ZeroDivisionError):
-                    ctk.CTkLabel(
-                        progress_frame,
-                        text="N/A",
-                        font=("Arial", 12)
-                    ).pack()
-                
-                status = "Active"
-                status_color = "#4CAF50" 
-                
-                try:
-                    event_date = datetime.strptime(date_str, "%Y-%m-%d")
-                    today = datetime.now()
-                    if today > event_date:
-                        status = "Completed"
-                        status_color = "#9E9E9E"  
-                except (ValueError, TypeError):
-                    pass
-                    
-                ctk.CTkLabel(
-                    self.fundraisers_list_frame,
-                    text=status,
-                    font=("Arial", 12, "bold"),
-                    text_color=status_color
-                ).grid(row=idx, column=5, padx=5, pady=2, sticky="w")
-                
-                btn_frame = ctk.CTkFrame(self.fundraisers_list_frame, fg_color="transparent")
-                btn_frame.grid(row=idx, column=6, padx=5, pady=2, sticky="e")
-                
-                ctk.CTkButton(
-                    btn_frame,
-                    text="Edit",
-                    width=60,
-                    height=25,
-                    font=("Arial", 10),
-                    command=lambda fid=fundraiser_id: self.edit_fundraiser_dialog(fid)
-                ).pack(side="left", padx=2)
-                
-                ctk.CTkButton(
-                    btn_frame,
-                    text="Delete",
-                    width=60,
-                    height=25,
-                    font=("Arial", 10),
-                    fg_color=self.danger_color,
-                    hover_color="#c43e3e",
-                    command=lambda fid=fundraiser_id: self.delete_fundraiser(fid)
-                ).pack(side="left", padx=2)
+            status = "Active"
+            try:
+                if today > datetime.strptime(date_str, "%Y-%m-%d"):
+                    status = "Completed"
+            except (ValueError, TypeError):
+                pass
+            
+            rows.append((fundraiser_id, (
+                fundraiser.get('name', 'N/A'),
+                date_str,
+                format_cents(goal) if goal > 0 else "N/A",
+                format_cents(raised),
+                progress_bar(raised, goal),
+                self.fundraiser_participants.participants(fundraiser_id),
+                status
+            ), (status.lower(),)))
+        
+        self.fundraisers_table.set_rows(rows, empty_text=self.loading_text('fundraisers'))
+        self.update_fundraiser_leaderboard()
+    
+    def update_fundraiser_leaderboard(self):
+        """Show the top sellers of the selected fundraiser, or across all fundraisers when none is selected."""
+        if not hasattr(self, 'fundraiser_leaderboard_table') or not self.fundraiser_leaderboard_table.winfo_exists():
+            return
+        
+        selected = [fid for fid in self.fundraisers_table.selected_ids() if fid in (self.fundraisers or {})]
+        fundraiser_id = selected[0] if len(selected) == 1 else None
+        if fundraiser_id is None:
+            title = "Top Sellers - All Fundraisers"
         else:
-            # Show message if no fundraisers found
-            ctk.CTkLabel(
-                self.fundraisers_list_frame,
-                text="No fundraisers found. Click 'Add Fundraiser' to create a new one.",
-                text_color="#666666",
-                font=("Arial", 14)
-            ).pack(pady=40)
+            title = f"Top Sellers - {self.fundraisers[fundraiser_id].get('name', 'Fundraiser')}"
+        self.fundraiser_leaderboard_label.configure(text=title)
+        
+        cadets = self.cadets if isinstance(self.cadets, dict) else {}
+        rows = []
+        for rank, (cadet_id, cents) in enumerate(self.fundraiser_participants.top(self.leaderboard_size, fundraiser_id), 1):
+            cadet = cadets.get(cadet_id)
+            cadet = cadet if isinstance(cadet, dict) else {}
+            name = f"{cadet.get('last_name', '')}, {cadet.get('first_name', '')}".strip(", ") or cadet_id
+            rows.append((cadet_id, (rank, name, cadet.get('flight', cadet.get('Flight', '')), format_cents(cents)), ()))
+        
+        self.fundraiser_leaderboard_table.set_rows(rows, empty_text=self.loading_text('fundraiser_sales'))
 
     def update_uniforms_display(self):
         """Update the display of uniforms from the local data cache"""
-        if not hasattr(self, 'uniforms_list_frame') or not self.uniforms_list_frame.winfo_exists():
+        if not hasattr(self, 'uniforms_table') or not self.uniforms_table.winfo_exists():
             return
+        
+        rows = []
+        for item_id, item in (self.uniforms or {}).items():
+            if not isinstance(item, dict):
+                continue
             
-        for widget in self.uniforms_list_frame.winfo_children():
-            widget.destroy()
-            
-        if hasattr(self, 'uniforms') and self.uniforms:
-            # Create header row
-            headers = ["Item", "Size", "Condition", "Available", "Assigned To", "Actions"]
-            for i, header in enumerate(headers):
-                ctk.CTkLabel(
-                    self.uniforms_list_frame,
-                    text=header,
-                    font=("Arial", 12, "bold"),
-                    text_color=self.primary_color
-                ).grid(row=0, column=i, padx=5, pady=5, sticky="w")
-            
-            # Add uniform items
-            for idx, (item_id, item) in enumerate(self.uniforms.items(), 1):
-                # Skip if item is not a dictionary
-                if not isinstance(item, dict):
-                    continue
-                    
-                # Item name
-                ctk.CTkLabel(
-                    self.uniforms_list_frame,
-                    text=item.get('name', 'N/A'),
-                    font=("Arial", 12)
-                ).grid(row=idx, column=0, padx=5, pady=2, sticky="w")
-                
-                # Size
-                ctk.CTkLabel(
-                    self.uniforms_list_frame,
-                    text=item.get('size', 'N/A'),
-                    font=("Arial", 12)
-                ).grid(row=idx, column=1, padx=5, pady=2, sticky="w")
-                
-                condition = item.get('condition', 'N/A')
-                condition_color = "#4CAF50" 
-                if condition.lower() == 'poor':
-                    condition_color = "#F44336" 
-                elif condition.lower() == 'fair':
-                    condition_color = "#FFC107"  
-                    
-                ctk.CTkLabel(
-                    self.uniforms_list_frame,
-                    text=condition,
-                    font=("Arial", 12),
-                    text_color=condition_color
-                ).grid(row=idx, column=2, padx=5, pady=2, sticky="w")
-                
-                assigned_to = item.get('assignedTo', '')
-                status = "Yes" if not assigned_to else "No"
-                status_color = "#4CAF50" if status == "Yes" else "#F44336"
-                
-                ctk.CTkLabel(
-                    self.uniforms_list_frame,
-                    text=status,
-                    font=("Arial", 12),
-                    text_color=status_color
-                ).grid(row=idx, column=3, padx=5, pady=2, sticky="w")
-                
-                assigned_label = ctk.CTkLabel(
-                    self.uniforms_list_frame,
-                    text=assigned_to if assigned_to else "N/A",
-                    font=("Arial", 12)
-                )
-                assigned_label.grid(row=idx, column=4, padx=5, pady=2, sticky="w")
-                
-                btn_frame = ctk.CTkFrame(self.uniforms_list_frame, fg_color="transparent")
-                btn_frame.grid(row=idx, column=5, padx=5, pady=2, sticky="e")
-                
-                ctk.CTkButton(
-                    btn_frame,
-                    text="Edit",
-                    width=60,
-                    height=25,
-                    font=("Arial", 10),
-                    command=lambda iid=item_id: self.edit_uniform_dialog(iid)
-                ).pack(side="left", padx=2)
-                
-                ctk.CTkButton(
-                    btn_frame,
-                    text="Delete",
-                    width=60,
-                    height=25,
-                    font=("Arial", 10),
-                    fg_color=self.danger_color,
-                    hover_color="#c43e3e",
-                    command=lambda iid=item_id: self.delete_uniform(iid)
-                ).pack(side="left", padx=2)
-        else:
-            ctk.CTkLabel(
-                self.uniforms_list_frame,
-                text="No uniform items found. Click 'Add Uniform' to add a new item.",
-                text_color="#666666",
-                font=("Arial", 14)
-            ).pack(pady=40)
+            condition = item.get('condition', 'N/A')
+            assigned_to = item.get('assignedTo', '')
+            rows.append((item_id, (
+                item.get('name', 'N/A'),
+                item.get('size', 'N/A'),
+                condition,
+                "No" if assigned_to else "Yes",
+                assigned_to or "N/A"
+            ), (str(condition).lower(),)))
+        
+        self.uniforms_table.set_rows(rows, empty_text=self.loading_text('uniforms'))
 
     def update_cadets_display(self):
         try:
             if not hasattr(self, 'cadets_list_frame') or not self.cadets_list_frame.winfo_exists():
                 return
                 
-            for widget in self.cadets_list_frame.winfo_children():
-                widget.destroy()
-                
-                print("Cadets data:", self.cadets)
-            
-            if not self.cadets:
+            cadets = self.cadet_index.sync(self.cadets)
+            if not cadets:
                 self._show_no_cadets_message()
                 return
-                
-            cadets_list = []
             
-            if isinstance(self.cadets, dict):
-                if all(isinstance(k, str) for k in self.cadets.keys()):
-                    cadets_list = [(k, v) for k, v in self.cadets.items() if isinstance(v, (dict, str))]
-                
-                elif all(k in ['first_name', 'last_name', 'email', 'grade', 'flight'] for k in self.cadets.keys()):
-                    cadets_list = [('direct', self.cadets)]
-            elif isinstance(self.cadets, list):
-                cadets_list = [(i, item) for i, item in enumerate(self.cadets) if isinstance(item, (dict, str))]
+            cadets_list = self.cadet_index.ordered(self.cadet_sort)
+            
+            search = self.cadet_search_entry.get().strip().lower() if hasattr(self, 'cadet_search_entry') else ""
+            grade = self.grade_var.get() if hasattr(self, 'grade_var') else "All"
+            if search:
+                cadets_list = [item for item in cadets_list if search in self.cadet_index.search_text(item[0])]
+            if grade != "All":
+                cadets_list = [item for item in cadets_list if str(item[1].get('grade', item[1].get('Grade', ''))) == grade]
             
             if cadets_list:
-                def get_sort_key(item):
-                    if not isinstance(item[1], dict):
-                        return ('', '')
-                    return (
-                        str(item[1].get('last_name', '') or item[1].get('Last Name', '') or '').lower(),
-                        str(item[1].get('first_name', '') or item[1].get('First Name', '') or '').lower()
-                    )
-                
-                cadets_list = sorted(cadets_list, key=get_sort_key)
-                
                 self._display_cadets_list(cadets_list)
             else:
                 self._show_no_cadets_message()
@@ -2573,6 +3067,22 @@ def logout(self):
             print(f"Error in update_cadets_display: {e}")
             self._show_no_cadets_message()
     
+    def sort_cadets_by(self, field, add=False):
+        current = dict(self.cadet_sort)
+        
+        if add:
+            if field in current:
+                self.cadet_sort = [(f, not d if f == field else d) for f, d in self.cadet_sort]
+            else:
+                self.cadet_sort = self.cadet_sort + [(field, False)]
+        elif self.cadet_sort and self.cadet_sort[0][0] == field and len(self.cadet_sort) == 1:
+            self.cadet_sort = [(field, not self.cadet_sort[0][1])]
+        else:
+            self.cadet_sort = [(field, False)]
+        
+        self.update_cadets_display()
+        return "break"
+    
     def _show_no_cadets_message(self):
         if not hasattr(self, 'cadets_list_frame') or not self.cadets_list_frame.winfo_exists():
             return
@@ -2583,6 +3093,11 @@ def logout(self):
         message_frame = ctk.CTkFrame(self.cadets_list_frame, fg_color="transparent")
         message_frame.pack(expand=True, pady=40)
         
+        loading = self.loading_text('cadets')
+        if loading:
+            ctk.CTkLabel(message_frame, text=loading, text_color="#666666", font=("Arial", 14)).pack(pady=10)
+            return
+        
         ctk.CTkLabel(
             message_frame,
             text="No cadets found.",
@@ -2609,18 +3124,36 @@ def logout(self):
         header_frame = ctk.CTkFrame(self.cadets_list_frame, fg_color=self.primary_color)
         header_frame.pack(fill="x", pady=(0, 5))
         
-        for i in range(6):
-            header_frame.columnconfigure(i, weight=1 if i < 5 else 0)
+        header_frame.columnconfigure(0, weight=0)
+        for i in range(1, 7):
+            header_frame.columnconfigure(i, weight=1 if i < 6 else 0)
         
-        headers = ["Name", "Grade", "Flight", "CS Hours", "Status", "Actions"]
+        headers = ["", "Name", "Grade", "Flight", "CS Hours", "Status", "Actions"]
+        sort_columns = dict(zip(headers[1:5], SORT_FIELDS))
+        sort_state = dict(self.cadet_sort)
         for i, header in enumerate(headers):
+            field = sort_columns.get(header)
+            text = header
+            if field in sort_state:
+                text += " ▼" if sort_state[field] else " ▲"
+            
             label = ctk.CTkLabel(
                 header_frame, 
-                text=header, 
+                text=text, 
                 text_color="white",
-                font=("Arial", 12, "bold")
+                font=("Arial", 12, "bold"),
+                cursor="hand2" if field else ""
             )
             label.grid(row=0, column=i, padx=10, pady=5, sticky="nsew")
+            
+            if field:
+                # Click sorts by this column; Shift+click adds it as a further sort key
+                label.bind("<Button-1>", lambda e, f=field: self.sort_cadets_by(f))
+                label.bind("<Shift-Button-1>", lambda e, f=field: self.sort_cadets_by(f, add=True))
+        
+        self._cadet_photo_rows = []
+        edit_icon = self.create_icon("edit", self.primary_color)
+        delete_icon = self.create_icon("delete", self.danger_color)
         
         for cadet_id, cadet in cadets_list:
             if not isinstance(cadet, dict):
@@ -2632,18 +3165,37 @@ def logout(self):
             content_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
             content_frame.pack(fill="x", padx=5, pady=5)
             
-            for i in range(6):
-                content_frame.columnconfigure(i, weight=1 if i < 5 else 0)
+            content_frame.columnconfigure(0, weight=0)
+            for i in range(1, 7):
+                content_frame.columnconfigure(i, weight=1 if i < 6 else 0)
             
             last_name = cadet.get('last_name', cadet.get('Last Name', ''))
             first_name = cadet.get('first_name', cadet.get('First Name', ''))
+            
+            # Thumbnails are fetched later, only once the row scrolls into view
+            photo_label = ctk.CTkLabel(
+                content_frame,
+                text=(str(first_name)[:1] + str(last_name)[:1]).upper(),
+                width=32,
+                height=32,
+                fg_color="#e2e8f0",
+                corner_radius=16,
+                text_color="#555555",
+                font=("Arial", 11, "bold")
+            )
+            photo_label.grid(row=0, column=0, padx=(5, 0), pady=5)
+            
+            photo_path = self.thumbnails.thumbnail_path(cadet.get('photo'), 32)
+            if photo_path:
+                self._cadet_photo_rows.append((row_frame, photo_label, photo_path))
+            
             name_label = ctk.CTkLabel(
                 content_frame,
                 text=f"{last_name}, {first_name}",
                 text_color="#333333",
                 font=("Arial", 12)
             )
-            name_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
+            name_label.grid(row=0, column=1, padx=10, pady=5, sticky="w")
             
             grade = cadet.get('grade', cadet.get('Grade', ''))
             grade_label = ctk.CTkLabel(
@@ -2652,7 +3204,7 @@ def logout(self):
                 text_color="#555555",
                 font=("Arial", 12)
             )
-            grade_label.grid(row=0, column=1, padx=10, pady=5, sticky="w")
+            grade_label.grid(row=0, column=2, padx=10, pady=5, sticky="w")
             
             flight = cadet.get('flight', cadet.get('Flight', ''))
             flight_label = ctk.CTkLabel(
@@ -2661,16 +3213,16 @@ def logout(self):
                 text_color="#555555",
                 font=("Arial", 12)
             )
-            flight_label.grid(row=0, column=2, padx=10, pady=5, sticky="w")
+            flight_label.grid(row=0, column=3, padx=10, pady=5, sticky="w")
             
-            cs_hours = cadet.get('cs_hours', cadet.get('CS Hours', 0))
+            cs_hours, cs_status = self.cadet_index.hours(cadet_id)
             cs_label = ctk.CTkLabel(
                 content_frame,
-                text=str(cs_hours),
-                text_color="#555555",
-                font=("Arial", 12)
+                text=f"{cs_hours:g}",
+                text_color=self.hours_colors[cs_status],
+                font=("Arial", 12, "bold")
             )
-            cs_label.grid(row=0, column=3, padx=10, pady=5, sticky="w")
+            cs_label.grid(row=0, column=4, padx=10, pady=5, sticky="w")
             
             status = cadet.get('status', cadet.get('Status', 'Active'))
             status_label = ctk.CTkLabel(
@@ -2679,44 +3231,151 @@ def logout(self):
                 text_color=self.success_color if status.lower() == 'active' else self.warning_color,
                 font=("Arial", 12, "bold")
             )
-            status_label.grid(row=0, column=4, padx=10, pady=5, sticky="w")
+            status_label.grid(row=0, column=5, padx=10, pady=5, sticky="w")
             
             actions_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
-            actions_frame.grid(row=0, column=5, padx=5, pady=5, sticky="e")
+            actions_frame.grid(row=0, column=6, padx=5, pady=5, sticky="e")
+            
+            photo_btn = ctk.CTkButton(
+                actions_frame,
+                text="📷",
+                width=30,
+                height=30,
+                fg_color="transparent",
+                hover_color="#e9ecef",
+                text_color=self.primary_color,
+                font=("Arial", 14),
+                command=lambda cid=cadet_id: self.upload_cadet_photo(cid)
+            )
+            photo_btn.pack(side="left", padx=2)
+            
+            hours_btn = ctk.CTkButton(
+                actions_frame,
+                text="⏱",
+                width=30,
+                height=30,
+                fg_color="transparent",
+                hover_color="#e9ecef",
+                text_color=self.primary_color,
+                font=("Arial", 14),
+                command=lambda cid=cadet_id: self.log_hours_dialog(cid)
+            )
+            hours_btn.pack(side="left", padx=2)
+            
+            edit_btn = ctk.CTkButton(
+                actions_frame,
+                text="",
+                image=edit_icon,
+                width=30,
+                height=30,
+                fg_color="transparent",
+                hover_color="#e9ecef",
+                command=lambda cid=cadet_id: self.edit_cadet_dialog(cid)
+            )
+            edit_btn.pack(side="left", padx=2)
+            
+            delete_btn = ctk.CTkButton(
+                actions_frame,
+                text="",
+                image=delete_icon,
+                width=30,
+                height=30,
+                fg_color="transparent",
+                hover_color="#e9ecef",
+                command=lambda cid=cadet_id: self.delete_cadet(cid)
+            )
+            delete_btn.pack(side="left", padx=2)
+        
+        self._watch_cadet_list_scroll()
+        self._schedule_visible_photo_load()
+    
+    def _watch_cadet_list_scroll(self):
+        # CTkScrollableFrame reports every view change through yscrollcommand; piggyback on it
+        canvas = self.cadets_list_frame._parent_canvas
+        scrollbar = self.cadets_list_frame._scrollbar
+        
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            self._schedule_visible_photo_load()
+        
+        canvas.configure(yscrollcommand=on_scroll)
+    
+    def _schedule_visible_photo_load(self):
+        if self._photo_load_scheduled or not self._cadet_photo_rows:
+            return
+        self._photo_load_scheduled = True
+        self.root.after(100, self._load_visible_cadet_photos)
+    
+    def _load_visible_cadet_photos(self):
+        self._photo_load_scheduled = False
+        if not hasattr(self, 'cadets_list_frame') or not self.cadets_list_frame.winfo_exists():
+            return
+        
+        canvas = self.cadets_list_frame._parent_canvas
+        top = canvas.canvasy(0)
+        bottom = top + canvas.winfo_height()
+        
+        pending = []
+        for row_frame, photo_label, photo_path in self._cadet_photo_rows:
+            if not row_frame.winfo_exists():
+                continue
+            y = row_frame.winfo_y()
+            if y + row_frame.winfo_height() < top or y > bottom:
+                pending.append((row_frame, photo_label, photo_path))
+                continue
+            
+            image = self.thumbnails.get_image(photo_path, 32)
+            if image is not None:
+                photo_label.configure(image=image, text="", fg_color="transparent")
+            else:
+                self.executor.submit(self._fetch_cadet_photo, photo_label, photo_path)
+        
+        self._cadet_photo_rows = pending
+    
+    def _fetch_cadet_photo(self, photo_label, photo_path):
+        try:
+            image = self.thumbnails.load_image(photo_path, 32)
+        except Exception as e:
+            print(f"Error loading cadet photo {photo_path}: {e}")
+            return
+        
+        def apply():
+            if photo_label.winfo_exists():
+                photo_label.configure(image=image, text="", fg_color="transparent")
+        
+        self.root.after(0, apply)
+    
+    def upload_cadet_photo(self, cadet_id):
+        from tkinter import filedialog
+        
+        file_path = filedialog.askopenfilename(
+            title="Select Cadet Photo",
+            filetypes=[("Images", "*.jpg *.jpeg *.png *.gif *.bmp *.webp"), ("All files", "*.*")]
+        )
+        if not file_path:
+            return
+        
+        def process():
+            try:
+                photo = self.thumbnails.process_photo(cadet_id, file_path)
+            except Exception as e:
+                print(f"Error processing cadet photo: {e}")
+                self.root.after(0, lambda error=e: messagebox.showerror("Error", f"Failed to upload photo: {str(error)}"))
+                return
             
-            edit_btn = ctk.CTkButton(
-                actions_frame,
-                text="✏️",
-                width=30,
-                height=30,
-                fg_color="transparent",
-                hover_color="#e9ecef",
-                text_color=self.primary_color,
-                font=("Arial", 14),
-                command=lambda cid=cadet_id: self.edit_cadet_dialog(cid)
-            )
-            edit_btn.pack(side="left", padx=2)
+            def done():
+                if isinstance(self.cadets, dict) and isinstance(self.cadets.get(cadet_id), dict):
+                    self.cadets[cadet_id]['photo'] = photo
+                self.update_cadets_display()
             
-            delete_btn = ctk.CTkButton(
-                actions_frame,
-                text="🗑️",
-                width=30,
-                height=30,
-                fg_color="transparent",
-                hover_color="#e9ecef",
-                text_color=self.danger_color,
-                font=("Arial", 14),
-                command=lambda cid=cadet_id: self.delete_cadet(cid)
-            )
-            delete_btn.pack(side="left", padx=2)
+            self.root.after(0, done)
+        
+        self.executor.submit(process)
     
     def calculate_balances(self, transactions):
-        total_balance = 0
-        month_income = 0
-        self._dashboard_update_id = self.root.after(
-            30000, 
-            lambda: setattr(self, '_dashboard_update_scheduled', False) or self.update_dashboard()
-        )
+        """``(balance, month_income)`` in integer cents over ledger ``transactions``."""
+        return calculate_balances(transactions)
+    
     def add_cadet_dialog(self):
         dialog = ctk.CTkToplevel(self.root)
         dialog.title("Add New Cadet")
@@ -2763,7 +3422,7 @@ def logout(self):
                 cadet_data["updated_at"] = datetime.now().isoformat()
                 
                 # Save to Firebase
-                cadet_ref = self.firebase.db.child("cadets").push(cadet_data)
+                self.firebase.push_data("cadets", cadet_data)
                 messagebox.showinfo("Success", "Cadet added successfully!")
                 dialog.destroy()
                 self.update_cadets_display()
@@ -2777,6 +3436,444 @@ def logout(self):
         cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=dialog.destroy)
         cancel_btn.pack(side="right", padx=10)
     
+    def sync_hours_ledger(self):
+        # Streamed totals with started_at mean the migration is done; later writes skip the claim
+        if isinstance(self.cs_hours_totals, dict) and self.cs_hours_totals.get("started_at"):
+            self.hours_ledger.started = True
+    
+    def log_hours_dialog(self, cadet_id):
+        """Append community service hours for one cadet to the ledger and show their history."""
+        cadet = self.cadets.get(cadet_id) if isinstance(self.cadets, dict) else None
+        if not isinstance(cadet, dict):
+            messagebox.showerror("Error", "Cadet not found.")
+            return
+        
+        name = f"{cadet.get('first_name', '')} {cadet.get('last_name', '')}".strip()
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title(f"Community Service - {name}")
+        dialog.geometry("520x560")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        hours, status = self.cadet_index.hours(cadet_id)
+        ctk.CTkLabel(
+            dialog,
+            text=f"{name}: {hours:g} of {REQUIRED_CS_HOURS} hours",
+            font=("Arial Bold", 16),
+            text_color=self.hours_colors[status]
+        ).pack(anchor="w", padx=20, pady=(20, 10))
+        
+        history_table = DataTable(
+            dialog,
+            columns=[("date", "Date", 100), ("event", "Event", 200), ("hours", "Hours", 70, "e"), ("by", "Entered By", 120)],
+            empty_text="Loading history...",
+            header_color=self.primary_color,
+            selectmode="browse"
+        )
+        history_table.pack(fill="both", expand=True, padx=20)
+        
+        form_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        form_frame.pack(fill="x", padx=20, pady=10)
+        
+        entries = {}
+        for column, (label, default, width) in enumerate((
+            ("Date", datetime.now().strftime("%Y-%m-%d"), 110),
+            ("Event", "", 200),
+            ("Hours", "", 70)
+        )):
+            ctk.CTkLabel(form_frame, text=label).grid(row=0, column=column, padx=5, sticky="w")
+            entry = ctk.CTkEntry(form_frame, width=width)
+            entry.insert(0, default)
+            entry.grid(row=1, column=column, padx=5)
+            entries[label.lower()] = entry
+        
+        ctk.CTkLabel(
+            dialog,
+            text="Entries cannot be edited; log negative hours to correct a mistake.",
+            font=("Arial", 11),
+            text_color="#666666"
+        ).pack(anchor="w", padx=20)
+        
+        def show_history(rows):
+            if dialog.winfo_exists():
+                history_table.set_rows(
+                    ((entry_id, (entry.get('date', ''), entry.get('event', ''), f"{float(entry.get('hours', 0)):g}", entry.get('entered_by', '')), ())
+                     for entry_id, entry in rows),
+                    empty_text="No hours logged yet."
+                )
+        
+        def load_history():
+            try:
+                rows = self.hours_ledger.history(cadet_id)
+            except Exception as e:
+                print(f"Error loading hours history: {e}")
+                rows = []
+            self.root.after(0, lambda: show_history(rows))
+        
+        def save():
+            try:
+                entry_date = datetime.strptime(entries["date"].get().strip(), "%Y-%m-%d").date().isoformat()
+                logged = parse_hours(entries["hours"].get())
+            except ValueError as e:
+                messagebox.showerror("Invalid Entry", f"Check the date (YYYY-MM-DD) and hours: {str(e)}", parent=dialog)
+                return
+            
+            entry = {"cadet_id": cadet_id, "date": entry_date, "event": entries["event"].get().strip(), "hours": logged}
+            cadets = dict(self.cadets)
+            entered_by = (self.current_user or {}).get('email', '')
+            save_btn.configure(state="disabled")
+            
+            def work():
+                try:
+                    self.hours_ledger.record([entry], cadets, entered_by)
+                except Exception as e:
+                    def failed(error=e):
+                        if save_btn.winfo_exists():
+                            save_btn.configure(state="normal")
+                        messagebox.showerror("Error", f"Failed to log hours: {str(error)}", parent=dialog)
+                    self.root.after(0, failed)
+                else:
+                    self.root.after(0, lambda: dialog.winfo_exists() and dialog.destroy())
+            
+            self.executor.submit(work)
+        
+        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        button_frame.pack(fill="x", padx=20, pady=(10, 20))
+        save_btn = ctk.CTkButton(button_frame, text="Log Hours", command=save, fg_color=self.success_color, hover_color="#45a049")
+        save_btn.pack(side="left")
+        ctk.CTkButton(button_frame, text="Close", command=dialog.destroy, fg_color="#9E9E9E").pack(side="right")
+        
+        entries["hours"].focus_set()
+        self.executor.submit(load_history)
+    
+    def bulk_hours_dialog(self):
+        """Enter community service hours for a whole flight or event in a grid and save them in one request."""
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title("Enter Community Service Hours")
+        dialog.geometry("720x680")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        cadets = self.cadets if isinstance(self.cadets, dict) else {}
+        flights = sorted({
+            str(cadet.get('flight', cadet.get('Flight', ''))).strip()
+            for cadet in cadets.values() if isinstance(cadet, dict)
+        } - {""})
+        all_flights = "All flights"
+        
+        events = {}
+        for event_id, event in sorted(
+                ((k, v) for k, v in (self.events or {}).items() if isinstance(v, dict)),
+                key=lambda item: str(item[1].get('date', '')), reverse=True):
+            label = f"{event.get('date', '')} {event.get('title', 'Untitled Event')}".strip()
+            events.setdefault(label, event)
+        no_event = "(no event)"
+        
+        options_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        options_frame.pack(fill="x", padx=20, pady=(20, 10))
+        
+        ctk.CTkLabel(options_frame, text="Flight").grid(row=0, column=0, padx=5, sticky="w")
+        flight_var = ctk.StringVar(value=all_flights)
+        ctk.CTkOptionMenu(options_frame, values=[all_flights, *flights], variable=flight_var, width=140,
+                          command=lambda _: build_grid()).grid(row=1, column=0, padx=5)
+        
+        ctk.CTkLabel(options_frame, text="From event").grid(row=0, column=1, padx=5, sticky="w")
+        event_var = ctk.StringVar(value=no_event)
+        ctk.CTkOptionMenu(options_frame, values=[no_event, *list(events)[:50]], variable=event_var, width=220,
+                          command=lambda label: pick_event(label)).grid(row=1, column=1, padx=5)
+        
+        ctk.CTkLabel(options_frame, text="Date").grid(row=0, column=2, padx=5, sticky="w")
+        date_entry = ctk.CTkEntry(options_frame, width=110)
+        date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        date_entry.grid(row=1, column=2, padx=5)
+        
+        ctk.CTkLabel(options_frame, text="Event").grid(row=0, column=3, padx=5, sticky="w")
+        event_entry = ctk.CTkEntry(options_frame, width=160)
+        event_entry.grid(row=1, column=3, padx=5)
+        
+        def pick_event(label):
+            event = events.get(label)
+            if event:
+                date_entry.delete(0, "end")
+                date_entry.insert(0, event.get('date', ''))
+                event_entry.delete(0, "end")
+                event_entry.insert(0, event.get('title', ''))
+        
+        ctk.CTkLabel(
+            dialog,
+            text="Tab and the arrow keys move between cells; paste a block from a spreadsheet to fill several at once.",
+            font=("Arial", 11),
+            text_color="#666666"
+        ).pack(anchor="w", padx=20)
+        
+        grid_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        grid_frame.pack(fill="both", expand=True, padx=20, pady=5)
+        
+        status_label = ctk.CTkLabel(dialog, text="", font=("Arial", 12), anchor="w")
+        status_label.pack(fill="x", padx=20)
+        
+        grid = [None]
+        shown_flight = [None]
+        
+        def count_changes():
+            entries, errors = grid_entries(
+                ((cadet_id, cells["hours"], cells["event"]) for cadet_id, cells in grid[0].values()), "", ""
+            )
+            text = f"{len(entries)} entr{'y' if len(entries) == 1 else 'ies'} to save"
+            if errors:
+                text += f", {len(errors)} invalid"
+            status_label.configure(text=text)
+        
+        def build_grid():
+            if grid[0] is not None:
+                if grid[0].dirty and not messagebox.askyesno(
+                        "Discard Hours", "Discard the hours entered for this flight?", parent=dialog):
+                    flight_var.set(shown_flight[0])
+                    return
+                grid[0].destroy()
+            
+            flight = shown_flight[0] = flight_var.get()
+            rows = []
+            for cadet_id, cadet in self.cadet_index.ordered((("name", False),)):
+                if flight != all_flights and str(cadet.get('flight', cadet.get('Flight', ''))).strip() != flight:
+                    continue
+                hours, status = self.cadet_index.hours(cadet_id)
+                name = f"{cadet.get('first_name', '')} {cadet.get('last_name', '')}".strip()
+                rows.append((cadet_id, name, cadet.get('flight', cadet.get('Flight', '')), hours, self.hours_colors[status]))
+            
+            grid[0] = HoursGrid(
+                grid_frame,
+                rows,
+                columns=[("hours", "Hours", 80), ("event", "Event (if different)", 200)],
+                on_change=count_changes,
+                header_color=self.primary_color
+            )
+            grid[0].pack(fill="both", expand=True)
+            count_changes()
+            if rows:
+                grid[0].focus_cell(0, 0)
+        
+        def close():
+            if grid[0] is not None and grid[0].dirty and not messagebox.askyesno(
+                    "Discard Hours", "Close without saving the hours entered?", parent=dialog):
+                return
+            dialog.destroy()
+        
+        def save():
+            try:
+                entry_date = datetime.strptime(date_entry.get().strip(), "%Y-%m-%d").date().isoformat()
+            except ValueError:
+                messagebox.showerror("Invalid Date", "Enter the date as YYYY-MM-DD.", parent=dialog)
+                return
+            
+            entries, errors = grid_entries(
+                ((cadet_id, cells["hours"], cells["event"]) for cadet_id, cells in grid[0].values()),
+                entry_date,
+                event_entry.get().strip()
+            )
+            grid[0].mark_errors(errors)
+            if errors:
+                messagebox.showerror("Invalid Hours", f"Fix the {len(errors)} highlighted cell(s) before saving.", parent=dialog)
+                return
+            if not entries:
+                messagebox.showinfo("Nothing to Save", "No hours have been entered.", parent=dialog)
+                return
+            
+            cadets_snapshot = dict(self.cadets)
+            entered_by = (self.current_user or {}).get('email', '')
+            save_btn.configure(state="disabled", text="Saving...")
+            
+            def work():
+                try:
+                    count = self.hours_ledger.record(entries, cadets_snapshot, entered_by)
+                except Exception as e:
+                    def failed(error=e):
+                        if save_btn.winfo_exists():
+                            save_btn.configure(state="normal", text="Save All")
+                        messagebox.showerror("Error", f"Failed to save hours: {str(error)}", parent=dialog)
+                    self.root.after(0, failed)
+                else:
+                    def done():
+                        if dialog.winfo_exists():
+                            dialog.destroy()
+                        messagebox.showinfo("Hours Saved", f"Logged {len(entries)} entr{'y' if len(entries) == 1 else 'ies'}"
+                                            + (f" and {count - len(entries)} opening balance(s)." if count > len(entries) else "."))
+                    self.root.after(0, done)
+            
+            self.executor.submit(work)
+        
+        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        button_frame.pack(fill="x", padx=20, pady=(5, 20))
+        save_btn = ctk.CTkButton(button_frame, text="Save All", command=save, fg_color=self.success_color, hover_color="#45a049")
+        save_btn.pack(side="left")
+        ctk.CTkButton(button_frame, text="Cancel", command=close, fg_color="#9E9E9E").pack(side="right")
+        dialog.protocol("WM_DELETE_WINDOW", close)
+        
+        build_grid()
+    
+    def import_roster_dialog(self):
+        """Map the columns of a CSV/XLSX roster, preview the import as a dry run, then write it in batches."""
+        from tkinter import filedialog
+        
+        path = filedialog.askopenfilename(
+            parent=self.root,
+            title="Import Roster",
+            filetypes=[("Roster files", "*.csv *.xlsx"), ("CSV", "*.csv"), ("Excel workbook", "*.xlsx")]
+        )
+        if not path:
+            return
+        
+        try:
+            headers = read_headers(path)
+        except Exception as e:
+            messagebox.showerror("Import Error", f"Failed to read {os.path.basename(path)}: {str(e)}")
+            return
+        if not headers:
+            messagebox.showerror("Import Error", "The file has no header row.")
+            return
+        
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title(f"Import Roster - {os.path.basename(path)}")
+        dialog.geometry("640x620")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        ctk.CTkLabel(
+            dialog,
+            text="Match each column to a cadet field",
+            font=("Arial Bold", 16),
+            text_color=self.primary_color
+        ).pack(anchor="w", padx=20, pady=(20, 5))
+        
+        mapping_frame = ctk.CTkScrollableFrame(dialog, fg_color="white", height=160)
+        mapping_frame.pack(fill="x", padx=20)
+        
+        ignore = "(ignore)"
+        mapping_vars = {}
+        for row, (header, field) in enumerate(suggest_mapping(headers).items()):
+            ctk.CTkLabel(mapping_frame, text=header, anchor="w", width=220).grid(row=row, column=0, padx=5, pady=2, sticky="w")
+            var = ctk.StringVar(value=field or ignore)
+            ctk.CTkOptionMenu(mapping_frame, values=[ignore, *ROSTER_FIELDS], variable=var, width=180).grid(row=row, column=1, padx=5, pady=2)
+            mapping_vars[header] = var
+        
+        update_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            dialog,
+            text="Update cadets that are already on the roster instead of skipping them",
+            variable=update_var
+        ).pack(anchor="w", padx=20, pady=10)
+        
+        summary_label = ctk.CTkLabel(dialog, text="Click Preview to validate the file.", font=("Arial", 12), anchor="w")
+        summary_label.pack(fill="x", padx=20)
+        
+        issues_table = DataTable(
+            dialog,
+            columns=[("row", "Row", 60, "e"), ("issue", "Not imported because", 480)],
+            empty_text="No problems found.",
+            header_color=self.primary_color,
+            selectmode="browse"
+        )
+        issues_table.pack(fill="both", expand=True, padx=20, pady=10)
+        
+        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        button_frame.pack(fill="x", padx=20, pady=(0, 20))
+        
+        state = {"plan": None}
+        
+        def set_busy(text):
+            summary_label.configure(text=text)
+            preview_btn.configure(state="disabled")
+            import_btn.configure(state="disabled")
+        
+        def current_mapping():
+            return {header: (None if var.get() == ignore else var.get()) for header, var in mapping_vars.items()}
+        
+        def show_plan(plan):
+            if not dialog.winfo_exists():
+                return
+            state["plan"] = plan
+            summary_label.configure(text=plan.summary())
+            issues_table.set_rows((f"{row}-{n}", (row, issue), ()) for n, (row, issue) in enumerate(plan.issues()))
+            preview_btn.configure(state="normal")
+            import_btn.configure(
+                text=f"Import {plan.write_count} Cadets",
+                state="normal" if plan.write_count else "disabled"
+            )
+        
+        def show_error(message):
+            if dialog.winfo_exists():
+                summary_label.configure(text=message)
+                preview_btn.configure(state="normal")
+        
+        def preview():
+            mapping = current_mapping()
+            fields = [field for field in mapping.values() if field]
+            if len(fields) != len(set(fields)):
+                messagebox.showerror("Import Error", "Each cadet field can only be mapped to one column.", parent=dialog)
+                return
+            
+            existing = dict(self.cadets or {})
+            update_existing = update_var.get()
+            set_busy("Validating...")
+            
+            def work():
+                try:
+                    plan = plan_import(path, existing, mapping, update_existing=update_existing)
+                except Exception as e:
+                    self.root.after(0, lambda error=e: show_error(f"Failed to read file: {str(error)}"))
+                else:
+                    self.root.after(0, lambda: show_plan(plan))
+            
+            self.executor.submit(work)
+        
+        def run_import():
+            plan = state["plan"]
+            if plan is None:
+                return
+            set_busy(f"Importing {plan.write_count} cadets...")
+            
+            def work():
+                try:
+                    written = apply_import(self.firebase, plan)
+                except Exception as e:
+                    def failed(error=e):
+                        show_error("Import failed")
+                        messagebox.showerror("Import Error", f"Failed to import cadets: {str(error)}", parent=dialog)
+                    self.root.after(0, failed)
+                else:
+                    def done():
+                        if dialog.winfo_exists():
+                            dialog.destroy()
+                        messagebox.showinfo("Import Complete", f"Imported {written} cadets.")
+                    self.root.after(0, done)
+            
+            self.executor.submit(work)
+        
+        preview_btn = ctk.CTkButton(button_frame, text="Preview", command=preview)
+        preview_btn.pack(side="left")
+        
+        import_btn = ctk.CTkButton(
+            button_frame,
+            text="Import",
+            command=run_import,
+            state="disabled",
+            fg_color=self.success_color,
+            hover_color="#45a049"
+        )
+        import_btn.pack(side="left", padx=10)
+        
+        ctk.CTkButton(button_frame, text="Cancel", command=dialog.destroy, fg_color="#9E9E9E").pack(side="right")
+        
+        # Changing the mapping invalidates the preview
+        def invalidate(*_):
+            state["plan"] = None
+            import_btn.configure(text="Import", state="disabled")
+        
+        for var in (*mapping_vars.values(), update_var):
+            var.trace_add("write", invalidate)
+        
+        preview()
+    
     def edit_uniform_dialog(self, uniform_id):
         if not hasattr(self, 'uniforms') or uniform_id not in self.uniforms:
             messagebox.showerror("Error", "Uniform item not found.")
@@ -2839,7 +3936,7 @@ def logout(self):
                 
                 updated_data["updated_at"] = datetime.now().isoformat()
                 
-                self.firebase.db.child("uniforms").child(uniform_id).update(updated_data)
+                self.firebase.update_data(f"uniforms/{uniform_id}", updated_data)
                 messagebox.showinfo("Success", "Uniform item updated successfully!")
                 dialog.destroy()
                 
@@ -2851,7 +3948,7 @@ def logout(self):
         def delete_uniform():
             if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this uniform item?"):
                 try:
-                    self.firebase.db.child("uniforms").child(uniform_id).remove()
+                    self.firebase.delete_data(f"uniforms/{uniform_id}")
                     messagebox.showinfo("Success", "Uniform item deleted successfully!")
                     dialog.destroy()
                     self.update_uniforms_display()
@@ -2924,12 +4021,11 @@ def logout(self):
                 uniform_data["created_at"] = datetime.now().isoformat()
                 uniform_data["updated_at"] = datetime.now().isoformat()
                 
-                self.firebase.db.child("uniforms").push(uniform_data)
+                self.firebase.push_data("uniforms", uniform_data)
                 messagebox.showinfo("Success", "Uniform item added successfully!")
                 dialog.destroy()
                 
-                if hasattr(self, 'show_uniforms'):
-                    self.show_uniforms()
+                self.show_uniforms()
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to add uniform item: {str(e)}")
@@ -3006,12 +4102,11 @@ def logout(self):
                 event_data["created_at"] = datetime.now().isoformat()
                 event_data["updated_at"] = datetime.now().isoformat()
                 
-                self.firebase.db.child("events").push(event_data)
+                self.firebase.push_data("events", event_data)
                 messagebox.showinfo("Success", "Event added successfully!")
                 dialog.destroy()
                 
-                if hasattr(self, 'show_calendar'):
-                    self.show_calendar()
+                self.show_calendar()
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to add event: {str(e)}")
@@ -3124,23 +4219,25 @@ def logout(self):
                     return
                 
                 try:
-                    fundraiser_data["goal_amount"] = float(fundraiser_data["goal_amount_$"].replace("$", "").strip())
-                    fundraiser_data["item_price"] = float(fundraiser_data["item_price_$"].replace("$", "").strip())
+                    fundraiser_data["goal_cents"] = to_cents(fundraiser_data["goal_amount_$"])
+                    fundraiser_data["item_price_cents"] = to_cents(fundraiser_data["item_price_$"])
+                    fundraiser_data["goal_amount"] = fundraiser_data["goal_cents"] / 100
+                    fundraiser_data["item_price"] = fundraiser_data["item_price_cents"] / 100
                 except ValueError:
                     messagebox.showerror("Error", "Please enter valid numbers for goal amount and item price")
                     return
                 
                 fundraiser_data["created_at"] = datetime.now().isoformat()
                 fundraiser_data["updated_at"] = datetime.now().isoformat()
-                fundraiser_data["total_raised"] = 0.0
+                fundraiser_data["raised_cents"] = 0
+                fundraiser_data["transaction_count"] = 0
                 fundraiser_data["participants"] = 0
                 
-                self.firebase.db.child("fundraisers").push(fundraiser_data)
+                self.firebase.push_data("fundraisers", fundraiser_data)
                 messagebox.showinfo("Success", "Fundraiser added successfully!")
                 dialog.destroy()
                 
-                if hasattr(self, 'show_fundraisers'):
-                    self.show_fundraisers()
+                self.show_fundraisers()
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to add fundraiser: {str(e)}")
@@ -3241,12 +4338,11 @@ def logout(self):
                 contact_data["created_at"] = datetime.now().isoformat()
                 contact_data["updated_at"] = datetime.now().isoformat()
                 
-                self.firebase.db.child("contacts").push(contact_data)
+                self.firebase.push_data("contacts", contact_data)
                 messagebox.showinfo("Success", "Contact added successfully!")
                 dialog.destroy()
                 
-                if hasattr(self, 'show_contacts'):
-                    self.show_contacts()
+                self.show_contacts()
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to add contact: {str(e)}")
@@ -3277,116 +4373,172 @@ def logout(self):
             h_scroll.pack(side="bottom", fill="x")
             text_widget.configure(xscrollcommand=h_scroll.set)
             
-            if report_type == "Cadet Roster":
-                self._generate_cadet_roster(text_widget)
-            elif report_type == "Event Attendance":
-                self._generate_event_attendance(text_widget)
-            elif report_type == "Fundraiser Summary":
-                self._generate_fundraiser_summary(text_widget)
-            elif report_type == "Uniform Inventory":
-                self._generate_uniform_inventory(text_widget)
-            elif report_type == "Contact Directory":
-                self._generate_contact_directory(text_widget)
-            else:
-                text_widget.insert("end", f"Report type '{report_type}' is not implemented yet.\n")
+            status_frame = ctk.CTkFrame(report_window, fg_color="transparent")
+            status_frame.pack(fill="x", padx=10)
+            
+            progress_bar = ctk.CTkProgressBar(status_frame)
+            progress_bar.set(0)
+            progress_bar.pack(side="left", fill="x", expand=True, padx=(5, 10))
+            
+            status_label = ctk.CTkLabel(status_frame, text="Generating...", text_color="#555555", width=120)
+            status_label.pack(side="right")
             
             button_frame = ctk.CTkFrame(report_window)
-            button_frame.pack(fill="x", padx=10, pady=(0, 10))
+            button_frame.pack(fill="x", padx=10, pady=(5, 10))
             
-            def export_report():
-                try:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"{report_type.replace(' ', '_')}_{timestamp}.txt"
-                    
-                    report_content = text_widget.get("1.0", "end-1c")
-                    
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        f.write(report_content)
-                    
-                    messagebox.showinfo("Export Successful", f"Report exported to:\n{os.path.abspath(filename)}")
-                except Exception as e:
-                    messagebox.showerror("Export Error", f"Failed to export report: {str(e)}")
+            cancel_event = threading.Event()
+            export_cancel_event = threading.Event()
+            
+            def export_to_file():
+                self.export_report_file(report_type, report_window, status_label, export_cancel_event)
+            
+            def cancel_report():
+                cancel_event.set()
+                status_label.configure(text="Cancelling...")
+            
+            def close_report():
+                cancel_event.set()
+                export_cancel_event.set()
+                report_window.destroy()
             
             export_btn = ctk.CTkButton(
                 button_frame, 
                 text="Export to File",
-                command=export_report
+                command=export_to_file,
+                state="normal" if supported_formats(report_type) else "disabled"
             )
             export_btn.pack(side="right", padx=5)
             
             close_btn = ctk.CTkButton(
                 button_frame,
                 text="Close",
-                command=report_window.destroy
+                command=close_report
             )
             close_btn.pack(side="right", padx=5)
             
-        except Exception as e:
-            messagebox.showerror("Report Error", f"Failed to generate report: {str(e)}")
-    
-    def _generate_cadet_roster(self, text_widget):
-        try:
-            text_widget.insert("end", "AFJROTC CADET ROSTER\n")
-            text_widget.insert("end", "=" * 80 + "\n\n")
-            text_widget.insert("end", f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            cancel_btn = ctk.CTkButton(
+                button_frame,
+                text="Cancel",
+                command=cancel_report,
+                fg_color=self.danger_color,
+                hover_color="#c43e3e"
+            )
+            cancel_btn.pack(side="left", padx=5)
             
-            companies = {}
-            companies = {}
-            for cadet_id, cadet in self.cadets.items():
-                company = cadet.get('company', 'U')
-                flight = cadet.get('flight', '0')
-                
-                if company not in companies:
-                    companies[company] = {}
-                if flight not in companies[company]:
-                    companies[company][flight] = []
-                
-                companies[company][flight].append(cadet)
+            report_window.protocol("WM_DELETE_WINDOW", close_report)
             
-            for company in sorted(companies.keys()):
-                text_widget.insert("end", f"COMPANY {company}\n")
-                text_widget.insert("end", "-" * 80 + "\n")
-                
-                for flight in sorted(companies[company].keys()):
-                    text_widget.insert("end", f"FLIGHT {flight}:\n")
-                    
-                    cadets = sorted(
-                        companies[company][flight],
-                        key=lambda x: (x.get('last_name', ''), x.get('first_name', ''))
-                    )
-                    
-                    for cadet in cadets:
-                        text_widget.insert(
-                            "end",
-                            f"{cadet.get('last_name', 'N/A')}, {cadet.get('first_name', 'N/A')} "
-                            f"(Grade: {cadet.get('grade', 'N/A')}, "
-                            f"Rank: {cadet.get('rank', 'N/A')})\n"
-                        )
-                    
-                    text_widget.insert("end", "\n")
-                
-                text_widget.insert("end", "\n")
+            if report_type not in REPORTS:
+                text_widget.insert("end", f"Report type '{report_type}' is not implemented yet.\n")
+                progress_bar.set(1)
+                status_label.configure(text="Done")
+                cancel_btn.configure(state="disabled")
+                return
             
-            total_cadets = len(self.cadets)
-            text_widget.insert("end", f"TOTAL CADETS: {total_cadets}\n")
+            self._run_report(report_type, text_widget, progress_bar, status_label, cancel_event,
+                             on_finish=lambda: cancel_btn.configure(state="disabled"))
             
         except Exception as e:
-            text_widget.insert("end", f"\nError generating cadet roster: {str(e)}\n")
-    
-    def _generate_event_attendance(self, text_widget):
-        text_widget.insert("end", "EVENT ATTENDANCE REPORT\n")
-        text_widget.insert("end", "=" * 80 + "\n\n")
-        text_widget.insert("end", "This report is not yet implemented.\n")
+            messagebox.showerror("Report Error", f"Failed to generate report: {str(e)}")
     
-    def _generate_fundraiser_summary(self, text_widget):
-        text_widget.insert("end", "FUNDRAISER SUMMARY REPORT\n")
-        text_widget.insert("end", "=" * 80 + "\n\n")
-        text_widget.insert("end", "This report is not yet implemented.\n")
+    def export_report_file(self, report_type, parent, status_label, cancel_event):
+        """Ask for a destination and stream the report there from the data layer on the executor."""
+        from tkinter import filedialog
+        
+        formats = supported_formats(report_type)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = filedialog.asksaveasfilename(
+            parent=parent,
+            title="Export Report",
+            initialfile=f"{report_type.replace(' ', '_')}_{timestamp}{formats[0]}",
+            defaultextension=formats[0],
+            filetypes=[(FORMATS[ext], f"*{ext}") for ext in formats]
+        )
+        if not path:
+            return
+        
+        _, collections = REPORTS[report_type]
+        data = {collection: dict(getattr(self, collection, None) or {}) for collection in collections}
+        last_percent = [-1]
+        
+        def set_status(text):
+            self.root.after(0, lambda: status_label.winfo_exists() and status_label.configure(text=text))
+        
+        def progress(done, total):
+            percent = int(done * 100 / total) if total else 100
+            if percent != last_percent[0]:
+                last_percent[0] = percent
+                set_status(f"Exporting {percent}%")
+        
+        def work():
+            try:
+                export_report(report_type, data, path, progress=progress, cancelled=cancel_event.is_set)
+            except ExportCancelled:
+                set_status("Export cancelled")
+            except Exception as e:
+                set_status("Export failed")
+                self.root.after(0, lambda error=e: messagebox.showerror("Export Error", f"Failed to export report: {str(error)}"))
+            else:
+                set_status("Exported")
+                self.root.after(0, lambda: messagebox.showinfo("Export Successful", f"Report exported to:\n{os.path.abspath(path)}"))
+        
+        set_status("Exporting...")
+        self.executor.submit(work)
     
-    def _generate_uniform_inventory(self, text_widget):
-        text_widget.insert("end", "UNIFORM INVENTORY REPORT\n")
-        text_widget.insert("end", "=" * 80 + "\n\n")
-        text_widget.insert("end", "This report is not yet implemented.\n")
+    def _run_report(self, report_type, text_widget, progress_bar, status_label, cancel_event, on_finish):
+        """Build a report on the executor and stream it into ``text_widget`` in large chunks."""
+        builder, collections = REPORTS[report_type]
+        # Snapshot on the Tk thread so stream updates cannot mutate the dicts mid-report
+        data = {collection: dict(getattr(self, collection, None) or {}) for collection in collections}
+        messages = queue.Queue()
+        last_percent = [-1]
+        
+        def progress(done, total):
+            percent = int(done * 100 / total) if total else 100
+            if percent != last_percent[0]:
+                last_percent[0] = percent
+                messages.put(("progress", percent / 100))
+        
+        def work():
+            try:
+                for chunk in chunked(builder(data, progress), cancelled=cancel_event.is_set):
+                    messages.put(("text", chunk))
+                messages.put(("done", None))
+            except Exception as e:
+                messages.put(("error", e))
+        
+        def poll():
+            if not text_widget.winfo_exists():
+                cancel_event.set()
+                return
+            
+            # Bound the work per tick so the window stays responsive while chunks pile up
+            for _ in range(8):
+                try:
+                    kind, value = messages.get_nowait()
+                except queue.Empty:
+                    break
+                
+                if kind == "text":
+                    text_widget.insert("end", value)
+                elif kind == "progress":
+                    progress_bar.set(value)
+                else:
+                    if kind == "error":
+                        text_widget.insert("end", f"\nError generating {report_type.lower()}: {str(value)}\n")
+                        status_label.configure(text="Failed")
+                    elif cancel_event.is_set():
+                        text_widget.insert("end", "\n[Report cancelled]\n")
+                        status_label.configure(text="Cancelled")
+                    else:
+                        progress_bar.set(1)
+                        status_label.configure(text="Done")
+                    on_finish()
+                    return
+            
+            text_widget.after(50, poll)
+        
+        self.executor.submit(work)
+        poll()
     
     def edit_contact_dialog(self, contact_id):
         if not hasattr(self, 'contacts') or contact_id not in self.contacts:
@@ -3461,7 +4613,7 @@ def logout(self):
                 
                 contact_data["updated_at"] = datetime.now().isoformat()
                 
-                self.firebase.db.child("contacts").child(contact_id).update(contact_data)
+                self.firebase.update_data(f"contacts/{contact_id}", contact_data)
                 
                 if hasattr(self, 'current_user') and self.current_user:
                     analytics.capture(
@@ -3476,8 +4628,7 @@ def logout(self):
                 messagebox.showinfo("Success", "Contact updated successfully!")
                 dialog.destroy()
                 
-                if hasattr(self, 'show_contacts'):
-                    self.show_contacts()
+                self.show_contacts()
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to update contact: {str(e)}")
@@ -3488,6 +4639,32 @@ def logout(self):
         cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=dialog.destroy)
         cancel_btn.pack(side="left", padx=10)
     
+    def delete_fundraiser(self, fundraiser_id):
+        if fundraiser_id not in (self.fundraisers or {}):
+            messagebox.showerror("Error", "Fundraiser not found.")
+            return
+        
+        if not messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this fundraiser?"):
+            return
+        
+        try:
+            self.fundraiser_ledger.delete(fundraiser_id)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to delete fundraiser: {str(e)}")
+    
+    def delete_uniform(self, uniform_id):
+        if uniform_id not in (self.uniforms or {}):
+            messagebox.showerror("Error", "Uniform item not found.")
+            return
+        
+        if not messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this uniform item?"):
+            return
+        
+        try:
+            self.firebase.delete_data(f"uniforms/{uniform_id}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to delete uniform item: {str(e)}")
+    
     def delete_contact(self, contact_id):
         if not hasattr(self, 'contacts') or contact_id not in self.contacts:
             messagebox.showerror("Error", "Contact not found")
@@ -3498,7 +4675,7 @@ def logout(self):
             return
             
         try:
-            self.firebase.db.child("contacts").child(contact_id).remove()
+            self.firebase.delete_data(f"contacts/{contact_id}")
             
             if hasattr(self, 'current_user') and self.current_user:
                 analytics.capture(
@@ -3509,17 +4686,11 @@ def logout(self):
             
             messagebox.showinfo("Success", "Contact deleted successfully!")
             
-            if hasattr(self, 'show_contacts'):
-                self.show_contacts()
+            self.show_contacts()
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to delete contact: {str(e)}")
     
-    def _generate_contact_directory(self, text_widget):
-        text_widget.insert("end", "CONTACT DIRECTORY\n")
-        text_widget.insert("end", "=" * 80 + "\n\n")
-        text_widget.insert("end", "This report is not yet implemented.\n")
-    
     def change_theme(self, event=None):
         try:
             current_mode = ctk.get_appearance_mode()
@@ -3540,27 +4711,18 @@ def logout(self):
         except Exception as e:
             messagebox.showerror("Theme Error", f"Failed to change theme: {str(e)}")
     
-    def _update_dashboard_stats(self):
-        try:
-            if not hasattr(self, 'content_frame') or not self.content_frame:
-                return
-                
-            if hasattr(self, 'cadets'):
-                cadet_count = len(self.cadets)
-                if hasattr(self, 'cadet_count_label'):
-                    self.cadet_count_label.configure(text=str(cadet_count))
-            
-        except Exception as e:
-            print(f"Error updating dashboard stats: {e}")
-            self.root.after(30000, self.update_dashboard)
-
     def update_upcoming_events(self, update_dashboard=False):
         try:
             today = datetime.now().date()
             seven_days_later = today + timedelta(days=7)
             new_upcoming_events = []
             
-            for event_id, event in self.events.items():
+            # The streamed collection when the calendar has it open, else the dashboard's bounded read
+            events = self.events
+            if "events" not in self._stream_subscriptions and self.dashboard_events:
+                events = self.dashboard_events
+            
+            for event_id, event in events.items():
                 try:
                     if not isinstance(event, dict) or 'date' not in event:
                         continue
@@ -3683,57 +4845,57 @@ def logout(self):
                 except Exception as log_error:
                     print(f"Error logging activity: {log_error}")
 
-def update_dashboard(self, force_update=False):
-    try:
-        if not hasattr(self, 'dashboard_frame') or not self.dashboard_frame.winfo_exists():
-            return
-            
-        if getattr(self, '_updating_dashboard', False):
-            return
-            
-        self._updating_dashboard = True
-            
-        if hasattr(self, '_dashboard_update_id'):
-            try:
-                self.root.after_cancel(self._dashboard_update_id)
-            except Exception as cancel_error:
-                print(f"Error cancelling pending update: {cancel_error}")
-        
+    def update_dashboard(self, force_update=False):
         try:
-            self._update_dashboard_stats()
-            
-            if hasattr(self, 'update_upcoming_events'):
-                self.update_upcoming_events(update_dashboard=False)
+            if not hasattr(self, 'dashboard_frame') or not self.dashboard_frame.winfo_exists():
+                return
+                
+            if getattr(self, '_updating_dashboard', False):
+                return
+                
+            self._updating_dashboard = True
+                
+            if hasattr(self, '_dashboard_update_id'):
+                try:
+                    self.root.after_cancel(self._dashboard_update_id)
+                except Exception as cancel_error:
+                    print(f"Error cancelling pending update: {cancel_error}")
             
-            if hasattr(self, 'cadets_list_frame') and self.cadets_list_frame.winfo_exists():
-                self._update_cadets_list()
+            try:
+                self._update_dashboard_stats()
                 
-            if hasattr(self, 'events_list_frame') and self.events_list_frame.winfo_exists():
-                self._update_events_list()
+                self.update_upcoming_events(update_dashboard=False)
+                self._update_dashboard_counts()
                 
-            if hasattr(self, 'jobs_list_frame') and self.jobs_list_frame.winfo_exists():
-                self._update_jobs_list()
+                if hasattr(self, 'cadets_list_frame') and self.cadets_list_frame.winfo_exists():
+                    self._update_cadets_list()
+                    
+                if hasattr(self, 'events_list_frame') and self.events_list_frame.winfo_exists():
+                    self._update_events_list()
+                    
+                if hasattr(self, 'jobs_list_frame') and self.jobs_list_frame.winfo_exists():
+                    self._update_jobs_list()
+                    
+                if hasattr(self, 'fundraisers_list_frame') and self.fundraisers_list_frame.winfo_exists():
+                    self._update_fundraisers_list()
                 
-            if hasattr(self, 'fundraisers_list_frame') and self.fundraisers_list_frame.winfo_exists():
-                self._update_fundraisers_list()
+            except Exception as update_error:
+                import traceback
+                error_msg = f"Error in dashboard update: {str(update_error)}\n{traceback.format_exc()}"
+                print(error_msg)
             
-        except Exception as update_error:
+            try:
+                self._dashboard_update_id = self.root.after(30000, lambda: self.update_dashboard(force_update))
+            except Exception as update_err:
+                print(f"Error scheduling next update: {str(update_err)}")
+                
+        except Exception as err:
             import traceback
-            error_msg = f"Error in dashboard update: {str(update_error)}\n{traceback.format_exc()}"
+            error_msg = f"Error in update_dashboard: {str(err)}\n{traceback.format_exc()}"
             print(error_msg)
-        
-        try:
-            self._dashboard_update_id = self.root.after(30000, lambda: self.update_dashboard(force_update))
-        except Exception as update_err:
-            print(f"Error scheduling next update: {str(update_err)}")
             
-    except Exception as err:
-        import traceback
-        error_msg = f"Error in update_dashboard: {str(err)}\n{traceback.format_exc()}"
-        print(error_msg)
-        
-    finally:
-        self._updating_dashboard = False
+        finally:
+            self._updating_dashboard = False
 
     def _update_dashboard_stats(self):
         try:
@@ -3764,14 +4926,12 @@ def update_dashboard(self, force_update=False):
                     grade = str(cadet.get('grade', '')).strip()
                     if grade in stats['grade_counts']:
                         stats['grade_counts'][grade] += 1
-                    
-                    try:
-                        hours = float(cadet.get('communityServiceHours', 0))
-                        stats['total_community_service'] += hours
-                        if hours < 16:
-                            stats['cadets_needing_hours'] += 1
-                    except (ValueError, TypeError):
-                        pass
+                
+                # Hours come from the materialized totals rather than a pass over every cadet
+                self.cadet_index.sync(self.cadets)
+                totals = self.cs_hours_totals if isinstance(self.cs_hours_totals, dict) else {}
+                stats['total_community_service'] = float(totals.get('all', self.cadet_index.total_hours) or 0)
+                stats['cadets_needing_hours'] = self.cadet_index.status_counts['red'] + self.cadet_index.status_counts['yellow']
             
             if hasattr(self, 'events') and isinstance(self.events, dict):
                 now = datetime.now()
@@ -4011,8 +5171,8 @@ def update_dashboard(self, force_update=False):
                 button_frame = ctk.CTkFrame(card, fg_color="transparent")
                 button_frame.grid(row=0, column=4, padx=5, pady=5, sticky="e")
                 
-                edit_icon = self.create_icon(button_frame, self.edit_icon_text, "white")
-                delete_icon = self.create_icon(button_frame, self.delete_icon_text, "white")
+                edit_icon = self.create_icon("edit", "white")
+                delete_icon = self.create_icon("delete", "white")
                 
                 edit_btn = ctk.CTkButton(
                     button_frame, 
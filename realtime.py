@@ -0,0 +1,360 @@
+import random
+import threading
+import time
+
+
+def split_path(path):
+    return [part for part in str(path or "").split("/") if part]
+
+
+def join_path(parts):
+    return "/" + "/".join(parts)
+
+
+def _as_dict(data):
+    if isinstance(data, list):
+        return {str(idx): item for idx, item in enumerate(data) if item is not None}
+    return data
+
+
+def apply_stream_event(store, path, data, event="put"):
+    """Apply a put/patch stream message to a local collection dict and return it."""
+    parts = split_path(path)
+    data = _as_dict(data)
+
+    if not isinstance(store, dict):
+        store = {}
+
+    if event == "patch":
+        if not isinstance(data, dict):
+            return store
+        for key, value in data.items():
+            store = apply_stream_event(store, join_path(parts + split_path(key)), value, "put")
+        return store
+
+    if not parts:
+        return dict(data) if isinstance(data, dict) else {}
+
+    node = store
+    for part in parts[:-1]:
+        child = node.get(part)
+        if not isinstance(child, dict):
+            if data is None:
+                return store
+            child = {}
+            node[part] = child
+        node = child
+
+    if data is None:
+        node.pop(parts[-1], None)
+    else:
+        node[parts[-1]] = data
+    return store
+
+
+def changed_children(path, data, event="put"):
+    """Return the top-level keys touched by a stream message, or None if the whole collection was replaced."""
+    parts = split_path(path)
+    if parts:
+        return {parts[0]}
+    if event == "patch" and isinstance(data, dict):
+        return {split_path(key)[0] for key in data if split_path(key)}
+    return None
+
+
+def _subtree(data, parts):
+    for part in parts:
+        data = _as_dict(data)
+        if not isinstance(data, dict):
+            return None
+        data = data.get(part)
+    return data
+
+
+class StreamManager:
+    """Multiplexes one database stream per root across many path subscriptions.
+
+    A supervisor thread watches every open stream and reconnects dropped ones
+    with jittered exponential backoff. A reopened stream starts with a full
+    snapshot of its root, which brings subscribers back up to date.
+
+    A stream that cannot be opened when first subscribed is left to the
+    supervisor as if it had dropped, so ``subscribe`` does not raise for a
+    connection failure.
+
+    Streams are opened from the caller's thread and from the supervisor, so
+    ``new_database`` (when given) supplies a separate pyrebase handle for
+    each connection instead of sharing ``db`` and its path state.
+    """
+
+    def __init__(self, db, token_provider=None, base_delay=1.0, max_delay=60.0,
+                 check_interval=2.0, new_database=None):
+        self.db = db
+        self.token_provider = token_provider
+        self.new_database = new_database
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.check_interval = check_interval
+        self._lock = threading.RLock()
+        self._streams = {}
+        self._subscriptions = {}
+        self._state = {}
+        self._next_id = 0
+        self._stop = threading.Event()
+        self._supervisor = None
+
+    def subscribe(self, path, handler, root=""):
+        root = "/".join(split_path(root))
+        with self._lock:
+            self._next_id += 1
+            subscription_id = self._next_id
+            self._subscriptions[subscription_id] = (root, split_path(path), handler)
+
+            if root not in self._streams and root not in self._state:
+                self._open(root)
+        return subscription_id
+
+    def unsubscribe(self, subscription_id):
+        stream = None
+        with self._lock:
+            subscription = self._subscriptions.pop(subscription_id, None)
+            if subscription is None:
+                return
+
+            root = subscription[0]
+            if self.refcount(root) == 0:
+                stream = self._streams.pop(root, None)
+                self._state.pop(root, None)
+
+        self._close_stream(root, stream)
+
+    def refcount(self, root=""):
+        root = "/".join(split_path(root))
+        with self._lock:
+            return sum(1 for sub_root, _, _ in self._subscriptions.values() if sub_root == root)
+
+    def is_subscribed(self, path, root=""):
+        root = "/".join(split_path(root))
+        parts = split_path(path)
+        with self._lock:
+            return any(
+                sub_root == root and sub_parts == parts
+                for sub_root, sub_parts, _ in self._subscriptions.values()
+            )
+
+    def stats(self, root=None):
+        """Return connection health, reconnect counts and downtime per root."""
+        now = time.time()
+        with self._lock:
+            result = {}
+            for state_root, state in self._state.items():
+                downtime = state["downtime"]
+                if state["disconnected_at"] is not None:
+                    downtime += now - state["disconnected_at"]
+                result[state_root] = {
+                    "connected": state["disconnected_at"] is None,
+                    "reconnects": state["reconnects"],
+                    "failed_attempts": state["attempt"],
+                    "downtime": downtime,
+                    "last_event": state["last_event"],
+                    "last_disconnect": state["last_disconnect"],
+                }
+
+        if root is not None:
+            return result.get("/".join(split_path(root)))
+        return result
+
+    def reconnect(self):
+        """Reopen every live stream, e.g. after the ID token was refreshed."""
+        with self._lock:
+            roots = [root for root, state in self._state.items() if state["disconnected_at"] is None]
+
+        for root in roots:
+            try:
+                stream = self._connect(root)
+            except Exception:
+                continue
+
+            with self._lock:
+                if root not in self._state:
+                    old = stream
+                else:
+                    old = self._streams.get(root)
+                    self._streams[root] = stream
+            self._close_stream(root, old)
+
+    def close(self):
+        self._stop.set()
+        with self._lock:
+            streams = list(self._streams.items())
+            self._streams.clear()
+            self._subscriptions.clear()
+            self._state.clear()
+
+        for root, stream in streams:
+            self._close_stream(root, stream)
+
+    def _open(self, root):
+        if root not in self._state:
+            self._state[root] = {
+                "reconnects": 0,
+                "attempt": 0,
+                "downtime": 0.0,
+                "disconnected_at": None,
+                "last_disconnect": None,
+                "last_event": None,
+                "next_attempt": 0.0,
+                "failed": False,
+            }
+
+        self._ensure_supervisor()
+        try:
+            self._streams[root] = self._connect(root)
+        except Exception:
+            # Offline when first subscribed: leave the root disconnected so the supervisor retries it
+            state = self._state[root]
+            now = time.time()
+            state["disconnected_at"] = now
+            state["last_disconnect"] = now
+            state["next_attempt"] = now + self._backoff(state["attempt"])
+
+    def _connect(self, root):
+        token = self.token_provider() if self.token_provider else None
+
+        def handler(message):
+            self._dispatch(root, message)
+
+        db = self.new_database() if self.new_database else self.db
+        try:
+            return db.child(root).stream(handler, token=token)
+        except Exception as e:
+            print(f"Error opening stream on '/{root}': {e}")
+            raise
+
+    def _ensure_supervisor(self):
+        if self._supervisor is not None and self._supervisor.is_alive():
+            return
+
+        self._stop.clear()
+        self._supervisor = threading.Thread(target=self._supervise, name="stream-supervisor", daemon=True)
+        self._supervisor.start()
+
+    def _backoff(self, attempt):
+        # Full jitter keeps many clients from reconnecting in lockstep.
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def _is_alive(self, stream):
+        thread = getattr(stream, "thread", None)
+        return thread is None or thread.is_alive()
+
+    def _supervise(self):
+        while not self._stop.wait(self.check_interval):
+            with self._lock:
+                roots = list(self._state.keys())
+
+            for root in roots:
+                try:
+                    self._check(root)
+                except Exception as e:
+                    print(f"Error supervising stream on '/{root}': {e}")
+
+    def _check(self, root):
+        now = time.time()
+        dropped = None
+        with self._lock:
+            state = self._state.get(root)
+            if state is None:
+                return
+
+            stream = self._streams.get(root)
+            if state["disconnected_at"] is None:
+                if stream is not None and self._is_alive(stream) and not state["failed"]:
+                    return
+
+                state["disconnected_at"] = now
+                state["last_disconnect"] = now
+                state["next_attempt"] = now + self._backoff(state["attempt"])
+                dropped = self._streams.pop(root, None)
+                print(f"Realtime stream on '/{root}' disconnected; reconnecting")
+
+        if dropped is not None:
+            self._close_stream(root, dropped)
+            return
+
+        if now < state["next_attempt"]:
+            return
+
+        try:
+            stream = self._connect(root)
+        except Exception:
+            with self._lock:
+                state["attempt"] += 1
+                state["next_attempt"] = time.time() + self._backoff(state["attempt"])
+            return
+
+        with self._lock:
+            if self._state.get(root) is not state:
+                self._close_stream(root, stream)
+                return
+
+            self._streams[root] = stream
+            state["downtime"] += time.time() - state["disconnected_at"]
+            state["disconnected_at"] = None
+            state["failed"] = False
+            state["attempt"] = 0
+            state["reconnects"] += 1
+
+    def _close_stream(self, root, stream):
+        if stream is None:
+            return
+
+        try:
+            stream.close()
+        except Exception as e:
+            print(f"Error closing stream on '/{root}': {e}")
+
+    def _targets(self, root):
+        with self._lock:
+            return [
+                (sub_parts, handler)
+                for sub_root, sub_parts, handler in self._subscriptions.values()
+                if sub_root == root
+            ]
+
+    def _dispatch(self, root, message):
+        event = message.get("event")
+
+        with self._lock:
+            state = self._state.get(root)
+            if state is not None:
+                state["last_event"] = time.time()
+                if event in ("cancel", "auth_revoked"):
+                    state["failed"] = True
+
+        if event not in ("put", "patch"):
+            return
+
+        parts = split_path(message.get("path"))
+        data = message.get("data")
+
+        if event == "patch":
+            if not isinstance(data, dict):
+                return
+            for key, value in data.items():
+                self._route(root, parts + split_path(key), value)
+        else:
+            self._route(root, parts, data)
+
+    def _route(self, root, parts, data):
+        for sub_parts, handler in self._targets(root):
+            if parts[:len(sub_parts)] == sub_parts:
+                routed = {"event": "put", "path": join_path(parts[len(sub_parts):]), "data": data}
+            elif sub_parts[:len(parts)] == parts:
+                routed = {"event": "put", "path": "/", "data": _subtree(data, sub_parts[len(parts):])}
+            else:
+                continue
+
+            try:
+                handler(routed)
+            except Exception as e:
+                print(f"Error in stream handler for '{join_path(sub_parts)}': {e}")
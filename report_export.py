@@ -0,0 +1,168 @@
+"""Write reports from data snapshots to CSV, XLSX, PDF or text files.
+
+CSV, XLSX and text exports write rows as they are produced, so memory use
+does not grow with the size of the roster. PDF is the exception: reportlab
+keeps every finished page in memory until the file is saved, so PDF exports
+are capped at ``PDF_MAX_ROWS`` rows. XLSX export needs openpyxl and PDF export
+needs reportlab; both are imported only when used.
+"""
+
+import csv
+import os
+from datetime import datetime
+
+from reports import REPORTS, TABLES
+
+FORMATS = {
+    ".csv": "CSV",
+    ".xlsx": "Excel workbook",
+    ".pdf": "PDF",
+    ".txt": "Text",
+}
+
+# reportlab holds the whole document until save(); larger reports should go to CSV or XLSX
+PDF_MAX_ROWS = 5000
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+def _guard(rows, cancelled):
+    for row in rows:
+        if cancelled is not None and cancelled():
+            raise ExportCancelled()
+        yield row
+
+
+def export_csv(path, title, columns, rows):
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(row)
+
+
+def export_xlsx(path, title, columns, rows):
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise RuntimeError("Excel export requires openpyxl (pip install openpyxl)") from None
+
+    # Write-only workbooks stream rows to disk instead of keeping cells in memory.
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=title[:31])
+    sheet.append(list(columns))
+    for row in rows:
+        sheet.append(list(row))
+    workbook.save(path)
+
+
+def export_pdf(path, title, columns, rows, font_size=9, max_rows=PDF_MAX_ROWS):
+    try:
+        from reportlab.lib.pagesizes import letter, landscape
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+        from reportlab.pdfgen import canvas
+    except ImportError:
+        raise RuntimeError("PDF export requires reportlab (pip install reportlab)") from None
+
+    page_width, page_height = landscape(letter)
+    margin = 36
+    row_height = font_size + 5
+    column_width = (page_width - 2 * margin) / len(columns)
+    generated = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    pdf = canvas.Canvas(path, pagesize=(page_width, page_height))
+    page = 0
+
+    def fit(text):
+        text = "" if text is None else str(text)
+        limit = column_width - 6
+        if stringWidth(text, "Helvetica", font_size) <= limit:
+            return text
+        # Width grows with the prefix length, so binary search the longest prefix that fits.
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if stringWidth(text[:middle] + "…", "Helvetica", font_size) <= limit:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low] + "…"
+
+    def start_page():
+        nonlocal page
+        page += 1
+        pdf.setFont("Helvetica-Bold", 14)
+        pdf.drawString(margin, page_height - margin, title)
+        pdf.setFont("Helvetica", 8)
+        pdf.drawRightString(page_width - margin, page_height - margin, f"Generated {generated}   Page {page}")
+
+        y = page_height - margin - 24
+        pdf.setFont("Helvetica-Bold", font_size)
+        for index, column in enumerate(columns):
+            pdf.drawString(margin + index * column_width, y, fit(column))
+        pdf.line(margin, y - 3, page_width - margin, y - 3)
+        pdf.setFont("Helvetica", font_size)
+        return y - row_height
+
+    y = start_page()
+    for count, row in enumerate(rows, 1):
+        if count > max_rows:
+            raise ValueError(f"PDF export is limited to {max_rows} rows; export this report as CSV or Excel instead")
+        if y < margin:
+            pdf.showPage()
+            y = start_page()
+        for index, value in enumerate(row):
+            pdf.drawString(margin + index * column_width, y, fit(value))
+        y -= row_height
+
+    pdf.save()
+
+
+def export_text(path, lines):
+    with open(path, "w", encoding="utf-8") as f:
+        for line in lines:
+            f.write(line)
+
+
+TABLE_EXPORTERS = {
+    ".csv": export_csv,
+    ".xlsx": export_xlsx,
+    ".pdf": export_pdf,
+}
+
+
+def supported_formats(report_type):
+    if report_type in TABLES:
+        return list(FORMATS)
+    return [".txt"] if report_type in REPORTS else []
+
+
+def export_report(report_type, data, path, progress=None, cancelled=None):
+    """Write ``report_type`` built from ``data`` to ``path``; the format follows the extension.
+
+    The file is written under a temporary name and moved into place only when
+    complete, so a cancelled or failed export never leaves a truncated file.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in supported_formats(report_type):
+        raise ValueError(f"{report_type} cannot be exported as {ext or 'a file without extension'}")
+
+    base, _ = os.path.splitext(path)
+    tmp_path = f"{base}.partial{ext}"
+    try:
+        if ext == ".txt":
+            builder, _ = REPORTS[report_type]
+            export_text(tmp_path, _guard(builder(data, progress), cancelled))
+        else:
+            columns, rows = TABLES[report_type]
+            TABLE_EXPORTERS[ext](tmp_path, report_type, columns, _guard(rows(data, progress), cancelled))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return path
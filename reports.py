@@ -0,0 +1,276 @@
+"""Report builders.
+
+Each report is a generator of text lines so it can run on a worker thread (or
+from the command line) and be consumed incrementally. Builders take plain data
+snapshots and never touch Tk.
+"""
+
+from datetime import datetime
+
+RULE = "=" * 80
+DIVIDER = "-" * 80
+
+
+def _header(title, now=None):
+    now = now or datetime.now()
+    yield f"{title}\n"
+    yield RULE + "\n\n"
+    yield f"Generated on: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+
+
+def _records(collection):
+    return [(key, value) for key, value in (collection or {}).items() if isinstance(value, dict)]
+
+
+def _roster_groups(cadets):
+    companies = {}
+    for cadet_id, cadet in cadets:
+        company = cadet.get('company', 'U')
+        flight = cadet.get('flight', '0')
+        companies.setdefault(company, {}).setdefault(flight, []).append(cadet)
+    return companies
+
+
+def cadet_roster(data, progress=None):
+    cadets = _records(data.get("cadets"))
+    yield from _header("AFJROTC CADET ROSTER")
+
+    companies = _roster_groups(cadets)
+
+    done = 0
+    for company in sorted(companies, key=str):
+        yield f"COMPANY {company}\n"
+        yield DIVIDER + "\n"
+
+        for flight in sorted(companies[company], key=str):
+            yield f"FLIGHT {flight}:\n"
+
+            members = sorted(
+                companies[company][flight],
+                key=lambda x: (str(x.get('last_name', '')), str(x.get('first_name', '')))
+            )
+            for cadet in members:
+                yield (
+                    f"{cadet.get('last_name', 'N/A')}, {cadet.get('first_name', 'N/A')} "
+                    f"(Grade: {cadet.get('grade', 'N/A')}, "
+                    f"Rank: {cadet.get('rank', 'N/A')})\n"
+                )
+                done += 1
+                if progress:
+                    progress(done, len(cadets))
+
+            yield "\n"
+
+        yield "\n"
+
+    yield f"TOTAL CADETS: {len(cadets)}\n"
+
+
+CADET_ROSTER_COLUMNS = ("Company", "Flight", "Last Name", "First Name", "Grade", "Rank")
+
+
+def cadet_roster_rows(data, progress=None):
+    """Yield the cadet roster as table rows in the same order as the text report."""
+    cadets = _records(data.get("cadets"))
+    companies = _roster_groups(cadets)
+
+    done = 0
+    for company in sorted(companies, key=str):
+        for flight in sorted(companies[company], key=str):
+            members = sorted(
+                companies[company][flight],
+                key=lambda x: (str(x.get('last_name', '')), str(x.get('first_name', '')))
+            )
+            for cadet in members:
+                yield (
+                    company,
+                    flight,
+                    cadet.get('last_name', ''),
+                    cadet.get('first_name', ''),
+                    cadet.get('grade', ''),
+                    cadet.get('rank', '')
+                )
+                done += 1
+                if progress:
+                    progress(done, len(cadets))
+
+
+REQUIRED_CS_HOURS = 16
+
+HOURS_COLUMNS = ("Last Name", "First Name", "Flight", "Hours", "Needed", "Status")
+
+
+def cs_hours(cadet):
+    for name in ("cs_hours", "CS Hours", "communityServiceHours"):
+        value = cadet.get(name)
+        if value not in (None, ""):
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return 0.0
+    return 0.0
+
+
+def hours_status(hours, required=REQUIRED_CS_HOURS):
+    """Red while more than 10 hours are still needed, yellow while any are, green once done."""
+    needed = max(0.0, required - hours)
+    if needed > 10:
+        return "red"
+    if needed > 0:
+        return "yellow"
+    return "green"
+
+
+def community_service_rows(data, progress=None):
+    cadets = sorted(
+        _records(data.get("cadets")),
+        key=lambda item: (str(item[1].get('last_name', '')).lower(), str(item[1].get('first_name', '')).lower())
+    )
+    for done, (cadet_id, cadet) in enumerate(cadets, 1):
+        hours = cs_hours(cadet)
+        yield (
+            cadet.get('last_name', ''),
+            cadet.get('first_name', ''),
+            cadet.get('flight', ''),
+            f"{hours:g}",
+            f"{max(0.0, REQUIRED_CS_HOURS - hours):g}",
+            hours_status(hours)
+        )
+        if progress:
+            progress(done, len(cadets))
+
+
+def community_service(data, progress=None):
+    yield from _header("COMMUNITY SERVICE HOURS")
+    yield f"Requirement: {REQUIRED_CS_HOURS} hours per cadet\n\n"
+    yield f"{'Name':<32}{'Flight':<10}{'Hours':>8}{'Needed':>8}  Status\n"
+    yield DIVIDER + "\n"
+
+    counts = {"green": 0, "yellow": 0, "red": 0}
+    for last_name, first_name, flight, hours, needed, status in community_service_rows(data, progress):
+        counts[status] += 1
+        yield f"{f'{last_name}, {first_name}':<32}{str(flight):<10}{hours:>8}{needed:>8}  {status.upper()}\n"
+
+    yield "\n"
+    yield f"Complete: {counts['green']}   Almost there: {counts['yellow']}   Behind: {counts['red']}\n"
+
+
+FUNDRAISER_COLUMNS = ("Fundraiser", "Date", "Goal", "Raised", "Progress", "Transactions", "Sellers", "Top Seller")
+
+
+def _cadet_name(cadets, cadet_id):
+    cadet = cadets.get(cadet_id)
+    if not isinstance(cadet, dict):
+        return str(cadet_id)
+    return f"{cadet.get('last_name', '')}, {cadet.get('first_name', '')}".strip(", ")
+
+
+def fundraiser_totals(data, progress=None):
+    """Yield ``(fundraiser_id, fundraiser, goal, raised, {cadet_id: cents})`` from the materialized ledger totals.
+
+    Amounts are integer cents, so totals are exact however many transactions
+    a fundraiser has had.
+    """
+    # Imported here; fundraiser_ledger reaches this module through hours_ledger
+    from fundraiser_ledger import goal_cents, raised_cents
+
+    sales = data.get("fundraiser_sales") or {}
+    fundraisers = sorted(
+        _records(data.get("fundraisers")),
+        key=lambda item: (str(item[1].get('start_date', item[1].get('date', ''))), str(item[1].get('name', '')).lower())
+    )
+    for done, (fundraiser_id, fundraiser) in enumerate(fundraisers, 1):
+        by_cadet = sales.get(fundraiser_id)
+        by_cadet = {
+            cadet_id: cents for cadet_id, cents in (by_cadet.items() if isinstance(by_cadet, dict) else ())
+            if isinstance(cents, int)
+        }
+        yield fundraiser_id, fundraiser, goal_cents(fundraiser), raised_cents(fundraiser), by_cadet
+        if progress:
+            progress(done, len(fundraisers))
+
+
+def fundraiser_summary_rows(data, progress=None):
+    from fundraiser_ledger import format_cents
+
+    cadets = data.get("cadets") or {}
+    for fundraiser_id, fundraiser, goal, raised, by_cadet in fundraiser_totals(data, progress):
+        top = max(by_cadet.items(), key=lambda item: item[1], default=None)
+        yield (
+            fundraiser.get('name', ''),
+            fundraiser.get('start_date', fundraiser.get('date', '')),
+            format_cents(goal) if goal > 0 else "",
+            format_cents(raised),
+            f"{raised * 100 // goal}%" if goal > 0 else "",
+            fundraiser.get('transaction_count', 0),
+            sum(1 for cents in by_cadet.values() if cents > 0),
+            f"{_cadet_name(cadets, top[0])} ({format_cents(top[1])})" if top and top[1] > 0 else ""
+        )
+
+
+def fundraiser_summary(data, progress=None):
+    from fundraiser_ledger import format_cents, progress_bar
+
+    yield from _header("FUNDRAISER SUMMARY REPORT")
+    yield f"{'Fundraiser':<30}{'Goal':>14}{'Raised':>14}  Progress\n"
+    yield DIVIDER + "\n"
+
+    total_goal = total_raised = 0
+    for fundraiser_id, fundraiser, goal, raised, by_cadet in fundraiser_totals(data, progress):
+        total_goal += max(goal, 0)
+        total_raised += raised
+        goal_text = format_cents(goal) if goal > 0 else "N/A"
+        yield f"{str(fundraiser.get('name', 'N/A'))[:29]:<30}{goal_text:>14}{format_cents(raised):>14}  {progress_bar(raised, goal)}\n"
+
+    yield "\n"
+    yield f"{'TOTAL':<30}{format_cents(total_goal):>14}{format_cents(total_raised):>14}\n"
+
+
+def _not_implemented(title):
+    def build(data, progress=None):
+        yield f"{title}\n"
+        yield RULE + "\n\n"
+        yield "This report is not yet implemented.\n"
+    return build
+
+
+event_attendance = _not_implemented("EVENT ATTENDANCE REPORT")
+uniform_inventory = _not_implemented("UNIFORM INVENTORY REPORT")
+contact_directory = _not_implemented("CONTACT DIRECTORY")
+
+# Report title -> (builder, collections it reads)
+REPORTS = {
+    "Cadet Roster": (cadet_roster, ("cadets",)),
+    "Community Service": (community_service, ("cadets",)),
+    "Event Attendance": (event_attendance, ("events",)),
+    "Fundraiser Summary": (fundraiser_summary, ("fundraisers", "fundraiser_sales", "cadets")),
+    "Uniform Inventory": (uniform_inventory, ("uniforms",)),
+    "Contact Directory": (contact_directory, ("contacts",)),
+}
+
+# Report title -> (columns, row builder) for reports that can be exported as tables
+TABLES = {
+    "Cadet Roster": (CADET_ROSTER_COLUMNS, cadet_roster_rows),
+    "Community Service": (HOURS_COLUMNS, community_service_rows),
+    "Fundraiser Summary": (FUNDRAISER_COLUMNS, fundraiser_summary_rows),
+}
+
+
+def chunked(lines, chunk_chars=64 * 1024, cancelled=None):
+    """Join ``lines`` into chunks of roughly ``chunk_chars`` characters.
+
+    Stops early, without yielding the partial chunk, once ``cancelled()`` is true.
+    """
+    buffer = []
+    size = 0
+    for line in lines:
+        if cancelled is not None and cancelled():
+            return
+        buffer.append(line)
+        size += len(line)
+        if size >= chunk_chars:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
@@ -0,0 +1,135 @@
+import random
+import threading
+import time
+
+import requests
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class RetryPolicy:
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=8.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        # Full jitter: sleep a random amount up to the exponential cap.
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+DEFAULT_POLICIES = {
+    "read": RetryPolicy(max_attempts=4, base_delay=0.25),
+    "write": RetryPolicy(max_attempts=3, base_delay=0.5),
+    "storage": RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=15.0),
+    "auth": RetryPolicy(max_attempts=2, base_delay=0.5),
+}
+
+
+def status_code(error):
+    for candidate in (error, *getattr(error, "args", ())):
+        response = getattr(candidate, "response", None)
+        if response is not None and getattr(response, "status_code", None):
+            return response.status_code
+    return None
+
+
+def is_transient(error):
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+
+    code = status_code(error)
+    if code is not None:
+        return code == 429 or code >= 500
+
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.time() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self):
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                # Let a single probe through; everyone else keeps failing fast.
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._probe_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.time()
+            self._probe_in_flight = False
+
+
+class ResilientCaller:
+    """Runs backend calls under per-operation retry budgets and a shared circuit breaker."""
+
+    def __init__(self, policies=None, breaker=None):
+        self.policies = dict(DEFAULT_POLICIES)
+        if policies:
+            self.policies.update(policies)
+        self.breaker = breaker or CircuitBreaker()
+
+    def set_policy(self, operation, policy):
+        self.policies[operation] = policy
+
+    def call(self, operation, func, idempotent=True):
+        policy = self.policies.get(operation) or self.policies["read"]
+        attempts = policy.max_attempts if idempotent else 1
+
+        for attempt in range(attempts):
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"Backend unavailable; {operation} skipped while the circuit is open")
+
+            try:
+                result = func()
+            except Exception as e:
+                if not is_transient(e):
+                    # The backend answered, so the connection itself is healthy.
+                    self.breaker.record_success()
+                    raise
+
+                self.breaker.record_failure()
+                if attempt + 1 >= attempts:
+                    raise
+                time.sleep(policy.delay(attempt))
+                continue
+
+            self.breaker.record_success()
+            return result
@@ -0,0 +1,241 @@
+"""Bulk cadet roster import from CSV or XLSX files.
+
+Rows are read as a stream, mapped onto cadet fields, validated and checked for
+duplicates against the existing roster. The resulting plan can be shown as a
+dry-run preview, then written with a few multi-path updates instead of one
+request per cadet. XLSX files need openpyxl, which is imported only when used.
+"""
+
+import csv
+import os
+import re
+from datetime import datetime
+
+FIELDS = ("first_name", "last_name", "grade", "flight", "rank", "email", "phone")
+REQUIRED_FIELDS = ("first_name", "last_name")
+GRADES = ("9", "10", "11", "12")
+
+IMPORT_BATCH_SIZE = 500
+
+# Normalized header -> cadet field
+ALIASES = {
+    "first": "first_name",
+    "firstname": "first_name",
+    "given_name": "first_name",
+    "last": "last_name",
+    "lastname": "last_name",
+    "surname": "last_name",
+    "family_name": "last_name",
+    "grade_level": "grade",
+    "year": "grade",
+    "email_address": "email",
+    "e_mail": "email",
+    "phone_number": "phone",
+    "cell": "phone",
+    "mobile": "phone",
+}
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def field_name(header):
+    return re.sub(r"[^0-9a-z]+", "_", str(header or "").strip().lower()).strip("_")
+
+
+def suggest_mapping(headers):
+    """Map each header to a cadet field, or None when it should be ignored."""
+    mapping = {}
+    used = set()
+    for header in headers:
+        name = field_name(header)
+        field = name if name in FIELDS else ALIASES.get(name)
+        if field in used:
+            field = None
+        mapping[header] = field
+        if field:
+            used.add(field)
+    return mapping
+
+
+def iter_rows(path):
+    """Yield the header row, then every data row, of a CSV or XLSX file as lists of strings."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".xlsx":
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise RuntimeError("Excel import requires openpyxl (pip install openpyxl)") from None
+
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            for row in workbook.active.iter_rows(values_only=True):
+                yield ["" if value is None else str(value) for value in row]
+        finally:
+            workbook.close()
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            yield from csv.reader(f)
+
+
+def read_headers(path):
+    rows = iter_rows(path)
+    try:
+        return [header for header in next(rows, []) if header]
+    finally:
+        rows.close()
+
+
+def normalize(record):
+    grade = record.get("grade")
+    if grade:
+        # "9th", "Grade 10" and "11.0" from spreadsheets all mean the bare number
+        digits = re.match(r"\D*(\d+)", grade)
+        if digits:
+            record["grade"] = str(int(digits.group(1)))
+    if record.get("email"):
+        record["email"] = record["email"].lower()
+    return record
+
+
+def validate(record):
+    errors = [f"Missing {field.replace('_', ' ')}" for field in REQUIRED_FIELDS if not record.get(field)]
+    if record.get("grade") and record["grade"] not in GRADES:
+        errors.append(f"Invalid grade '{record['grade']}'")
+    if record.get("email") and not EMAIL_PATTERN.match(record["email"]):
+        errors.append(f"Invalid email '{record['email']}'")
+    return errors
+
+
+# Cadet field -> names older cadet records stored it under
+LEGACY_FIELDS = {
+    "first_name": ("first_name", "First Name", "firstName"),
+    "last_name": ("last_name", "Last Name", "lastName"),
+    "email": ("email", "Email"),
+}
+
+
+def _value(record, field):
+    for name in LEGACY_FIELDS.get(field, (field,)):
+        value = record.get(name)
+        if value not in (None, ""):
+            return str(value).strip().lower()
+    return ""
+
+
+def duplicate_keys(record):
+    """Keys that identify the same cadet: the email when present, and the full name."""
+    keys = []
+    email = _value(record, "email")
+    if email:
+        keys.append(("email", email))
+    first_name = _value(record, "first_name")
+    last_name = _value(record, "last_name")
+    if first_name and last_name:
+        keys.append(("name", last_name, first_name))
+    return keys
+
+
+class ImportPlan:
+    """What an import would do; building one never writes anything."""
+
+    def __init__(self, mapping):
+        self.mapping = mapping
+        self.total = 0
+        self.adds = []          # (row_number, record)
+        self.updates = []       # (row_number, cadet_id, record)
+        self.duplicates = []    # (row_number, record, existing cadet id or None for a repeat in the file)
+        self.errors = []        # (row_number, [messages])
+
+    @property
+    def write_count(self):
+        return len(self.adds) + len(self.updates)
+
+    def summary(self):
+        parts = [f"{len(self.adds)} new"]
+        if self.updates:
+            parts.append(f"{len(self.updates)} updated")
+        parts.append(f"{len(self.duplicates)} duplicates skipped")
+        parts.append(f"{len(self.errors)} invalid")
+        return f"{self.total} rows: " + ", ".join(parts)
+
+    def issues(self):
+        """Yield ``(row_number, description)`` for every row that will not be written."""
+        rows = [(row, "; ".join(messages)) for row, messages in self.errors]
+        for row, record, cadet_id in self.duplicates:
+            name = f"{record.get('last_name', '')}, {record.get('first_name', '')}"
+            rows.append((row, f"Duplicate of existing cadet ({name})" if cadet_id else f"Repeated in file ({name})"))
+        return sorted(rows)
+
+    def updates_by_path(self, generate_key, now=None):
+        """Yield ``(path, value)`` pairs, relative to ``cadets``, for a multi-path update."""
+        now = now or datetime.now().isoformat()
+        for _, record in self.adds:
+            yield generate_key(), {**record, "created_at": now, "updated_at": now}
+        for _, cadet_id, record in self.updates:
+            # Field-level paths so columns not in the file are left alone
+            for field, value in record.items():
+                yield f"{cadet_id}/{field}", value
+            yield f"{cadet_id}/updated_at", now
+
+
+def plan_import(path, existing=None, mapping=None, update_existing=False, progress=None):
+    """Read ``path`` and build an ``ImportPlan`` against the ``existing`` cadets dict.
+
+    ``mapping`` maps file headers to cadet fields (see ``suggest_mapping``);
+    rows matching an existing cadet are skipped, or merged into that cadet
+    when ``update_existing`` is true.
+    """
+    known = {}
+    for cadet_id, cadet in (existing or {}).items():
+        if isinstance(cadet, dict):
+            for key in duplicate_keys(cadet):
+                known.setdefault(key, cadet_id)
+
+    rows = iter_rows(path)
+    try:
+        headers = next(rows, [])
+        mapping = mapping or suggest_mapping(headers)
+        columns = [(index, mapping.get(header)) for index, header in enumerate(headers) if mapping.get(header)]
+        plan = ImportPlan(mapping)
+        seen = set()
+
+        for row_number, values in enumerate(rows, 2):
+            record = {
+                field: values[index].strip()
+                for index, field in columns
+                if index < len(values) and values[index] and values[index].strip()
+            }
+            if not record:
+                continue
+
+            plan.total += 1
+            record = normalize(record)
+            errors = validate(record)
+            if errors:
+                plan.errors.append((row_number, errors))
+                continue
+
+            keys = duplicate_keys(record)
+            cadet_id = next((known[key] for key in keys if key in known), None)
+            if any(key in seen for key in keys):
+                plan.duplicates.append((row_number, record, None))
+            elif cadet_id and not update_existing:
+                plan.duplicates.append((row_number, record, cadet_id))
+            elif cadet_id:
+                plan.updates.append((row_number, cadet_id, record))
+            else:
+                plan.adds.append((row_number, record))
+            seen.update(keys)
+
+            if progress:
+                progress(plan.total)
+    finally:
+        rows.close()
+
+    return plan
+
+
+def apply_import(firebase, plan, chunk_size=IMPORT_BATCH_SIZE, progress=None):
+    """Write ``plan`` with batched multi-path updates; returns the number of cadets written."""
+    firebase.update_batched("cadets", plan.updates_by_path(firebase.db.generate_key), chunk_size, progress)
+    return plan.write_count
@@ -0,0 +1,296 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from resilience import is_transient
+
+APP_NAME = "AFJROTC AMS"
+
+
+def user_data_dir(app_name=APP_NAME):
+    """Return the per-user application data directory for this platform."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.join(os.path.expanduser("~"), "Library", "Application Support")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, app_name)
+
+
+def write_private_json(path, data):
+    """Atomically write ``data`` as JSON readable only by the current user."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        # mkstemp creates the file 0600 on POSIX; on Windows the per-user data dir ACL applies.
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _transient(error):
+    """Whether ``error`` or an error it wraps is a network failure worth retrying."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if is_transient(error):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class TokenManager:
+    """Keeps the Firebase ID token fresh and shares it with every request and stream."""
+
+    def __init__(self, firebase, store_path=None, refresh_margin=300, retry_delay=30):
+        self.firebase = firebase
+        self.store_path = store_path or os.path.join(user_data_dir(), "session.json")
+        self.legacy_store_path = os.path.join(os.path.expanduser("~"), ".afjrotc_ams", "session.json")
+        self.refresh_margin = refresh_margin
+        self.retry_delay = retry_delay
+        # _lock guards the token state and is never held across network calls or listeners;
+        # _refresh_lock makes concurrent refreshes wait for the one already in flight.
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+        self._id_token = None
+        self._refresh_token = None
+        self._expires_at = 0.0
+        self._user_id = None
+        self._profile = {}
+        self._timer = None
+        self._catching_up = False
+        self._listeners = []
+
+    @property
+    def user_id(self):
+        return self._user_id
+
+    def add_listener(self, callback):
+        """Register ``callback(id_token)`` to run after every successful refresh."""
+        self._listeners.append(callback)
+
+    def _expired(self):
+        return bool(self._id_token and self._refresh_token and time.time() >= self._expires_at)
+
+    def current_token(self):
+        """The current ID token; never waits on the network when called from the UI thread."""
+        with self._lock:
+            expired = self._expired()
+            if expired and threading.current_thread() is threading.main_thread():
+                # The timer missed its window (e.g. the machine slept). Tk callbacks run here,
+                # so hand the refresh to the timer thread and return the token we have.
+                if not self._catching_up:
+                    self._catching_up = True
+                    self._schedule(0)
+                return self._id_token
+        if expired:
+            # Worker threads can wait for the refresh instead of sending a stale token
+            try:
+                result = self._refresh(only_if_expired=True)
+            except Exception as e:
+                print(f"Error refreshing expired token: {e}")
+            else:
+                if result is not None:
+                    self._notify(result['id_token'])
+        with self._lock:
+            return self._id_token
+
+    def start(self, id_token, refresh_token, expires_in=3600, user_id=None, profile=None):
+        with self._lock:
+            self._id_token = id_token
+            self._refresh_token = refresh_token
+            self._expires_at = time.time() + int(expires_in or 3600)
+            self._user_id = user_id or self._user_id
+            if profile is not None:
+                self._profile = dict(profile)
+            self._persist()
+            self._schedule(self._expires_at - self.refresh_margin - time.time())
+
+    def refresh(self):
+        result = self._refresh()
+        self._notify(result['id_token'])
+        return result
+
+    def _refresh(self, only_if_expired=False):
+        """Exchange the refresh token for a new ID token; returns None if another thread already did."""
+        with self._refresh_lock:
+            with self._lock:
+                if only_if_expired and not self._expired():
+                    return None
+                refresh_token = self._refresh_token
+            if not refresh_token:
+                raise ValueError("No refresh token available")
+
+            result = self.firebase.refresh_token(refresh_token)
+
+            with self._lock:
+                self._id_token = result['id_token']
+                self._refresh_token = result['refresh_token']
+                self._expires_at = time.time() + int(result.get('expires_in') or 3600)
+                self._user_id = result.get('user_id') or self._user_id
+                # A failed catch-up leaves its retry timer in charge until a refresh succeeds
+                self._catching_up = False
+                self._persist()
+                self._schedule(self._expires_at - self.refresh_margin - time.time())
+            return result
+
+    def _notify(self, id_token):
+        # Listeners (e.g. stream reconnects) take their own locks, so no lock is held here
+        for callback in list(self._listeners):
+            try:
+                callback(id_token)
+            except Exception as e:
+                print(f"Error notifying token listener: {e}")
+
+    def stored_profile(self):
+        """Return the persisted user's profile without touching the network, or None."""
+        stored = self._load_stored()
+        if not stored:
+            return None
+        profile = dict(stored.get('profile') or {})
+        profile['uid'] = stored.get('user_id')
+        return profile
+
+    def restore(self):
+        """Restore a persisted session with a single refresh call. Returns the profile or None.
+
+        Returns None when the stored token was rejected (any non-transient
+        failure, e.g. a 400/403 for USER_DISABLED or a bad API key); only
+        transient network errors propagate so the caller can retry.
+        """
+        stored = self._load_stored()
+        if not stored:
+            return None
+
+        with self._lock:
+            self._refresh_token = stored['refresh_token']
+            self._user_id = stored.get('user_id')
+            self._profile = stored.get('profile', {})
+
+        try:
+            self.refresh()
+        except Exception as e:
+            if _transient(e):
+                raise
+            print(f"Stored session rejected: {e}")
+            self.clear()
+            return None
+
+        profile = dict(self._profile)
+        profile['uid'] = self._user_id
+        profile['refresh_token'] = self._refresh_token
+        return profile
+
+    def clear(self):
+        with self._lock:
+            self._cancel_timer()
+            self._catching_up = False
+            self._id_token = None
+            self._refresh_token = None
+            self._expires_at = 0.0
+            self._user_id = None
+            self._profile = {}
+            for path in (self.store_path, self.legacy_store_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def stop(self):
+        with self._lock:
+            self._cancel_timer()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _schedule(self, delay):
+        self._cancel_timer()
+        self._timer = threading.Timer(max(0, delay), self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self):
+        try:
+            self.refresh()
+        except ValueError as e:
+            print(f"Session expired: {e}")
+        except Exception as e:
+            print(f"Error refreshing token, retrying in {self.retry_delay}s: {e}")
+            with self._lock:
+                self._schedule(self.retry_delay)
+
+    def _load_stored(self):
+        stored = read_json(self.store_path)
+        if stored is None:
+            # Sessions saved before the move to the user data dir
+            stored = read_json(self.legacy_store_path)
+        if not isinstance(stored, dict) or not stored.get('refresh_token'):
+            return None
+        return stored
+
+    def _persist(self):
+        try:
+            write_private_json(self.store_path, {
+                'refresh_token': self._refresh_token,
+                'user_id': self._user_id,
+                'profile': self._profile
+            })
+        except OSError as e:
+            print(f"Error saving session: {e}")
+            return
+
+        try:
+            os.remove(self.legacy_store_path)
+        except OSError:
+            pass
+
+
+class AuthorizedDatabase:
+    """Wraps a pyrebase database so every request and stream carries the current ID token."""
+
+    _TOKEN_METHODS = ("get", "set", "push", "update", "remove", "stream")
+
+    def __init__(self, db, token_provider):
+        self._db = db
+        self._token_provider = token_provider
+
+    def __getattr__(self, name):
+        attr = getattr(self._db, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            if name in self._TOKEN_METHODS and kwargs.get('token') is None and not self._has_positional_token(name, args):
+                kwargs['token'] = self._token_provider()
+            result = attr(*args, **kwargs)
+            return self if result is self._db else result
+
+        return call
+
+    @staticmethod
+    def _has_positional_token(name, args):
+        # get(token) and remove(token) take the token first; writes take (data, token).
+        if name in ("get", "remove"):
+            return len(args) >= 1
+        return len(args) >= 2
@@ -0,0 +1,379 @@
+"""Local binary snapshot of the app's collections for a fast cold start.
+
+The file is a fixed-layout record file::
+
+    header     magic (8 bytes), collection count (u32), directory offset (u64)
+    records    key bytes followed by the record as compact JSON, back to back
+    indexes    per collection, one (offset, value length, key length) entry per record, sorted by key bytes
+    directory  per collection, name length (u16), name, index offset (u64), record count (u32)
+
+On startup the file is mapped with ``mmap`` and only the directory is read.
+A single record is found with a binary search over its collection's sorted
+index and decoded the first time something reads it; the keys are only walked
+when a collection is iterated. Opening the snapshot therefore costs about the
+same however large the unit is. Saving copies undecoded records between
+snapshots as raw bytes and keeps them undecoded in the new mapping.
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import weakref
+from bisect import bisect_left
+
+MAGIC = b"AMSSNAP2"
+_HEADER = struct.Struct("<8sIQ")
+_NAME_LENGTH = struct.Struct("<H")
+_DIRECTORY = struct.Struct("<QI")
+_ENTRY = struct.Struct("<QIH")
+
+
+class _Ref:
+    """Location of a record that has not been decoded yet."""
+
+    __slots__ = ("offset", "length")
+
+    def __init__(self, offset, length):
+        self.offset = offset
+        self.length = length
+
+
+class _KeyTable:
+    """One collection's sorted index, read straight from the mapping.
+
+    It is a sequence of key bytes, so ``bisect`` can search it without
+    decoding or copying the rest of the index.
+    """
+
+    def __init__(self, store, offset, count):
+        self._store = store
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def _entry(self, index):
+        return _ENTRY.unpack_from(self._store._map, self.offset + index * _ENTRY.size)
+
+    def __getitem__(self, index):
+        offset, _, key_length = self._entry(index)
+        return self._store._map[offset:offset + key_length]
+
+    def find(self, key):
+        """The ``_Ref`` for ``key``, or None if the collection has no such record."""
+        if not isinstance(key, str):
+            return None
+        key_bytes = key.encode("utf-8")
+        index = bisect_left(self, key_bytes)
+        if index == self.count:
+            return None
+        offset, value_length, key_length = self._entry(index)
+        if self._store._map[offset:offset + key_length] != key_bytes:
+            return None
+        return _Ref(offset + key_length, value_length)
+
+    def rows(self):
+        """``(key, value offset, value length)`` for every record, in key order."""
+        data = self._store._map
+        index = data[self.offset:self.offset + self.count * _ENTRY.size]
+        for offset, value_length, key_length in _ENTRY.iter_unpack(index):
+            yield data[offset:offset + key_length].decode("utf-8"), offset + key_length, value_length
+
+
+class LazyCollection(dict):
+    """A collection dict whose records stay encoded in the snapshot until first read.
+
+    It is a real ``dict`` so the views, the stream handlers and the indexes use
+    it unchanged; every read path decodes on demand. Until something iterates
+    or sizes it, the dict holds only the records read or written so far and
+    other keys are looked up in the snapshot's key table.
+    """
+
+    def __init__(self, store, table):
+        super().__init__()
+        self._store = store
+        self._table = table
+
+    def _load(self):
+        """Add every snapshot key (undecoded) so plain dict operations see them."""
+        table = self._table
+        if table is None:
+            return
+        self._table = None
+        for key, offset, length in table.rows():
+            if not dict.__contains__(self, key):
+                dict.__setitem__(self, key, _Ref(offset, length))
+
+    def _value(self, key, value):
+        if type(value) is _Ref:
+            value = self._store.decode(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __getitem__(self, key):
+        try:
+            value = dict.__getitem__(self, key)
+        except KeyError:
+            value = self._table.find(key) if self._table is not None else None
+            if value is None:
+                raise
+        return self._value(key, value)
+
+    def __contains__(self, key):
+        if dict.__contains__(self, key):
+            return True
+        return self._table is not None and self._table.find(key) is not None
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __delitem__(self, key):
+        self._load()
+        dict.__delitem__(self, key)
+
+    def pop(self, key, *default):
+        self._load()
+        value = dict.pop(self, key, *default)
+        return self._store.decode(value) if type(value) is _Ref else value
+
+    def popitem(self):
+        self._load()
+        key, value = dict.popitem(self)
+        return key, self._store.decode(value) if type(value) is _Ref else value
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def clear(self):
+        self._table = None
+        dict.clear(self)
+
+    def __len__(self):
+        self._load()
+        return dict.__len__(self)
+
+    def __iter__(self):
+        # Overriding __iter__ makes dict(), {**d} and update() go through __getitem__
+        self._load()
+        return iter(dict.keys(self))
+
+    def __reversed__(self):
+        self._load()
+        return reversed(list(dict.keys(self)))
+
+    def keys(self):
+        self._load()
+        return dict.keys(self)
+
+    def values(self):
+        return [self[key] for key in list(self.keys())]
+
+    def items(self):
+        return [(key, self[key]) for key in list(self.keys())]
+
+    def copy(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def encoded_items(self):
+        """``(key, raw JSON bytes or None, value)`` for every record, decoding nothing."""
+        for key, value in list(dict.items(self)):
+            if type(value) is _Ref:
+                yield key, self._store.raw(value), value
+            else:
+                yield key, None, value
+        if self._table is not None:
+            for key, offset, length in self._table.rows():
+                if not dict.__contains__(self, key):
+                    yield key, self._store.raw(_Ref(offset, length)), None
+
+    def materialize(self):
+        """Decode every remaining record so the collection no longer needs the mapping."""
+        for key in list(self.keys()):
+            self[key]
+
+
+class SnapshotStore:
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._map = None
+        self._collections = []
+
+    def open(self):
+        """Map the snapshot and return ``{collection: LazyCollection}``, or ``{}`` if there is none."""
+        self.close()
+        try:
+            directory = self._map_file()
+        except (OSError, ValueError, struct.error) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"Ignoring unreadable snapshot {self.path}: {e}")
+            self.close()
+            return {}
+
+        collections = {}
+        for name, (index_offset, count) in directory.items():
+            collection = LazyCollection(self, _KeyTable(self, index_offset, count))
+            self._collections.append(weakref.ref(collection))
+            collections[name] = collection
+        return collections
+
+    def _map_file(self):
+        """Map ``path`` and return its directory, ``{collection: (index offset, record count)}``."""
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        data = self._map
+        magic, count, position = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("not a snapshot file")
+
+        directory = {}
+        for _ in range(count):
+            (name_length,) = _NAME_LENGTH.unpack_from(data, position)
+            position += _NAME_LENGTH.size
+            name = data[position:position + name_length].decode("utf-8")
+            position += name_length
+            directory[name] = _DIRECTORY.unpack_from(data, position)
+            position += _DIRECTORY.size
+        return directory
+
+    def _unmap(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def raw(self, ref):
+        return self._map[ref.offset:ref.offset + ref.length]
+
+    def decode(self, ref):
+        return json.loads(self.raw(ref))
+
+    def save(self, collections):
+        """Atomically replace the snapshot with ``collections`` ({name: dict}).
+
+        Collections mapped from this store that are saved again stay lazy:
+        their undecoded records are re-pointed at the new file.
+        """
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            # mkstemp creates the file 0600 on POSIX; on Windows the per-user data dir ACL applies.
+            with os.fdopen(fd, "wb") as f:
+                moves = self._write(f, collections)
+
+            live = [collection for collection in (ref() for ref in self._collections) if collection is not None]
+            saved = {id(records): name for name, records in collections.items()}
+            kept = []
+            for collection in live:
+                if id(collection) in saved:
+                    kept.append(collection)
+                else:
+                    # Nothing in the new file backs it, so decode it while the old mapping is open
+                    collection.materialize()
+
+            # Windows cannot replace a mapped file; unmap, swap, then map whichever file is in place
+            self._unmap()
+            try:
+                os.replace(tmp_path, self.path)
+            finally:
+                directory = self._map_file()
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        for ref, offset in moves:
+            ref.offset = offset
+        for collection in kept:
+            if collection._table is not None:
+                collection._table = _KeyTable(self, *directory[saved[id(collection)]])
+        self._collections = [weakref.ref(collection) for collection in kept]
+
+    def _write(self, f, collections):
+        """Write ``collections`` and return ``[(ref, new value offset)]`` for this store's undecoded records."""
+        f.write(_HEADER.pack(MAGIC, 0, 0))
+        position = _HEADER.size
+        indexes = []
+        moves = []
+
+        for name, records in collections.items():
+            if isinstance(records, LazyCollection):
+                items = records.encoded_items()
+                owned = records._store is self
+            else:
+                items = ((key, None, records.get(key)) for key in list(records))
+                owned = False
+
+            entries = []
+            for key, raw, value in items:
+                if raw is None:
+                    if value is None:
+                        continue
+                    raw = json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+                key_bytes = str(key).encode("utf-8")
+                f.write(key_bytes)
+                f.write(raw)
+                if owned and type(value) is _Ref:
+                    moves.append((value, position + len(key_bytes)))
+                entries.append((key_bytes, _ENTRY.pack(position, len(raw), len(key_bytes))))
+                position += len(key_bytes) + len(raw)
+            entries.sort(key=lambda entry: entry[0])
+            indexes.append((name, [entry for _, entry in entries]))
+
+        directory = []
+        for name, entries in indexes:
+            directory.append((name, position, len(entries)))
+            f.write(b"".join(entries))
+            position += len(entries) * _ENTRY.size
+
+        directory_offset = position
+        for name, index_offset, count in directory:
+            name_bytes = name.encode("utf-8")
+            f.write(_NAME_LENGTH.pack(len(name_bytes)))
+            f.write(name_bytes)
+            f.write(_DIRECTORY.pack(index_offset, count))
+
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, len(directory), directory_offset))
+        return moves
+
+    def close(self):
+        for ref in self._collections:
+            collection = ref()
+            if collection is not None:
+                collection.materialize()
+        self._collections = []
+        self._unmap()
+
+    def clear(self):
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
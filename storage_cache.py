@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+
+class StorageCache:
+    """Content-addressed disk cache for Storage objects with LRU eviction under a size cap.
+
+    Entries are keyed by storage path and remember the object's generation and
+    md5; blobs are stored once per SHA-256, so identical files share space.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=256 * 1024 * 1024, revalidate_after=3600):
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser("~"), ".afjrotc_ams", "cache", "storage")
+        self.max_bytes = max_bytes
+        self.revalidate_after = revalidate_after
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self._lock = threading.RLock()
+        self._entries = self._load_index()
+        self._saved_at = 0.0
+
+    def lookup(self, storage_path):
+        """Return the cached blob path if it can be served without asking the server."""
+        with self._lock:
+            entry = self._entries.get(storage_path)
+            if not entry or time.time() - entry["validated_at"] > self.revalidate_after:
+                return None
+            return self._touch(storage_path, entry)
+
+    def validate(self, storage_path, generation, md5_hash=None):
+        """Return the cached blob path if it matches the server's current generation."""
+        with self._lock:
+            entry = self._entries.get(storage_path)
+            if not entry or entry["generation"] != generation:
+                return None
+            if md5_hash and entry.get("md5") and entry["md5"] != md5_hash:
+                return None
+            entry["validated_at"] = time.time()
+            return self._touch(storage_path, entry)
+
+    def put(self, storage_path, source_path, generation, md5_hash=None, move=False):
+        """Store ``source_path`` as the content of ``storage_path`` and return the blob path."""
+        digest = self._sha256(source_path)
+        blob_path = self._blob_path(digest)
+        size = os.path.getsize(source_path)
+
+        with self._lock:
+            if not os.path.exists(blob_path):
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                if move:
+                    os.replace(source_path, blob_path)
+                else:
+                    shutil.copyfile(source_path, blob_path)
+            elif move:
+                os.remove(source_path)
+
+            now = time.time()
+            previous = self._entries.get(storage_path)
+            self._entries[storage_path] = {
+                "sha256": digest,
+                "size": size,
+                "generation": generation,
+                "md5": md5_hash,
+                "validated_at": now,
+                "last_access": now
+            }
+            if previous and previous["sha256"] != digest:
+                self._release_blob(previous["sha256"])
+
+            self._evict(keep=storage_path)
+            self._save_index()
+            return blob_path
+
+    def invalidate(self, storage_path):
+        with self._lock:
+            entry = self._entries.pop(storage_path, None)
+            if entry:
+                self._release_blob(entry["sha256"])
+                self._save_index()
+
+    def size(self):
+        with self._lock:
+            return sum(size for size in self._blob_sizes().values())
+
+    def _touch(self, storage_path, entry):
+        blob_path = self._blob_path(entry["sha256"])
+        if not os.path.exists(blob_path):
+            self._entries.pop(storage_path, None)
+            return None
+        entry["last_access"] = time.time()
+        # Access times only steer eviction, so persist them lazily.
+        if entry["last_access"] - self._saved_at > 30:
+            self._save_index()
+        return blob_path
+
+    def _blob_sizes(self):
+        return {entry["sha256"]: entry["size"] for entry in self._entries.values()}
+
+    def _evict(self, keep=None):
+        blob_sizes = self._blob_sizes()
+        total = sum(blob_sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        for storage_path, entry in sorted(self._entries.items(), key=lambda item: item[1]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            if storage_path == keep:
+                continue
+            del self._entries[storage_path]
+            if self._release_blob(entry["sha256"]):
+                total -= entry["size"]
+
+    def _release_blob(self, digest):
+        if any(entry["sha256"] == digest for entry in self._entries.values()):
+            return False
+        try:
+            os.remove(self._blob_path(digest))
+        except OSError:
+            pass
+        return True
+
+    def _blob_path(self, digest):
+        return os.path.join(self.cache_dir, "blobs", digest[:2], digest)
+
+    def _sha256(self, path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.index_path)
+            self._saved_at = time.time()
+        except OSError as e:
+            print(f"Error saving storage cache index: {e}")
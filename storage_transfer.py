@@ -0,0 +1,325 @@
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from storage_cache import StorageCache
+
+STORAGE_API = "https://firebasestorage.googleapis.com/v0/b/{bucket}/o"
+
+# Resumable upload chunks must be a multiple of 256 KiB.
+CHUNK_SIZE = 8 * 256 * 1024
+
+
+class TransferManager:
+    """Concurrent, chunked and resumable Firebase Storage uploads and downloads."""
+
+    def __init__(self, firebase, max_parallel=4, chunk_size=CHUNK_SIZE, state_dir=None, cache=None):
+        self.firebase = firebase
+        self.cache = cache or StorageCache()
+        self.bucket = firebase.config.get("storageBucket")
+        self.chunk_size = chunk_size
+        self.state_dir = state_dir or os.path.join(os.path.expanduser("~"), ".afjrotc_ams", "transfers")
+        self._executor = ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="storage")
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_parallel, pool_maxsize=max_parallel)
+        self._session.mount("https://", adapter)
+        self._journal_lock = threading.Lock()
+        # storage path -> (future, progress callbacks) for downloads in flight, so
+        # concurrent requests for one object share a single transfer and .part file
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+    def upload(self, local_path, storage_path, progress=None, content_type=None):
+        """Queue an upload and return a future resolving to the object's metadata and download URL."""
+        return self._executor.submit(self._upload, local_path, storage_path, progress, content_type)
+
+    def download(self, storage_path, local_path, progress=None):
+        """Queue a download and return a future resolving to ``local_path``."""
+        result = Future()
+
+        def deliver(blob):
+            try:
+                result.set_result(self._deliver(blob.result(), local_path))
+            except Exception as e:
+                result.set_exception(e)
+
+        self.fetch(storage_path, progress).add_done_callback(deliver)
+        return result
+
+    def fetch(self, storage_path, progress=None):
+        """Queue a download into the cache and return a future resolving to the cached blob path.
+
+        A request for an object that is already being downloaded joins that
+        transfer instead of starting a second one.
+        """
+        with self._inflight_lock:
+            entry = self._inflight.get(storage_path)
+            if entry is None:
+                listeners = []
+                future = self._executor.submit(self._download, storage_path, listeners)
+                entry = self._inflight[storage_path] = (future, listeners)
+                future.add_done_callback(lambda done: self._finished(storage_path, done))
+            if progress is not None:
+                entry[1].append(progress)
+            return entry[0]
+
+    def _finished(self, storage_path, future):
+        with self._inflight_lock:
+            if self._inflight.get(storage_path, (None,))[0] is future:
+                del self._inflight[storage_path]
+
+    def upload_many(self, items, progress=None):
+        """Upload ``(local_path, storage_path)`` pairs with bounded parallelism."""
+        return {storage_path: self.upload(local_path, storage_path, progress) for local_path, storage_path in items}
+
+    def download_many(self, items, progress=None):
+        """Download ``(storage_path, local_path)`` pairs with bounded parallelism."""
+        return {storage_path: self.download(storage_path, local_path, progress) for storage_path, local_path in items}
+
+    def shutdown(self, wait=False):
+        self._executor.shutdown(wait=wait)
+        self._session.close()
+
+    def object_url(self, storage_path):
+        return f"{STORAGE_API.format(bucket=self.bucket)}/{quote(storage_path, safe='')}"
+
+    def download_url(self, metadata):
+        url = self.object_url(metadata["name"]) + "?alt=media"
+        tokens = metadata.get("downloadTokens")
+        if tokens:
+            url += "&token=" + tokens.split(",")[0]
+        return url
+
+    def _headers(self, extra=None):
+        headers = {}
+        token = self.firebase.tokens.current_token()
+        if token:
+            headers["Authorization"] = f"Firebase {token}"
+        if extra:
+            headers.update(extra)
+        return headers
+
+    def _request(self, method, url, **kwargs):
+        def send():
+            response = self._session.request(method, url, timeout=60, **kwargs)
+            response.raise_for_status()
+            return response
+
+        return self.firebase.resilience.call("storage", send)
+
+    def _upload(self, local_path, storage_path, progress, content_type):
+        total = os.path.getsize(local_path)
+        content_type = content_type or mimetypes.guess_type(local_path)[0] or "application/octet-stream"
+
+        try:
+            if total <= self.chunk_size:
+                # Small files fit in one chunk; read them once so a retry resends the same bytes.
+                with open(local_path, "rb") as f:
+                    body = f.read()
+                response = self._request(
+                    "POST",
+                    STORAGE_API.format(bucket=self.bucket),
+                    params={"name": storage_path},
+                    headers=self._headers({"Content-Type": content_type}),
+                    data=body
+                )
+                metadata = response.json()
+                self._report(progress, storage_path, total, total)
+            else:
+                metadata = self._resumable_upload(local_path, storage_path, total, content_type, progress)
+        except Exception as e:
+            print(f"Error uploading {local_path} to {storage_path}: {e}")
+            raise
+
+        # The upload response already carries the download token; no second request needed.
+        metadata["url"] = self.download_url(metadata)
+
+        try:
+            self.cache.put(storage_path, local_path, metadata.get("generation"), metadata.get("md5Hash"))
+        except OSError as e:
+            print(f"Error caching uploaded file {storage_path}: {e}")
+        return metadata
+
+    def _resumable_upload(self, local_path, storage_path, total, content_type, progress):
+        journal_key = self._journal_key("upload", local_path, storage_path)
+        state = self._load_journal(journal_key)
+        mtime = os.path.getmtime(local_path)
+
+        upload_url = None
+        offset = 0
+        if state and state.get("size") == total and state.get("mtime") == mtime:
+            upload_url = state["upload_url"]
+            offset = self._query_offset(upload_url)
+
+        if offset is None or upload_url is None:
+            response = self._request(
+                "POST",
+                STORAGE_API.format(bucket=self.bucket),
+                params={"name": storage_path},
+                headers=self._headers({
+                    "X-Goog-Upload-Protocol": "resumable",
+                    "X-Goog-Upload-Command": "start",
+                    "X-Goog-Upload-Header-Content-Length": str(total),
+                    "X-Goog-Upload-Header-Content-Type": content_type,
+                    "Content-Type": "application/json"
+                }),
+                data=json.dumps({"name": storage_path, "contentType": content_type})
+            )
+            upload_url = response.headers["X-Goog-Upload-URL"]
+            offset = 0
+            self._save_journal(journal_key, {"upload_url": upload_url, "size": total, "mtime": mtime})
+
+        with open(local_path, "rb") as f:
+            while True:
+                f.seek(offset)
+                chunk = f.read(self.chunk_size)
+                last = offset + len(chunk) >= total
+                command = "upload, finalize" if last else "upload"
+
+                try:
+                    response = self._request(
+                        "POST",
+                        upload_url,
+                        headers=self._headers({
+                            "X-Goog-Upload-Command": command,
+                            "X-Goog-Upload-Offset": str(offset)
+                        }),
+                        data=chunk
+                    )
+                except Exception:
+                    # Ask the server how much it kept so the next run resumes from there.
+                    received = self._query_offset(upload_url)
+                    if received is None:
+                        self._clear_journal(journal_key)
+                    raise
+
+                offset += len(chunk)
+                self._report(progress, storage_path, offset, total)
+
+                if last:
+                    self._clear_journal(journal_key)
+                    return response.json()
+
+    def _query_offset(self, upload_url):
+        try:
+            response = self._session.post(
+                upload_url,
+                headers=self._headers({"X-Goog-Upload-Command": "query"}),
+                timeout=30
+            )
+            response.raise_for_status()
+        except Exception:
+            return None
+
+        if response.headers.get("X-Goog-Upload-Status") not in ("active", None):
+            return None
+        return int(response.headers.get("X-Goog-Upload-Size-Received", 0))
+
+    def _download(self, storage_path, listeners):
+        """Download ``storage_path`` into the cache and return the blob path.
+
+        Only one call per storage path runs at a time (see ``fetch``), so the
+        ``.part`` file named after the path has a single writer.
+        """
+        cached = self.cache.lookup(storage_path)
+        if cached:
+            return cached
+
+        def progress(path, done, total):
+            with self._inflight_lock:
+                callbacks = list(listeners)
+            for callback in callbacks:
+                self._report(callback, path, done, total)
+
+        part_path = os.path.join(self.state_dir, hashlib.sha1(storage_path.encode("utf-8")).hexdigest() + ".part")
+        journal_key = self._journal_key("download", storage_path, "")
+
+        try:
+            metadata = self._request("GET", self.object_url(storage_path), headers=self._headers()).json()
+            total = int(metadata.get("size", 0))
+            generation = metadata.get("generation")
+
+            cached = self.cache.validate(storage_path, generation, metadata.get("md5Hash"))
+            if cached:
+                return cached
+
+            state = self._load_journal(journal_key)
+            offset = 0
+            if state and state.get("generation") == generation and os.path.exists(part_path):
+                offset = os.path.getsize(part_path)
+            else:
+                self._save_journal(journal_key, {"generation": generation})
+
+            if offset < total or total == 0:
+                headers = {"Range": f"bytes={offset}-"} if offset else {}
+                response = self._request(
+                    "GET",
+                    self.object_url(storage_path),
+                    params={"alt": "media"},
+                    headers=self._headers(headers),
+                    stream=True
+                )
+                if offset and response.status_code != 206:
+                    offset = 0
+
+                with response, open(part_path, "ab" if offset else "wb") as f:
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        f.write(chunk)
+                        offset += len(chunk)
+                        progress(storage_path, offset, total)
+
+            blob_path = self.cache.put(storage_path, part_path, generation, metadata.get("md5Hash"), move=True)
+            self._clear_journal(journal_key)
+            return blob_path
+        except Exception as e:
+            print(f"Error downloading {storage_path}: {e}")
+            raise
+
+    def _deliver(self, blob_path, local_path):
+        if local_path is None:
+            return blob_path
+        shutil.copyfile(blob_path, local_path)
+        return local_path
+
+    def _report(self, progress, storage_path, done, total):
+        if progress is None:
+            return
+        try:
+            progress(storage_path, done, total)
+        except Exception as e:
+            print(f"Error in transfer progress callback: {e}")
+
+    def _journal_key(self, kind, source, target):
+        digest = hashlib.sha1(f"{kind}|{os.path.abspath(source) if kind == 'upload' else source}|{target}".encode("utf-8"))
+        return os.path.join(self.state_dir, f"{kind}-{digest.hexdigest()}.json")
+
+    def _load_journal(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_journal(self, path, state):
+        with self._journal_lock:
+            try:
+                os.makedirs(self.state_dir, exist_ok=True)
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(state, f)
+            except OSError as e:
+                print(f"Error saving transfer state: {e}")
+
+    def _clear_journal(self, path):
+        with self._journal_lock:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
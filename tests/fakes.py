@@ -0,0 +1,60 @@
+"""In-memory stand-ins for the Firebase layer used by the ledger tests."""
+
+
+def key_generator():
+    count = 0
+
+    def generate():
+        nonlocal count
+        count += 1
+        return f"k{count:03d}"
+
+    return generate
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.generate_key = key_generator()
+
+
+class FakeFirebase:
+    """Just enough of FirebaseManager for the ledger: nested data, multi-path updates and transactions."""
+
+    def __init__(self, data):
+        self.data = data
+        self.db = FakeDatabase()
+
+    def _node(self, path):
+        node = self.data
+        for part in path.split("/"):
+            node = node.get(part) if isinstance(node, dict) else None
+        return node
+
+    def get_data(self, path):
+        return self._node(path)
+
+    def _set(self, path, value):
+        parts = path.split("/")
+        node = self.data
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        if isinstance(value, dict) and ".sv" in value:
+            current = node.get(parts[-1])
+            amount = value[".sv"]["increment"]
+            value = current + amount if isinstance(current, (int, float)) else amount
+        if value is None:
+            node.pop(parts[-1], None)
+        else:
+            node[parts[-1]] = value
+
+    def update_data(self, path, updates):
+        for subpath, value in updates.items():
+            self._set(subpath, value)
+        return True
+
+    def transaction(self, path, update):
+        current = self._node(path)
+        value = update(current)
+        if value is not current:
+            self._set(path, value)
+        return value
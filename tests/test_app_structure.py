@@ -0,0 +1,56 @@
+import ast
+import importlib.util
+import os
+import unittest
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+# Methods the cold start (stored session or login form) calls on the app
+COLD_START = (
+    "start_backend", "check_session", "show_login", "handle_login", "after_login", "clear_auth_frame",
+    "show_loading", "hide_loading", "show_cached_dashboard", "restore_snapshot", "create_main_ui",
+    "update_upcoming_events", "show_dashboard", "update_dashboard", "report_time_to_interactive",
+    "_restore_session_in_background", "_on_session_restored", "load_initial_data", "setup_realtime_listeners",
+    "attach_view_streams", "show_signup", "handle_signup", "logout",
+)
+
+# Entry points the views, dialogs and stream callbacks reach through ``self``
+FEATURES = (
+    "log_hours_dialog", "bulk_hours_dialog", "fundraiser_transactions_dialog", "set_jobs_status", "delete_jobs",
+    "_run_report", "import_roster_dialog", "update_fundraiser_leaderboard", "sort_cadets_by",
+    "upload_cadet_photo", "update_cadets_display", "update_jobs_display", "update_calendar_display",
+    "update_fundraisers_display", "update_contacts_display", "update_uniforms_display",
+)
+
+
+def _app_class():
+    with open(MAIN, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return next(node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == "AFJROTCApp")
+
+
+class AppStructureTest(unittest.TestCase):
+    def test_methods_are_defined_on_the_class(self):
+        methods = {node.name for node in _app_class().body if isinstance(node, ast.FunctionDef)}
+        for name in COLD_START + FEATURES:
+            self.assertIn(name, methods)
+
+    def test_no_functions_taking_self_at_module_level(self):
+        with open(MAIN, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        stray = [
+            node.name for node in tree.body
+            if isinstance(node, ast.FunctionDef) and node.args.args and node.args.args[0].arg == "self"
+        ]
+        self.assertEqual(stray, [])
+
+    @unittest.skipUnless(importlib.util.find_spec("customtkinter"), "customtkinter is not installed")
+    def test_imported_class_has_the_methods(self):
+        from main import AFJROTCApp
+
+        for name in COLD_START + FEATURES:
+            self.assertTrue(hasattr(AFJROTCApp, name), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
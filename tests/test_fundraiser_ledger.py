@@ -0,0 +1,111 @@
+import time
+import unittest
+from datetime import date
+
+from fundraiser_ledger import (LEDGER, OPENING_BALANCE, SALES, FundraiserLedger, calculate_balances, to_cents,
+                               transaction_updates)
+from hours_ledger import CLAIM, LedgerBusyError, increment
+from tests.fakes import FakeFirebase, key_generator
+
+
+class ToCentsTest(unittest.TestCase):
+    def test_parses_money_exactly(self):
+        self.assertEqual(to_cents(12), 1200)
+        self.assertEqual(to_cents("$1,234.5"), 123450)
+        self.assertEqual(to_cents(" 0.10 "), 10)
+        self.assertEqual(to_cents("0.005"), 1)
+        self.assertEqual(to_cents("-2.49"), -249)
+        self.assertEqual(to_cents(19.99), 1999)
+
+    def test_rejects_anything_else(self):
+        for value in ("", "abc", "1.2.3", "nan", "inf", None):
+            with self.assertRaises(ValueError, msg=value):
+                to_cents(value)
+
+
+class TransactionUpdatesTest(unittest.TestCase):
+    def test_started_ledger_increments_totals(self):
+        updates = transaction_updates("f1", [
+            {"kind": "sale", "amount_cents": 500, "cadet_id": "a", "quantity": 2},
+            {"kind": "refund", "amount_cents": -200, "cadet_id": "a"},
+            {"kind": "donation", "amount_cents": 1000},
+        ], {"raised_cents": 4000}, "sgt@example.com", key_generator(), now="t")
+
+        self.assertEqual(updates[f"{LEDGER}/f1/k001"], {
+            "kind": "sale", "amount_cents": 500, "cadet_id": "a", "quantity": 2, "note": "",
+            "date": date.today().isoformat(), "entered_by": "sgt@example.com", "created_at": "t"
+        })
+        self.assertEqual(updates[f"{SALES}/f1/a"], increment(300))
+        self.assertEqual(updates["fundraisers/f1/raised_cents"], increment(1300))
+        self.assertEqual(updates["fundraisers/f1/transaction_count"], increment(3))
+        self.assertEqual(updates["fundraisers/f1/updated_at"], "t")
+
+    def test_first_transaction_migrates_the_legacy_total(self):
+        updates = transaction_updates("f1", [{"kind": "sale", "amount_cents": 250}],
+                                      {"raised": "$40.10", "goal": "100"}, "", key_generator(), now="t")
+
+        opening = updates[f"{LEDGER}/f1/k002"]
+        self.assertEqual((opening["kind"], opening["amount_cents"], opening["note"]), ("opening", 4010, OPENING_BALANCE))
+        self.assertEqual(updates["fundraisers/f1/raised_cents"], 4260)
+        self.assertEqual(updates["fundraisers/f1/transaction_count"], 2)
+        self.assertEqual(updates["fundraisers/f1/goal_cents"], 10000)
+
+    def test_rejects_float_amounts_and_ignores_empty_batches(self):
+        with self.assertRaises(ValueError):
+            transaction_updates("f1", [{"amount_cents": 1.5}], {"raised_cents": 0}, "", key_generator())
+        self.assertEqual(transaction_updates("f1", [], {}, "", key_generator()), {})
+
+
+class CalculateBalancesTest(unittest.TestCase):
+    def test_balance_and_month_income(self):
+        transactions = [
+            {"amount_cents": 1000, "date": "2024-05-02"},
+            {"amount_cents": -300, "date": "2024-05-03"},
+            {"amount_cents": 700, "date": "2024-04-30"},
+            {"amount_cents": 1.5, "date": "2024-05-04"},
+            "corrupt",
+        ]
+        self.assertEqual(calculate_balances(transactions, today=date(2024, 5, 20)), (1400, 1000))
+        self.assertEqual(calculate_balances([]), (0, 0))
+
+
+class FundraiserLedgerRecordTest(unittest.TestCase):
+    def setUp(self):
+        self.firebase = FakeFirebase({"fundraisers": {"f1": {"name": "Car wash", "raised": "40"}}})
+        self.ledger = FundraiserLedger(self.firebase)
+
+    def test_migrates_once(self):
+        self.assertEqual(self.ledger.record("f1", [{"kind": "sale", "amount_cents": 500, "cadet_id": "a"}], "x"), 2)
+        self.assertEqual(self.ledger.record("f1", [{"kind": "sale", "amount_cents": 300, "cadet_id": "b"}], "y"), 1)
+
+        fundraiser = self.firebase.data["fundraisers"]["f1"]
+        self.assertEqual((fundraiser["raised_cents"], fundraiser["transaction_count"]), (4800, 3))
+        self.assertNotIn(CLAIM, fundraiser)
+        ledger = self.firebase.data[LEDGER]["f1"].values()
+        self.assertEqual(sum(1 for entry in ledger if entry["kind"] == "opening"), 1)
+        self.assertEqual(sum(entry["amount_cents"] for entry in ledger), 4800)
+        self.assertEqual(self.firebase.data[SALES]["f1"], {"a": 500, "b": 300})
+
+    def test_waits_for_another_clients_migration(self):
+        self.firebase.data["fundraisers"]["f1"][CLAIM] = {"token": "other", "claimed_at": time.time()}
+        with self.assertRaises(LedgerBusyError):
+            self.ledger.record("f1", [{"kind": "sale", "amount_cents": 500}], "x")
+        self.assertNotIn(LEDGER, self.firebase.data)
+
+    def test_releases_the_claim_when_the_migration_fails(self):
+        def fail(path, updates):
+            raise OSError("offline")
+
+        self.firebase.update_data = fail
+        with self.assertRaises(OSError):
+            self.ledger.record("f1", [{"kind": "sale", "amount_cents": 500}], "x")
+        self.assertEqual(self.firebase.data["fundraisers"]["f1"], {"name": "Car wash", "raised": "40"})
+
+    def test_refuses_a_deleted_fundraiser(self):
+        with self.assertRaises(ValueError):
+            self.ledger.record("gone", [{"kind": "sale", "amount_cents": 500}], "x")
+        self.assertNotIn("gone", self.firebase.data["fundraisers"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import time
+import unittest
+
+from hours_ledger import (CLAIM, CLAIM_TIMEOUT, LEDGER, OPENING_BALANCE, TOTALS, HoursLedger, LedgerBusyError, grid_entries,
+                          increment, ledger_updates, paste_targets, parse_hours)
+from tests.fakes import FakeFirebase, key_generator
+
+
+class ParseHoursTest(unittest.TestCase):
+    def test_rounds_to_quarter_hours(self):
+        self.assertEqual(parse_hours("1.3"), 1.25)
+        self.assertEqual(parse_hours(" 2 "), 2.0)
+        self.assertEqual(parse_hours("-0.5"), -0.5)
+
+    def test_rejects_zero_oversized_and_text(self):
+        for value in ("0", "0.1", "24.5", "-25", "abc", ""):
+            with self.assertRaises(ValueError, msg=value):
+                parse_hours(value)
+
+
+class LedgerUpdatesTest(unittest.TestCase):
+    cadets = {
+        "a": {"first_name": "Ann", "flight": "Alpha", "cs_hours": 10},
+        "b": {"first_name": "Bob", "Flight": "Bravo", "CS Hours": "2.5"},
+        "c": {"first_name": "Cy", "flight": "Alpha"},
+    }
+
+    def test_started_ledger_increments_totals(self):
+        updates = ledger_updates(
+            [{"cadet_id": "a", "hours": 2, "date": "2024-05-01", "event": "Food drive"}, {"cadet_id": "b", "hours": 1.5}],
+            self.cadets, True, "sgt@example.com", key_generator(), now="2024-05-01T10:00:00"
+        )
+
+        self.assertEqual(updates[f"{LEDGER}/k001"], {
+            "cadet_id": "a", "date": "2024-05-01", "event": "Food drive", "hours": 2.0,
+            "entered_by": "sgt@example.com", "created_at": "2024-05-01T10:00:00"
+        })
+        self.assertEqual(updates[f"{LEDGER}/k002"]["hours"], 1.5)
+        self.assertEqual(updates["cadets/a/cs_hours"], increment(2.0))
+        self.assertEqual(updates["cadets/b/cs_hours"], increment(1.5))
+        self.assertEqual(updates[f"{TOTALS}/flights/Alpha"], increment(2.0))
+        self.assertEqual(updates[f"{TOTALS}/flights/Bravo"], increment(1.5))
+        self.assertEqual(updates[f"{TOTALS}/all"], increment(3.5))
+        self.assertNotIn("cadets/c/cs_hours", updates)
+
+    def test_first_write_migrates_legacy_hours(self):
+        updates = ledger_updates([{"cadet_id": "c", "hours": 1}], self.cadets, False, "", key_generator(), now="t")
+
+        openings = {
+            entry["cadet_id"]: entry["hours"] for path, entry in updates.items()
+            if path.startswith(f"{LEDGER}/") and entry["event"] == OPENING_BALANCE
+        }
+        self.assertEqual(openings, {"a": 10.0, "b": 2.5})
+        self.assertEqual(updates["cadets/a/cs_hours"], 10.0)
+        self.assertEqual(updates["cadets/b/cs_hours"], 2.5)
+        self.assertEqual(updates["cadets/c/cs_hours"], 1.0)
+        self.assertEqual(updates[TOTALS], {"flights": {"Alpha": 11.0, "Bravo": 2.5}, "all": 13.5, "started_at": "t"})
+
+    def test_unknown_cadet_and_empty_batch(self):
+        with self.assertRaises(ValueError):
+            ledger_updates([{"cadet_id": "zz", "hours": 1}], self.cadets, True, "", key_generator())
+        self.assertEqual(ledger_updates([], self.cadets, False, "", key_generator()), {})
+
+
+class HoursLedgerRecordTest(unittest.TestCase):
+    def setUp(self):
+        self.firebase = FakeFirebase({"cadets": {
+            "a": {"flight": "Alpha", "cs_hours": 10},
+            "b": {"flight": "Bravo", "cs_hours": 2},
+        }})
+        self.ledger = HoursLedger(self.firebase)
+
+    def entries(self):
+        return [entry for entry in self.firebase.data.get(LEDGER, {}).values()]
+
+    def test_migrates_once_even_with_a_stale_cache(self):
+        self.assertEqual(self.ledger.record([{"cadet_id": "a", "hours": 1}], {}, "x"), 3)
+
+        # A client whose cached totals never arrived, holding cadets that already include ledger hours
+        stale_cadets = self.firebase.data["cadets"]
+        self.assertEqual(self.ledger.record([{"cadet_id": "a", "hours": 2}], stale_cadets, "y"), 1)
+
+        self.assertEqual(sum(1 for entry in self.entries() if entry["event"] == OPENING_BALANCE), 2)
+        self.assertEqual(sum(entry["hours"] for entry in self.entries() if entry["cadet_id"] == "a"), 13.0)
+        self.assertEqual(self.firebase.data["cadets"]["a"]["cs_hours"], 13.0)
+        totals = self.firebase.data[TOTALS]
+        self.assertEqual((totals["all"], totals["flights"]), (15.0, {"Alpha": 13.0, "Bravo": 2.0}))
+        self.assertNotIn(CLAIM, totals)
+
+    def test_started_ledger_records_in_one_request(self):
+        self.ledger.record([{"cadet_id": "a", "hours": 1}], {}, "x")
+        calls = []
+        update_data, transaction = self.firebase.update_data, self.firebase.transaction
+        self.firebase.update_data = lambda path, updates: calls.append("update") or update_data(path, updates)
+        self.firebase.transaction = lambda path, update: calls.append("transaction") or transaction(path, update)
+
+        self.ledger.record([{"cadet_id": "b", "hours": 1}], self.firebase.data["cadets"], "x")
+
+        self.assertEqual(calls, ["update"])
+        self.assertEqual(self.firebase.data[TOTALS]["all"], 14.0)
+
+    def test_streamed_totals_skip_the_claim(self):
+        self.firebase.data[TOTALS] = {"flights": {}, "all": 0, "started_at": "t"}
+        self.firebase.transaction = None
+        self.ledger.started = True
+        self.assertEqual(self.ledger.record([{"cadet_id": "a", "hours": 1}], self.firebase.data["cadets"], "x"), 1)
+
+    def test_waits_for_another_clients_migration(self):
+        self.firebase.data[TOTALS] = {CLAIM: {"token": "other", "claimed_at": time.time()}}
+        with self.assertRaises(LedgerBusyError):
+            self.ledger.record([{"cadet_id": "a", "hours": 1}], {}, "x")
+        self.assertNotIn(LEDGER, self.firebase.data)
+
+    def test_takes_over_an_abandoned_claim(self):
+        self.firebase.data[TOTALS] = {CLAIM: {"token": "other", "claimed_at": time.time() - CLAIM_TIMEOUT - 1}}
+        self.ledger.record([{"cadet_id": "b", "hours": 1}], {}, "x")
+        self.assertEqual(self.firebase.data[TOTALS]["all"], 13.0)
+
+    def test_releases_the_claim_when_the_migration_fails(self):
+        def fail(path, updates):
+            raise OSError("offline")
+
+        self.firebase.update_data = fail
+        with self.assertRaises(OSError):
+            self.ledger.record([{"cadet_id": "a", "hours": 1}], {}, "x")
+        self.assertNotIn(TOTALS, self.firebase.data)
+
+
+class PasteTargetsTest(unittest.TestCase):
+    def test_fills_down_and_right_within_the_grid(self):
+        cells = [["1", "Drive", "extra"], ["2"], ["3"]]
+        self.assertEqual(list(paste_targets(cells, 1, 0, 3, 2)), [(1, 0, "1"), (1, 1, "Drive"), (2, 0, "2")])
+
+    def test_lines_starting_with_a_name_go_to_that_cadet(self):
+        names = {"lee ann": 2, "ray bo": 0}
+        cells = [["Lee, Ann", " 4 ", "Parade"], ["Ray  Bo", "1.5"], ["Nobody", "9"]]
+        self.assertEqual(list(paste_targets(cells, 0, 1, 3, 2, names)), [
+            (2, 0, "4"), (2, 1, "Parade"), (0, 0, "1.5"), (2, 1, "Nobody")
+        ])
+
+    def test_numbers_are_never_taken_as_names(self):
+        self.assertEqual(list(paste_targets([["2", "3"]], 0, 0, 1, 2, {"2": 5})), [(0, 0, "2"), (0, 1, "3")])
+
+
+class GridEntriesTest(unittest.TestCase):
+    def test_builds_entries_and_reports_bad_cells(self):
+        entries, errors = grid_entries(
+            [("a", "2", ""), ("b", " ", "Ignored"), ("c", "1.1", "Car wash"), ("d", "lots", ""), ("e", "30", "")],
+            "2024-05-01", "Food drive"
+        )
+        self.assertEqual(entries, [
+            {"cadet_id": "a", "date": "2024-05-01", "event": "Food drive", "hours": 2.0},
+            {"cadet_id": "c", "date": "2024-05-01", "event": "Car wash", "hours": 1.0},
+        ])
+        self.assertEqual(errors, {"d": "'lots' is not a number", "e": "A single entry cannot exceed 24 hours"})
+
+
+if __name__ == "__main__":
+    unittest.main()
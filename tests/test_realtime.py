@@ -0,0 +1,51 @@
+import unittest
+
+from realtime import StreamManager
+
+
+class FakeStream:
+    thread = None
+
+    def close(self):
+        pass
+
+
+class FlakyDatabase:
+    """Refuses the first ``failures`` stream opens, like a client that starts offline."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.opened = []
+
+    def child(self, root):
+        self.root = root
+        return self
+
+    def stream(self, handler, token=None):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("offline")
+        self.opened.append(self.root)
+        return FakeStream()
+
+
+class StreamManagerOpenTest(unittest.TestCase):
+    def test_failed_first_connect_is_retried_by_the_supervisor(self):
+        db = FlakyDatabase(failures=1)
+        streams = StreamManager(db, base_delay=0, check_interval=60)
+        self.addCleanup(streams.close)
+
+        streams.subscribe("", lambda message: None, root="cadets")
+
+        self.assertFalse(streams.stats("cadets")["connected"])
+        self.assertTrue(streams._supervisor.is_alive())
+
+        streams._check("cadets")
+
+        self.assertEqual(db.opened, ["cadets"])
+        self.assertTrue(streams.stats("cadets")["connected"])
+        self.assertEqual(streams.stats("cadets")["reconnects"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from session import TokenManager
+
+
+class SlowAuth:
+    """Hands out a new token only once ``release`` is set, recording the thread that asked."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.threads = []
+
+    def refresh_token(self, refresh_token):
+        self.threads.append(threading.current_thread())
+        self.release.wait(5)
+        return {"id_token": "new", "refresh_token": refresh_token, "expires_in": 3600}
+
+
+class CurrentTokenTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.auth = SlowAuth()
+        self.tokens = TokenManager(self.auth, store_path=os.path.join(directory.name, "session.json"))
+        self.addCleanup(self.tokens.stop)
+        self.tokens.start("old", "refresh")
+        # As if the machine slept through the refresh timer
+        self.tokens.stop()
+        self.tokens._expires_at = 0
+
+    def test_ui_thread_gets_the_current_token_while_the_timer_refreshes(self):
+        refreshed = threading.Event()
+        self.tokens.add_listener(lambda token: refreshed.set())
+
+        self.assertEqual(self.tokens.current_token(), "old")
+        self.assertEqual(self.tokens.current_token(), "old")
+
+        self.auth.release.set()
+        self.assertTrue(refreshed.wait(5))
+        self.assertEqual(self.tokens.current_token(), "new")
+        self.assertEqual(len(self.auth.threads), 1)
+        self.assertIsNot(self.auth.threads[0], threading.main_thread())
+
+    def test_worker_threads_wait_for_the_refresh(self):
+        self.auth.release.set()
+        result = []
+        worker = threading.Thread(target=lambda: result.append(self.tokens.current_token()))
+        worker.start()
+        worker.join(5)
+        self.assertEqual(result, ["new"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+THUMBNAIL_SIZES = (32, 64, 256)
+
+
+def render_thumbnails(source_path, output_dir, sizes=THUMBNAIL_SIZES):
+    """Render square JPEG thumbnails of ``source_path``; runs inside a worker process."""
+    from PIL import Image, ImageOps
+
+    outputs = {}
+    with Image.open(source_path) as img:
+        # Let the JPEG decoder downscale while decoding instead of loading full resolution.
+        img.draft("RGB", (max(sizes) * 2, max(sizes) * 2))
+        img = ImageOps.exif_transpose(img).convert("RGB")
+
+        for size in sorted(sizes, reverse=True):
+            thumb = ImageOps.fit(img, (size, size), Image.LANCZOS)
+            path = os.path.join(output_dir, f"photo_{size}.jpg")
+            thumb.save(path, "JPEG", quality=85, optimize=True)
+            outputs[size] = path
+
+    return outputs
+
+
+class ThumbnailService:
+    """Generates cadet photo thumbnails on a process pool and caches them as CTkImages."""
+
+    def __init__(self, firebase, max_workers=None, cache_size=512):
+        self.firebase = firebase
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+        self._pool = None
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def process_photo(self, cadet_id, source_path):
+        """Upload a cadet photo with its thumbnails and return the storage paths; blocks."""
+        ext = os.path.splitext(source_path)[1].lower() or ".jpg"
+        base_path = f"cadets/{cadet_id}"
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            render = self._get_pool().submit(render_thumbnails, source_path, output_dir)
+
+            # Upload the original while the worker process renders.
+            original = f"{base_path}/photo{ext}"
+            self.firebase.upload_file(source_path, original)
+
+            thumbnails = {}
+            for size, path in render.result().items():
+                storage_path = f"{base_path}/photo_{size}.jpg"
+                self.firebase.upload_file(path, storage_path)
+                thumbnails[str(size)] = storage_path
+
+        photo = {"original": original, "thumbnails": thumbnails}
+        self.firebase.update_data(f"cadets/{cadet_id}", {"photo": photo})
+
+        with self._lock:
+            for key in [key for key in self._images if key[0] in thumbnails.values()]:
+                del self._images[key]
+
+        return photo
+
+    def thumbnail_path(self, photo, size):
+        if not isinstance(photo, dict):
+            return None
+        return (photo.get("thumbnails") or {}).get(str(size))
+
+    def get_image(self, storage_path, size):
+        """Return a cached CTkImage, or None if it still has to be loaded."""
+        with self._lock:
+            image = self._images.get((storage_path, size))
+            if image is not None:
+                self._images.move_to_end((storage_path, size))
+            return image
+
+    def load_image(self, storage_path, size):
+        """Load a thumbnail into the LRU and return its CTkImage; blocks on disk or network."""
+        image = self.get_image(storage_path, size)
+        if image is not None:
+            return image
+
+        import customtkinter as ctk
+        from PIL import Image
+
+        local_path = self.firebase.get_cached_file(storage_path)
+        with Image.open(local_path) as img:
+            img.load()
+            image = ctk.CTkImage(light_image=img.copy(), size=(size, size))
+
+        with self._lock:
+            self._images[(storage_path, size)] = image
+            while len(self._images) > self.cache_size:
+                self._images.popitem(last=False)
+        return image
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None